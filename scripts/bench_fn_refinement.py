@@ -0,0 +1,103 @@
+"""
+Accuracy and cost of the fn estimators on synthetic ringdowns.
+
+Usage:
+    python scripts/bench_fn_refinement.py [--fs 48000] [--n-hits 200] [--ring-s 1.0]
+
+Each hit is a damped sinusoid (random fn, zeta and phase, light white noise),
+sampled like a settled ringdown window. Compared per hit:
+
+- welch:       coarse Welch argmax (bin width fs / nperseg)
+- welch+parab: log-power parabola through the three Welch bins at the peak
+- jacobsen:    Welch argmax, then WindowSpectrum.peak (what the analysis uses)
+- zoom:        Welch argmax, then dsp.peaks.zoom_peak over ±1 Welch bin
+- big-fft:     brute force, rFFT zero-padded to the zoom grid spacing, then
+               a log-power parabola
+- big-fft/10:  the same on a 10x finer grid
+
+Errors are |f_est - f_d| against the damped frequency (the spectral peak).
+"""
+
+import argparse
+import time
+
+import numpy as np
+from scipy import fft
+
+from wav_to_freq.analysis.modal import estimate_fn_psd
+from wav_to_freq.dsp.peaks import spectrum_peak, zoom_peak
+from wav_to_freq.dsp.spectral import welch_nperseg, welch_psd
+
+_ZOOM_POINTS = 65
+
+
+def _welch_parabola(x: np.ndarray, fs: float, fmin_hz: float, fmax_hz: float) -> float:
+    f, pxx = welch_psd(x, fs)
+    m = np.flatnonzero((f >= fmin_hz) & (f <= fmax_hz))
+    k = int(m[np.argmax(pxx[m])])
+    return spectrum_peak(f, pxx, k)
+
+
+def _zoom(x: np.ndarray, fs: float, fmin_hz: float, fmax_hz: float) -> float:
+    f0 = estimate_fn_psd(x, fs, fmin_hz=fmin_hz, fmax_hz=fmax_hz, refine=False)
+    bin_hz = fs / welch_nperseg(x.size)
+    return zoom_peak(x, fs, f0, half_width_hz=bin_hz, n_points=_ZOOM_POINTS)
+
+
+def _big_fft(x: np.ndarray, fs: float, fmin_hz: float, fmax_hz: float, *, grid_hz: float) -> float:
+    nfft = fft.next_fast_len(max(x.size, int(np.ceil(fs / grid_hz))), real=True)
+    p = np.abs(fft.rfft(x - x.mean(), nfft)) ** 2
+    f = fft.rfftfreq(nfft, 1.0 / fs)
+    m = np.flatnonzero((f >= fmin_hz) & (f <= fmax_hz))
+    k = int(m[np.argmax(p[m])])
+    return spectrum_peak(f, p, k)
+
+
+def _hits(fs: float, n_hits: int, ring_s: float, rng: np.random.Generator) -> list[tuple[np.ndarray, float]]:
+    t = np.arange(int(ring_s * fs)) / fs
+    out = []
+    for _ in range(n_hits):
+        fn = rng.uniform(5.0, 400.0)
+        zeta = rng.uniform(0.002, 0.03)
+        fd = fn * np.sqrt(1.0 - zeta * zeta)
+        x = np.exp(-zeta * 2.0 * np.pi * fn * t) * np.sin(2.0 * np.pi * fd * t + rng.uniform(0.0, 2.0 * np.pi))
+        out.append(((x + rng.normal(0.0, 1e-3, t.size)).astype(np.float32), fd))
+    return out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--fs", type=float, default=48000.0)
+    ap.add_argument("--n-hits", type=int, default=200)
+    ap.add_argument("--ring-s", type=float, default=1.0)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    fs = float(args.fs)
+    fmin_hz, fmax_hz = 1.0, 1000.0
+    hits = _hits(fs, args.n_hits, args.ring_s, np.random.default_rng(args.seed))
+
+    nperseg = welch_nperseg(hits[0][0].size)
+    grid_hz = 2.0 * (fs / nperseg) / (_ZOOM_POINTS - 1)
+
+    estimators = {
+        "welch": lambda x: estimate_fn_psd(x, fs, fmin_hz=fmin_hz, fmax_hz=fmax_hz, refine=False),
+        "welch+parab": lambda x: _welch_parabola(x, fs, fmin_hz, fmax_hz),
+        "jacobsen": lambda x: estimate_fn_psd(x, fs, fmin_hz=fmin_hz, fmax_hz=fmax_hz),
+        "zoom": lambda x: _zoom(x, fs, fmin_hz, fmax_hz),
+        "big-fft": lambda x: _big_fft(x, fs, fmin_hz, fmax_hz, grid_hz=grid_hz),
+        "big-fft/10": lambda x: _big_fft(x, fs, fmin_hz, fmax_hz, grid_hz=grid_hz / 10.0),
+    }
+
+    print(f"fs={fs:g} Hz, {len(hits)} hits of {args.ring_s:g} s, Welch bin {fs / nperseg:.3f} Hz, zoom grid {grid_hz:.4f} Hz")
+    print(f"{'estimator':<12} {'median err (Hz)':>16} {'p95 err (Hz)':>13} {'ms / hit':>9}")
+    for name, est in estimators.items():
+        t0 = time.perf_counter()
+        f_est = np.array([est(x) for x, _ in hits])
+        dt = time.perf_counter() - t0
+        err = np.abs(f_est - np.array([fd for _, fd in hits]))
+        print(f"{name:<12} {np.median(err):>16.4f} {np.quantile(err, 0.95):>13.4f} {1e3 * dt / len(hits):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
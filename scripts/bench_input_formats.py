@@ -0,0 +1,73 @@
+"""
+End-to-end timing of WAV vs FLAC input from a cold page cache.
+
+Usage:
+    python scripts/bench_input_formats.py path/to/recording.wav [--repeat 3]
+
+The WAV is transcoded to FLAC in a temp dir, then each file is evicted from the
+OS page cache (posix_fadvise DONTNEED, Linux) before every timed run of
+load -> detect -> extract -> analyze. Dropping the cache needs no privileges
+for files we own; on platforms without posix_fadvise the runs are warm.
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import soundfile as sf
+
+from wav_to_freq.analysis.modal import analyze_all_hits
+from wav_to_freq.io.hit_detection import prepare_hits
+
+
+def _evict_from_page_cache(path: Path) -> bool:
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+    return True
+
+
+def _run_once(path: Path) -> tuple[float, float, int]:
+    cold = _evict_from_page_cache(path)
+    t0 = time.perf_counter()
+    stereo, windows, _ = prepare_hits(path)
+    t1 = time.perf_counter()
+    analyze_all_hits(windows, stereo.fs)
+    t2 = time.perf_counter()
+    return t1 - t0, t2 - t0, int(cold)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("wav", type=Path)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        flac = Path(tmp) / (args.wav.stem + ".flac")
+        data, fs = sf.read(str(args.wav), always_2d=True)
+        subtype = sf.info(str(args.wav)).subtype
+        if subtype not in ("PCM_16", "PCM_24"):
+            subtype = "PCM_24"
+        sf.write(str(flac), data, fs, format="FLAC", subtype=subtype)
+
+        print(f"{'format':<6} {'size (MB)':>10} {'prepare (s)':>12} {'end-to-end (s)':>15} cold")
+        for path in (args.wav, flac):
+            runs = [_run_once(path) for _ in range(max(1, args.repeat))]
+            size_mb = path.stat().st_size / 1e6
+            prep = statistics.median(r[0] for r in runs)
+            total = statistics.median(r[1] for r in runs)
+            cold = "yes" if all(r[2] for r in runs) else "no"
+            print(f"{path.suffix[1:]:<6} {size_mb:>10.2f} {prep:>12.3f} {total:>15.3f} {cold}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Accuracy and cost of the RFP fit against the envelope method.
+
+Usage:
+    python scripts/bench_rfp.py [--fs 8000] [--n-hits 100] [--noise 0.001]
+
+Each hit is a half-sine hammer pulse driving a sum of SDOF accelerances
+(bilinear-discretized, light white noise on the response). Two structures:
+
+- single: one mode (18 Hz, zeta 0.01), fitted over [5, 40] Hz
+- close:  three modes (18 / 31 / 47 Hz, zeta 0.01 / 0.02 / 0.005), over
+          [5, 60] Hz
+
+Compared per hit, on the same windows:
+
+- envelope: analyze_multimode_hits (DFT peaks -> band-pass + Hilbert
+            envelope -> log fit), accepted fits only
+- rfp:      analyze_rfp_hits (RFP fits of each hit's FRF around its
+            peaks, all hits solved together)
+
+Errors are against the analog fn / zeta; the bilinear transform itself
+shifts fn by up to ~0.1% at the highest mode.
+"""
+
+import argparse
+import time
+
+import numpy as np
+from scipy import signal
+
+from wav_to_freq.analysis.modal import analyze_multimode_hits, analyze_rfp_hits
+from wav_to_freq.domain.types import HitModalResult, HitWindow
+
+_CASES = {
+    "single": (((18.0, 0.010, 1.0),), (5.0, 40.0)),
+    "close": (((18.0, 0.010, 1.0), (31.0, 0.020, 0.6), (47.0, 0.005, 0.3)), (5.0, 60.0)),
+}
+
+
+def _hits(
+    fs: float,
+    modes: tuple[tuple[float, float, float], ...],
+    n_hits: int,
+    noise: float,
+    rng: np.random.Generator,
+    *,
+    pre_s: float = 0.05,
+    post_s: float = 1.50,
+) -> list[HitWindow]:
+    n = int(round((pre_s + post_s) * fs))
+    k_hit = int(round(pre_s * fs))
+    d = int(0.002 * fs)
+    filters = []
+    for fn, zeta, gain in modes:
+        w = 2.0 * np.pi * fn
+        filters.append((gain,) + signal.bilinear([1.0, 0.0, 0.0], [1.0, 2.0 * zeta * w, w * w], fs=fs))
+
+    out = []
+    for i in range(n_hits):
+        force = np.zeros(n)
+        force[k_hit - d // 2 : k_hit - d // 2 + d] = rng.uniform(0.5, 2.0) * np.sin(np.pi * np.arange(d) / d)
+        accel = sum(g * signal.lfilter(b, a, force) for g, b, a in filters) + rng.normal(0.0, noise, n)
+        t0 = 3.0 * i
+        out.append(
+            HitWindow(
+                hit_id=i + 1,
+                hit_index=int(t0 * fs) + k_hit,
+                t_hit=t0 + pre_s,
+                t_start=t0,
+                t_end=t0 + pre_s + post_s,
+                hammer=(force + 0.01).astype(np.float32),
+                accel=accel.astype(np.float32),
+            )
+        )
+    return out
+
+
+def _errors(
+    results: dict[tuple[int, int], HitModalResult], modes: tuple[tuple[float, float, float], ...], n_hits: int
+) -> list[tuple[float, float, float]]:
+    """(found fraction, median |fn err| Hz, median |zeta err| / zeta) per true mode; nearest accepted fn wins."""
+    out = []
+    for fn, zeta, _ in modes:
+        fn_err, zeta_err = [], []
+        for hit_id in range(1, n_hits + 1):
+            cands = [
+                r
+                for (h, _), r in results.items()
+                if h == hit_id and r.reject_reason is None and abs(r.fn_hz - fn) < 0.1 * fn
+            ]
+            if cands:
+                r = min(cands, key=lambda r: abs(r.fn_hz - fn))
+                fn_err.append(abs(r.fn_hz - fn))
+                zeta_err.append(abs(r.zeta - zeta) / zeta)
+        if fn_err:
+            out.append((len(fn_err) / n_hits, float(np.median(fn_err)), float(np.median(zeta_err))))
+        else:
+            out.append((0.0, float("nan"), float("nan")))
+    return out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--fs", type=float, default=8000.0)
+    ap.add_argument("--n-hits", type=int, default=100)
+    ap.add_argument("--noise", type=float, default=1e-3)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    fs = float(args.fs)
+    print(f"fs={fs:g} Hz, {args.n_hits} hits, noise {args.noise:g}")
+    print(f"{'case':<7} {'method':<9} {'mode (Hz)':>9} {'found':>6} {'|fn err| Hz':>12} {'|dzeta|/zeta':>13} {'ms / hit':>9}")
+    for case, (modes, (fmin_hz, fmax_hz)) in _CASES.items():
+        windows = _hits(fs, modes, args.n_hits, args.noise, np.random.default_rng(args.seed))
+        methods = {
+            "envelope": lambda: analyze_multimode_hits(
+                windows, fs, n_modes=len(modes), fmin_hz=fmin_hz, fmax_hz=fmax_hz
+            ),
+            "rfp": lambda: analyze_rfp_hits(windows, fs, n_modes=len(modes), fmin_hz=fmin_hz, fmax_hz=fmax_hz),
+        }
+        for name, run in methods.items():
+            t0 = time.perf_counter()
+            results = run()
+            dt = time.perf_counter() - t0
+            for (fn, _, _), (found, fn_err, zeta_err) in zip(modes, _errors(results, modes, args.n_hits)):
+                print(
+                    f"{case:<7} {name:<9} {fn:>9g} {found:>6.0%} {fn_err:>12.4f} {zeta_err:>13.2%}"
+                    f" {1e3 * dt / len(windows):>9.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
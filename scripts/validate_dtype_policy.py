@@ -0,0 +1,159 @@
+"""
+Validate the float32 work-dtype policy against float64.
+
+Runs the per-hit modal analysis on a grid of synthetic single-mode ringdowns
+(16-bit quantized, with noise), and optionally on real recordings, once with
+each work dtype. Reports the worst fn / zeta / R² differences and exits
+non-zero if any exceeds the stated tolerances.
+
+Synthetic hits only count when the float64 reference itself recovers the true
+zeta within REFERENCE_ZETA_TOL (otherwise there is nothing to preserve).
+Recordings have no ground truth: hits accepted by both runs are compared and
+accept/reject disagreements are reported for information.
+
+Usage:
+    python scripts/validate_dtype_policy.py [recording.wav ...]
+"""
+
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from wav_to_freq.analysis.modal import analyze_all_hits
+from wav_to_freq.domain.results import ResultTable
+from wav_to_freq.domain.types import HitWindow
+from wav_to_freq.dsp.stats import get_work_dtype, set_work_dtype
+from wav_to_freq.io.hit_detection import prepare_hits
+
+# Tolerances between float32 and float64 runs (accepted hits only).
+FN_REL_TOL = 1e-4
+ZETA_REL_TOL = 1e-2
+R2_ABS_TOL = 1e-3
+
+REFERENCE_ZETA_TOL = 0.5
+
+
+@dataclass(frozen=True)
+class Case:
+    fs: float
+    fn_hz: float
+    zeta: float
+
+
+def _synthetic_window(case: Case, *, seed: int, dur_s: float = 3.0) -> HitWindow:
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(dur_s * case.fs)) / case.fs
+    wd = 2.0 * np.pi * case.fn_hz * np.sqrt(1.0 - case.zeta**2)
+    x = np.exp(-case.zeta * 2.0 * np.pi * case.fn_hz * t) * np.sin(wd * t)
+    x += 1e-3 * rng.standard_normal(t.size)
+    x = np.round(0.9 * x / np.max(np.abs(x)) * 32767.0) / 32768.0  # 16-bit PCM
+    return HitWindow(
+        hit_id=seed,
+        hit_index=0,
+        t_hit=0.0,
+        t_start=0.0,
+        t_end=float(t[-1]),
+        hammer=np.zeros_like(x),
+        accel=x,
+    )
+
+
+def _analyze(windows: list[HitWindow], fs: float, fmax_hz: float) -> ResultTable:
+    return analyze_all_hits(
+        windows,
+        fs,
+        settle_s=0.01,
+        ring_s=2.5,
+        fmin_hz=1.0,
+        fmax_hz=fmax_hz,
+        transient_s=0.05,
+        established_min_s=0.30,
+        fit_max_s=1.5,
+    )
+
+
+def _both_dtypes(fn, *args) -> tuple[ResultTable, ResultTable]:
+    previous = get_work_dtype()
+    try:
+        set_work_dtype("float32")
+        r32 = fn(*args)
+        set_work_dtype("float64")
+        r64 = fn(*args)
+    finally:
+        set_work_dtype(previous)
+    return r32, r64
+
+
+def _rel(a: float, b: float) -> float:
+    return abs(a - b) / max(abs(b), 1e-30)
+
+
+def _compare(
+    label: str,
+    r32: ResultTable,
+    r64: ResultTable,
+    *,
+    true_zeta: float | None = None,
+) -> bool:
+    pairs = list(zip(r32, r64))
+    if true_zeta is not None:
+        pairs = [
+            (a, b)
+            for a, b in pairs
+            if not b.reject_reason and _rel(b.zeta, true_zeta) <= REFERENCE_ZETA_TOL
+        ]
+    both = [(a, b) for a, b in pairs if not a.reject_reason and not b.reject_reason]
+    status_mismatch = sum(
+        (a.reject_reason is None) != (b.reject_reason is None) for a, b in pairs
+    )
+    status_mismatch_counts = true_zeta is not None
+    if not both:
+        print(f"{label:<34} no comparable hit (status mismatches: {status_mismatch})")
+        return not (status_mismatch_counts and status_mismatch)
+
+    d_fn = max(_rel(a.fn_hz, b.fn_hz) for a, b in both)
+    d_zeta = max(_rel(a.zeta, b.zeta) for a, b in both)
+    d_r2 = max(abs(a.env_fit_r2 - b.env_fit_r2) for a, b in both)
+    ok = d_fn <= FN_REL_TOL and d_zeta <= ZETA_REL_TOL and d_r2 <= R2_ABS_TOL
+    if status_mismatch_counts:
+        ok = ok and status_mismatch == 0
+    print(
+        f"{label:<34} n={len(both):<3} dfn/fn={d_fn:.2e} dzeta/zeta={d_zeta:.2e} "
+        f"dR2={d_r2:.2e} status_mismatch={status_mismatch} {'OK' if ok else 'FAIL'}"
+    )
+    return ok
+
+
+def main() -> None:
+    print(
+        f"tolerances: dfn/fn <= {FN_REL_TOL:g}, dzeta/zeta <= {ZETA_REL_TOL:g}, dR2 <= {R2_ABS_TOL:g}"
+    )
+    ok = True
+
+    for fs in (8000.0, 48000.0):
+        for fn_hz in (5.0, 20.0, 80.0, 300.0):
+            for zeta in (0.005, 0.02, 0.05):
+                case = Case(fs=fs, fn_hz=fn_hz, zeta=zeta)
+                windows = [_synthetic_window(case, seed=k) for k in range(1, 4)]
+                r32, r64 = _both_dtypes(_analyze, windows, fs, 2.0 * fn_hz)
+                ok &= _compare(
+                    f"fs={fs:g} fn={fn_hz:g} zeta={zeta:g}", r32, r64, true_zeta=zeta
+                )
+
+    for arg in sys.argv[1:]:
+        path = Path(arg)
+
+        def _run(p: Path = path) -> ResultTable:
+            stereo, windows, _ = prepare_hits(p)
+            return analyze_all_hits(windows, stereo.fs)
+
+        r32, r64 = _both_dtypes(_run)
+        ok &= _compare(path.name, r32, r64)
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+# src/wav_to_freq/analysis/bootstrap.py
+"""
+Bootstrap confidence intervals for the modal results.
+
+Per hit (ζ): residual bootstrap of the log-envelope fit of the accepted fit
+window, for hits whose ζ is that fit (not the fast tier's log decrement,
+see analysis.fast). Envelope samples closer than ~1/(0.8 fn) are strongly correlated
+(the band-pass around fn is ~0.8 fn wide), so residuals are resampled on the
+fit window decimated to one sample per _DECIMATE_PERIODS periods; resampling
+every sample would give intervals far too narrow. The replicate spread is
+centered on the reported ζ.
+
+Per session (fn, ζ): the accepted hits are resampled with replacement and
+the mean is recomputed (the summary reports the mean).
+
+All replicates of one fit are solved at once: with X the (n, 2) design
+matrix, the (n_boot, n) matrix of resampled log-envelopes times pinv(X).T
+gives every replicate's (c, m) in one matrix product.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Collection, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from wav_to_freq.analysis.modal import HitEnvelope, fit_log_envelope, hit_envelope
+from wav_to_freq.domain.results import ResultTable
+from wav_to_freq.domain.types import HitModalResult, HitWindow
+from wav_to_freq.dsp.stats import as_f64
+
+
+# 1.5 periods: ~90% coverage of nominal 95% intervals on synthetic ringdowns
+# (one period: ~80%)
+_DECIMATE_PERIODS = 1.5
+
+
+@dataclass(frozen=True)
+class Interval:
+    estimate: float
+    lo: float
+    hi: float
+
+
+@dataclass(frozen=True)
+class HitConfidence:
+    hit_id: int
+    zeta: Interval
+    n_points: int  # decimated envelope samples resampled
+
+
+@dataclass(frozen=True)
+class SessionConfidence:
+    n_hits: int
+    fn_hz: Interval
+    zeta: Interval
+
+
+@dataclass(frozen=True)
+class ModalConfidence:
+    level: float
+    n_boot: int
+    hits: dict[int, HitConfidence]  # accepted envelope-fit hits only, by hit_id
+    session: SessionConfidence | None  # None with fewer than 2 accepted hits
+    n_other_tier: int = 0  # accepted hits without a per-hit interval: ζ not from the envelope fit
+
+
+def bootstrap_log_fit(
+    t: NDArray[np.float64],
+    e: NDArray[np.floating],
+    *,
+    n_boot: int,
+    rng: np.random.Generator,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Residual bootstrap of fit_log_envelope: (c, m) of n_boot replicates,
+    each an array of shape (n_boot,). NaN when the fit itself is undefined.
+    """
+    t = as_f64(t)
+    c, m, _ = fit_log_envelope(t, e)
+    if not (np.isfinite(c) and np.isfinite(m)):
+        nan = np.full(int(n_boot), np.nan)
+        return nan, nan.copy()
+
+    ln = np.log(np.clip(as_f64(e), np.finfo(float).eps, None))
+    ln_hat = c + m * t
+    resid = ln - ln_hat
+
+    X = np.column_stack((np.ones_like(t), t))
+    idx = rng.integers(0, t.size, size=(int(n_boot), t.size))
+    beta = (ln_hat + resid[idx]) @ np.linalg.pinv(X).T  # (n_boot, 2)
+    return beta[:, 0], beta[:, 1]
+
+
+def hit_confidence(
+    env: HitEnvelope,
+    result: HitModalResult,
+    *,
+    n_boot: int = 1000,
+    level: float = 0.95,
+    rng: np.random.Generator | None = None,
+) -> HitConfidence | None:
+    """ζ interval of one accepted hit (None when the hit has no usable fit window)."""
+    if result.reject_reason is not None or result.fit_t0_s is None or result.fit_t1_s is None:
+        return None
+    rng = rng if rng is not None else np.random.default_rng(0)
+
+    fs = env.fs
+    i0 = int(round((result.fit_t0_s - env.t_start) * fs)) - env.start
+    i1 = int(round((result.fit_t1_s - env.t_start) * fs)) - env.start
+    i0, i1 = max(0, i0), min(env.env.size, i1)
+
+    stride = max(1, int(_DECIMATE_PERIODS * fs / env.fn_hz))
+    k = np.arange(i0, i1, stride)
+    if k.size < 8:
+        return None
+
+    t = (k - float(i0)) / fs
+    _, m_hat, _ = fit_log_envelope(t, env.env[k])
+    _, m = bootstrap_log_fit(t, env.env[k], n_boot=n_boot, rng=rng)
+
+    scale = -1.0 / (2.0 * np.pi * env.fn_hz + 1e-12)
+    zeta = result.zeta + (m - m_hat) * scale
+    lo, hi = _percentiles(zeta, level)
+    return HitConfidence(
+        hit_id=result.hit_id,
+        zeta=Interval(estimate=float(result.zeta), lo=lo, hi=hi),
+        n_points=int(k.size),
+    )
+
+
+def session_confidence(
+    results: ResultTable | Sequence[HitModalResult],
+    *,
+    n_boot: int = 1000,
+    level: float = 0.95,
+    rng: np.random.Generator | None = None,
+) -> SessionConfidence | None:
+    """Intervals of the mean fn and ζ over accepted hits, resampling hits."""
+    table = ResultTable.from_results(results)
+    mask = table.accepted_mask
+    n = int(mask.sum())
+    if n < 2:
+        return None
+    rng = rng if rng is not None else np.random.default_rng(0)
+
+    idx = rng.integers(0, n, size=(int(n_boot), n))
+    out: dict[str, Interval] = {}
+    for name in ("fn_hz", "zeta"):
+        values = table.column(name)[mask]
+        lo, hi = _percentiles(values[idx].mean(axis=1), level)
+        out[name] = Interval(estimate=float(values.mean()), lo=lo, hi=hi)
+    return SessionConfidence(n_hits=n, **out)
+
+
+def bootstrap_confidence(
+    windows: Sequence[HitWindow],
+    fs: float,
+    results: ResultTable | Sequence[HitModalResult],
+    *,
+    settle_s: float,
+    ring_s: float,
+    fmin_hz: float,
+    fmax_hz: float,
+    n_boot: int = 1000,
+    level: float = 0.95,
+    seed: int = 0,
+    envelope_hits: Collection[int] | None = None,
+) -> ModalConfidence:
+    """
+    Per-hit and per-session intervals for analyze_all_hits results.
+
+    The envelope knobs must be the ones used for the analysis (the accepted
+    hits' envelopes are recomputed). Seeded, so reports are reproducible.
+    For analyze_hits_tiered results, envelope_hits lists the hit_ids whose
+    result is the envelope fit; the others get no per-hit interval (the
+    session interval still uses every accepted hit). None: all of them.
+    """
+    rng = np.random.default_rng(seed)
+    table = ResultTable.from_results(results)
+
+    hits: dict[int, HitConfidence] = {}
+    n_other_tier = 0
+    for w, r in zip(windows, table):
+        if r.reject_reason is not None:
+            continue
+        if envelope_hits is not None and r.hit_id not in envelope_hits:
+            n_other_tier += 1
+            continue
+        env = hit_envelope(w, fs, settle_s=settle_s, ring_s=ring_s, fmin_hz=fmin_hz, fmax_hz=fmax_hz)
+        ci = hit_confidence(env, r, n_boot=n_boot, level=level, rng=rng)
+        if ci is not None:
+            hits[ci.hit_id] = ci
+
+    return ModalConfidence(
+        level=float(level),
+        n_boot=int(n_boot),
+        hits=hits,
+        session=session_confidence(table, n_boot=n_boot, level=level, rng=rng),
+        n_other_tier=n_other_tier,
+    )
+
+
+def _percentiles(x: NDArray[np.float64], level: float) -> tuple[float, float]:
+    x = x[np.isfinite(x)]
+    if x.size == 0:
+        return float("nan"), float("nan")
+    alpha = 0.5 * (1.0 - float(level))
+    lo, hi = np.quantile(x, (alpha, 1.0 - alpha))
+    return float(lo), float(hi)
@@ -0,0 +1,289 @@
+# src/wav_to_freq/analysis/era.py
+"""
+Eigensystem Realization Algorithm (ERA) on free-decay segments.
+
+The ringdown segments of one or more hits (the accel[start:end] that
+hit_envelope analyzes) are treated as free responses of one system from
+different initial conditions:
+
+  segments -> anti-alias low-pass + decimate to ~_OVERSAMPLE x fmax
+    -> one Hankel block per hit, H = [H_1 | H_2 | ...] (n_rows x Σ columns)
+    -> leading left singular vectors U, values S (randomized SVD)
+    -> for every model order n: O = U_n S_n^1/2, A = pinv(O[:-1]) O[1:]
+       -> eigenvalues -> poles -> fn, ζ
+
+Only U and S are needed. Up to _DENSE_ROWS rows they come from the
+eigen-decomposition of H Hᵀ (one BLAS product per hit). Above that, from a
+randomized range finder that never forms H: H Ω and Hᵀ Q are correlations
+of each segment with the columns of Ω / Q, done with one rFFT of each
+segment, so the cost grows like Σ n_i log n_i rather than n_rows² · Σ n_i.
+Each segment is scaled to unit RMS so that every hit weighs the same.
+
+Stabilization: a pole is stable at order n when order n - 2 has a pole
+within _STABLE_DF in frequency and _STABLE_DZETA in damping (relative).
+Stable poles are grouped by frequency; the groups stable at the most orders
+(and at least _MIN_STABLE_FRACTION of them) are the modes, their fn / ζ the
+medians of the group.
+"""
+
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy import fft
+
+from wav_to_freq.analysis.modal import ringdown_bounds
+from wav_to_freq.domain.types import HitWindow
+from wav_to_freq.dsp.filters import decimate
+from wav_to_freq.dsp.spectral import get_fft_workers
+from wav_to_freq.dsp.stats import as_f64
+
+# decimated rate, in multiples of fmax_hz
+_OVERSAMPLE = 8.0
+# H Hᵀ is cheaper than the randomized SVD up to about this many Hankel rows
+_DENSE_ROWS = 384
+# extra random vectors of the range finder, and its power iterations
+_OVERSAMPLE_SVD = 10
+_POWER_ITERS = 1
+# stability criteria between consecutive model orders (relative)
+_STABLE_DF = 0.01
+_STABLE_DZETA = 0.05
+# poles more damped than this are treated as noise
+_ZETA_MAX = 0.5
+# a mode must be stable at this fraction of the orders (noise poles rarely are)
+_MIN_STABLE_FRACTION = 0.5
+
+
+@dataclass(frozen=True)
+class StabilizationDiagram:
+    """One row per physical pole (in band, 0 < ζ < _ZETA_MAX) per model order."""
+
+    order: NDArray[np.int64]
+    fn_hz: NDArray[np.float64]
+    zeta: NDArray[np.float64]
+    stable: NDArray[np.bool_]  # matched at the previous order
+
+    def write_csv(self, path: str | Path) -> Path:
+        path = Path(path)
+        with path.open("w", newline="", encoding="utf-8") as fh:
+            w = csv.writer(fh)
+            w.writerow(["order", "fn_hz", "zeta", "stable"])
+            for o, f, z, s in zip(self.order, self.fn_hz, self.zeta, self.stable):
+                w.writerow([int(o), repr(float(f)), repr(float(z)), int(s)])
+        return path
+
+
+@dataclass(frozen=True)
+class EraResult:
+    fs: float  # rate the model was identified at (after decimation)
+    decimate: int
+    n_rows: int  # Hankel block rows
+    n_segments: int
+    singular_values: NDArray[np.float64]  # leading ones, descending
+    diagram: StabilizationDiagram
+    fn_hz: NDArray[np.float64]  # modes, most stable first
+    zeta: NDArray[np.float64]
+    n_stable: NDArray[np.int64]  # orders at which each mode was stable
+
+    def write_modes_csv(self, path: str | Path) -> Path:
+        path = Path(path)
+        with path.open("w", newline="", encoding="utf-8") as fh:
+            w = csv.writer(fh)
+            w.writerow(["mode", "fn_hz", "zeta", "n_stable"])
+            for i, (f, z, k) in enumerate(zip(self.fn_hz, self.zeta, self.n_stable), start=1):
+                w.writerow([i, repr(float(f)), repr(float(z)), int(k)])
+        return path
+
+
+def identify_era(
+    segments: Sequence[NDArray[np.floating]],
+    fs: float,
+    *,
+    fmin_hz: float,
+    fmax_hz: float,
+    max_order: int = 40,
+    n_modes: int = 3,
+    n_rows: int | None = None,
+    seed: int = 0,
+) -> EraResult:
+    """
+    Identify modes in [fmin_hz, fmax_hz] from free-decay segments (any lengths).
+
+    Model orders 2, 4, ..., max_order are identified from one SVD. n_rows
+    (Hankel block rows, at the decimated rate) defaults to the larger of
+    2 max_order and one period of fmin_hz, capped at half the shortest
+    segment. seed fixes the randomized SVD.
+    """
+    fs = float(fs)
+    max_order = max(2, int(max_order) // 2 * 2)
+    q = max(1, int(fs // (_OVERSAMPLE * float(fmax_hz))))
+    fs_d = fs / q
+
+    xs = [decimate(as_f64(x), fs, q) for x in segments]
+    xs = [x / s for x in xs if x.size and (s := float(np.std(x))) > 0]
+    n_min = min((x.size for x in xs), default=0)
+    if n_rows is None:
+        n_rows = max(2 * max_order, int(np.ceil(fs_d / max(float(fmin_hz), 1e-9))))
+    n_rows = min(int(n_rows), n_min // 2)
+    if n_rows < max_order + 2:
+        return _empty(fs_d, q, len(xs), n_rows)
+
+    u, s = _hankel_svd(xs, n_rows, rank=max_order, rng=np.random.default_rng(seed))
+
+    rows: list[tuple[int, float, float, bool]] = []
+    prev = np.empty((0, 2))
+    for n in range(2, max_order + 1, 2):
+        obs = u[:, :n] * np.sqrt(s[:n])
+        a = np.linalg.lstsq(obs[:-1], obs[1:], rcond=None)[0]
+        lam = np.linalg.eigvals(a).astype(np.complex128)
+        lam = lam[(lam.imag > 0) & (lam != 0)]
+        sp = np.log(lam) * fs_d
+        wn = np.abs(sp)
+        fn = wn / (2.0 * np.pi)
+        zeta = -sp.real / wn
+        keep = (fn >= float(fmin_hz)) & (fn <= float(fmax_hz)) & (zeta > 0) & (zeta < _ZETA_MAX)
+        cur = np.column_stack([fn[keep], zeta[keep]])
+        for f, z in cur:
+            stable = bool(
+                prev.size
+                and np.any(
+                    (np.abs(prev[:, 0] - f) <= _STABLE_DF * f) & (np.abs(prev[:, 1] - z) <= _STABLE_DZETA * z)
+                )
+            )
+            rows.append((n, float(f), float(z), stable))
+        prev = cur
+
+    diagram = StabilizationDiagram(
+        order=np.array([r[0] for r in rows], dtype=np.int64),
+        fn_hz=np.array([r[1] for r in rows]),
+        zeta=np.array([r[2] for r in rows]),
+        stable=np.array([r[3] for r in rows], dtype=bool),
+    )
+    fn_modes, zeta_modes, counts = _stable_modes(
+        diagram, n_modes=n_modes, min_count=int(np.ceil(_MIN_STABLE_FRACTION * (max_order // 2 - 1)))
+    )
+    return EraResult(
+        fs=fs_d,
+        decimate=q,
+        n_rows=n_rows,
+        n_segments=len(xs),
+        singular_values=s,
+        diagram=diagram,
+        fn_hz=fn_modes,
+        zeta=zeta_modes,
+        n_stable=counts,
+    )
+
+
+def identify_era_hits(
+    windows: Sequence[HitWindow],
+    fs: float,
+    *,
+    settle_s: float = 0.010,
+    ring_s: float = 1.0,
+    fmin_hz: float = 0.5,
+    fmax_hz: float = 50.0,
+    max_order: int = 40,
+    n_modes: int = 3,
+) -> EraResult:
+    """identify_era on the ringdown segments of all hits (as hit_envelope cuts them; too short ones skipped)."""
+    fs = float(fs)
+    segments = []
+    for w in windows:
+        start, end = ringdown_bounds(len(w.accel), fs, settle_s=settle_s, ring_s=ring_s)
+        if end - start >= int(0.1 * fs):
+            segments.append(w.accel[start:end])
+    return identify_era(segments, fs, fmin_hz=fmin_hz, fmax_hz=fmax_hz, max_order=max_order, n_modes=n_modes)
+
+
+def _hankel_svd(
+    xs: list[NDArray[np.float64]], n_rows: int, *, rank: int, rng: np.random.Generator
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Leading `rank` left singular vectors / values of H = [H_1 | H_2 | ...], H_i[a, c] = x_i[a + c]."""
+    n_cols = [x.size - n_rows + 1 for x in xs]
+    width = rank + _OVERSAMPLE_SVD
+
+    if n_rows <= max(_DENSE_ROWS, width):
+        gram = np.zeros((n_rows, n_rows))
+        for x in xs:
+            h = np.lib.stride_tricks.sliding_window_view(x, x.size - n_rows + 1)
+            gram += h @ h.T
+        evals, evecs = np.linalg.eigh(gram)
+        order = np.argsort(evals)[::-1][:rank]
+        return evecs[:, order], np.sqrt(np.clip(evals[order], 0.0, None))
+
+    workers = get_fft_workers()
+    lens = [fft.next_fast_len(x.size, real=True) for x in xs]
+    specs = [fft.rfft(x, n, workers=workers) for x, n in zip(xs, lens)]
+
+    def h_times(v: list[NDArray[np.float64]]) -> NDArray[np.float64]:
+        # (H v)[a] = Σ_i Σ_c x_i[a + c] v_i[c]
+        out = np.zeros((n_rows, width))
+        for X, n, vi in zip(specs, lens, v):
+            out += fft.irfft(X[:, None] * np.conj(fft.rfft(vi, n, axis=0, workers=workers)), n, axis=0, workers=workers)[:n_rows]
+        return out
+
+    def ht_times(y: NDArray[np.float64]) -> list[NDArray[np.float64]]:
+        # (H_iᵀ y)[c] = Σ_a x_i[c + a] y[a]
+        out = []
+        for X, n, m in zip(specs, lens, n_cols):
+            out.append(fft.irfft(X[:, None] * np.conj(fft.rfft(y, n, axis=0, workers=workers)), n, axis=0, workers=workers)[:m])
+        return out
+
+    qy, _ = np.linalg.qr(h_times([rng.standard_normal((m, width)) for m in n_cols]))
+    for _ in range(_POWER_ITERS):
+        qy, _ = np.linalg.qr(h_times(ht_times(qy)))
+
+    # B = Qᵀ H, whose left singular vectors rotate Q into those of H
+    bbt = sum(z.T @ z for z in ht_times(qy))  # B Bᵀ, (width, width)
+    evals, evecs = np.linalg.eigh(bbt)
+    order = np.argsort(evals)[::-1][:rank]
+    return qy @ evecs[:, order], np.sqrt(np.clip(evals[order], 0.0, None))
+
+
+def _stable_modes(
+    diagram: StabilizationDiagram, *, n_modes: int, min_count: int
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.int64]]:
+    """Group stable poles whose frequencies are within _STABLE_DF; the groups stable at the most orders win."""
+    f = diagram.fn_hz[diagram.stable]
+    z = diagram.zeta[diagram.stable]
+    o = diagram.order[diagram.stable]
+    if f.size == 0:
+        return np.empty(0), np.empty(0), np.empty(0, dtype=np.int64)
+
+    idx = np.argsort(f)
+    f, z, o = f[idx], z[idx], o[idx]
+    breaks = np.flatnonzero(np.diff(f) > _STABLE_DF * f[1:]) + 1
+    groups = np.split(np.arange(f.size), breaks)
+    # count each order once (a group may hold two close poles of one order)
+    counts = np.array([np.unique(o[g]).size for g in groups])
+    best = [k for k in np.argsort(-counts, kind="stable")[: max(1, int(n_modes))] if counts[k] >= min_count]
+    return (
+        np.array([float(np.median(f[groups[k]])) for k in best]),
+        np.array([float(np.median(z[groups[k]])) for k in best]),
+        counts[best].astype(np.int64),
+    )
+
+
+def _empty(fs: float, q: int, n_segments: int, n_rows: int) -> EraResult:
+    return EraResult(
+        fs=fs,
+        decimate=q,
+        n_rows=max(0, n_rows),
+        n_segments=n_segments,
+        singular_values=np.empty(0),
+        diagram=StabilizationDiagram(
+            order=np.empty(0, dtype=np.int64),
+            fn_hz=np.empty(0),
+            zeta=np.empty(0),
+            stable=np.empty(0, dtype=bool),
+        ),
+        fn_hz=np.empty(0),
+        zeta=np.empty(0),
+        n_stable=np.empty(0, dtype=np.int64),
+    )
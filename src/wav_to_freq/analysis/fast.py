@@ -0,0 +1,334 @@
+# src/wav_to_freq/analysis/fast.py
+"""
+Estimator tiers: a cheap ζ for every hit, the full envelope fit only where needed.
+
+The full tier is analyze_hit: band-pass around fn, Hilbert envelope, search
+of the fit window. The fast tier keeps the ringdown segment, SNR and fn
+(the same refined Welch peak) and replaces the rest by two cheap ζ estimates:
+
+- half-power bandwidth of the ringdown's (unwindowed) spectrum:
+  ζ = (f_hi - f_lo) / (2 fn). Only when the band spans _HP_MIN_BINS DFT
+  bins (1 / ring_s) or more, i.e. when the ringdown has decayed within the
+  window; a lightly damped low mode (0.36 Hz for ζ = 0.01 at 18 Hz, against
+  1 Hz bins) gives NaN.
+- log decrement: the ringdown from transient_s for up to fit_max_s is cut
+  into cycles at its positive peaks; cycles are kept while their RMS
+  amplitude is above the noise floor (noise_mult x the median envelope of
+  white noise, its std taken from sample differences over the last
+  noise_tail_s), and a line through ln(amplitude) vs time gives
+  ζ = -slope / (2π fn). The fit is stored like an envelope fit
+  (env_log_c / env_log_m, env_fit_r2, fit window).
+
+tier="auto" keeps the fast result when the log decrement is accepted and the
+half-power ζ, when resolved, agrees with it within agree_tol (relative);
+every other hit gets the full fit.
+"""
+
+from __future__ import annotations
+
+import csv
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Literal, Optional, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.signal import find_peaks
+
+from wav_to_freq.analysis.gate import GateStats, HitGate
+from wav_to_freq.analysis.modal import (
+    analyze_hit,
+    estimate_fn_psd,
+    fit_log_envelope,
+    ringdown_bounds,
+    ringdown_snr_db,
+)
+from wav_to_freq.domain.results import ResultTable
+from wav_to_freq.domain.types import HitModalResult, HitWindow
+from wav_to_freq.dsp.peaks import half_power_band
+from wav_to_freq.dsp.spectral import WindowSpectrum
+from wav_to_freq.dsp.stats import as_f64, as_work
+from wav_to_freq.store.sinks import ResultSink
+
+Tier = Literal["fast", "full", "auto"]
+TIERS: tuple[str, ...] = ("fast", "full", "auto")
+
+# resolvable half-power band, in DFT bins of the ringdown
+_HP_MIN_BINS = 3
+# fewest cycles for a log decrement
+_MIN_CYCLES = 5
+# median of a Rayleigh-distributed envelope of unit-variance noise
+_RAYLEIGH_MEDIAN = float(np.sqrt(2.0 * np.log(2.0)))
+
+
+@dataclass(frozen=True)
+class FastEstimate:
+    hit_id: int
+    fn_hz: float
+    zeta_half_power: float  # NaN: band narrower than _HP_MIN_BINS DFT bins
+    zeta_log_dec: float
+    log_dec_r2: float
+    n_cycles: int
+
+
+@dataclass(frozen=True)
+class TieredResults:
+    table: ResultTable
+    tier_used: tuple[str, ...]  # per row: "fast", "full" or "resumed" (read back from the sink)
+    fast: tuple[FastEstimate | None, ...]  # None for resumed hits and tier="full" rows not estimated
+
+    def counts(self) -> dict[str, int]:
+        keys, n = np.unique(np.array(self.tier_used, dtype=str), return_counts=True)
+        return {str(k): int(v) for k, v in zip(keys, n)}
+
+    def write_csv(self, path: str | Path) -> Path:
+        """One row per hit: the tier its result came from and both fast ζ estimates."""
+        path = Path(path)
+        with path.open("w", newline="", encoding="utf-8") as fh:
+            w = csv.writer(fh)
+            w.writerow(
+                ["hit_id", "tier", "fn_hz", "zeta", "zeta_half_power", "zeta_log_dec", "log_dec_r2", "n_cycles"]
+            )
+            for r, tier, fe in zip(self.table, self.tier_used, self.fast):
+                fast_cols = (
+                    [repr(fe.zeta_half_power), repr(fe.zeta_log_dec), repr(fe.log_dec_r2), fe.n_cycles]
+                    if fe is not None
+                    else ["", "", "", ""]
+                )
+                w.writerow([r.hit_id, tier, repr(float(r.fn_hz)), repr(float(r.zeta)), *fast_cols])
+        return path
+
+
+def analyze_hits_tiered(
+    windows: Sequence[HitWindow],
+    fs: float,
+    *,
+    tier: Tier = "auto",
+    agree_tol: float = 0.25,
+    settle_s: float = 0.010,
+    ring_s: float = 1.0,
+    fmin_hz: float = 0.5,
+    fmax_hz: float = 50.0,
+    transient_s: float = 0.20,
+    established_min_s: float = 0.40,
+    established_r2_min: float = 0.95,
+    fit_max_s: float = 0.80,
+    noise_tail_s: float = 0.20,
+    noise_mult: float = 3.0,
+    sink: ResultSink | None = None,
+    on_result: Callable[[HitModalResult], None] | None = None,
+    gate: HitGate | None = None,
+    gate_stats: GateStats | None = None,
+) -> TieredResults:
+    """
+    analyze_all_hits with a choice of estimator tier (see the module
+    docstring). tier="full" gives the same table as analyze_all_hits.
+    sink, on_result, gate and gate_stats behave as in analyze_all_hits; the
+    gate only applies to hits that get the full fit.
+    """
+    if tier not in TIERS:
+        raise ValueError(f"tier must be one of {TIERS}, got {tier!r}")
+    knobs = dict(
+        settle_s=settle_s,
+        ring_s=ring_s,
+        fmin_hz=fmin_hz,
+        fmax_hz=fmax_hz,
+        transient_s=transient_s,
+        established_min_s=established_min_s,
+        established_r2_min=established_r2_min,
+        fit_max_s=fit_max_s,
+        noise_tail_s=noise_tail_s,
+        noise_mult=noise_mult,
+    )
+    done = sink.resumed if sink is not None else {}
+
+    rows: list[HitModalResult] = []
+    tiers: list[str] = []
+    fast: list[FastEstimate | None] = []
+    for w in windows:
+        r = done.get(int(w.hit_id))
+        if r is not None and r.hit_index == w.hit_index:
+            used, fe = "resumed", None
+        else:
+            used, fe = "full", None
+            if tier != "full":
+                fe, r = fast_hit_estimate(w, fs, **knobs)
+                used = "fast"
+                if tier == "auto" and not _fast_is_enough(fe, r, agree_tol=agree_tol):
+                    r, used = None, "full"
+            if r is None or used == "full":
+                t0 = time.perf_counter()
+                r = analyze_hit(w, fs, **knobs, gate=gate)
+                if gate_stats is not None:
+                    gate_stats.record(r.reject_reason, time.perf_counter() - t0)
+            if sink is not None:
+                sink.write(r)
+        rows.append(r)
+        tiers.append(used)
+        fast.append(fe)
+        if on_result is not None:
+            on_result(r)
+    return TieredResults(table=ResultTable.from_results(rows), tier_used=tuple(tiers), fast=tuple(fast))
+
+
+def fast_hit_estimate(
+    w: HitWindow,
+    fs: float,
+    *,
+    settle_s: float,
+    ring_s: float,
+    fmin_hz: float,
+    fmax_hz: float,
+    transient_s: float,
+    established_min_s: float,
+    established_r2_min: float,
+    fit_max_s: float,
+    noise_tail_s: float,
+    noise_mult: float,
+) -> tuple[FastEstimate, HitModalResult]:
+    """
+    Fast-tier estimate of one hit, and its HitModalResult (log-decrement ζ;
+    the half-power ζ when the log decrement has too few cycles).
+    established_min_s is unused (there is no fit-window search).
+    """
+    fs = float(fs)
+    nan = float("nan")
+    accel: NDArray[np.floating] = as_work(w.accel)
+    start, end = ringdown_bounds(len(accel), fs, settle_s=settle_s, ring_s=ring_s)
+    base = dict(hit_id=int(w.hit_id), hit_index=int(w.hit_index), t0_s=w.t_start + start / fs, t1_s=w.t_start + end / fs)
+
+    def result(
+        fn_hz: float, zeta: float, snr_db: float, fit: tuple[float, float, float, int, int] | None, reason: str | None
+    ) -> HitModalResult:
+        c, m, r2, i0, i1 = fit if fit is not None else (nan, nan, 0.0, 0, 0)
+        return HitModalResult(
+            **base,
+            fn_hz=fn_hz,
+            zeta=zeta,
+            snr_db=snr_db,
+            env_fit_r2=r2,
+            env_log_c=c,
+            env_log_m=m,
+            reject_reason=reason,
+            fit_t0_s=base["t0_s"] + i0 / fs if fit is not None else None,
+            fit_t1_s=base["t0_s"] + i1 / fs if fit is not None else None,
+        )
+
+    if end - start < int(0.1 * fs):
+        fe = FastEstimate(int(w.hit_id), nan, nan, nan, nan, 0)
+        return fe, result(nan, nan, nan, None, "ringdown_too_short")
+
+    x = accel[start:end].copy()
+    x -= float(np.mean(x))
+    snr_db = ringdown_snr_db(x)
+
+    spectrum = WindowSpectrum.of(x, fs)
+    fn_hz = estimate_fn_psd(x, fs, fmin_hz=fmin_hz, fmax_hz=fmax_hz, spectrum=spectrum)
+    if not np.isfinite(fn_hz) or fn_hz <= 0:
+        fe = FastEstimate(int(w.hit_id), nan, nan, nan, nan, 0)
+        return fe, result(nan, nan, snr_db, None, "no_peak_found")
+
+    zeta_hp = zeta_half_power(spectrum, fn_hz=fn_hz, fmin_hz=fmin_hz, fmax_hz=fmax_hz)
+    fit = log_decrement_fit(
+        x,
+        fs,
+        fn_hz=fn_hz,
+        transient_s=transient_s,
+        fit_max_s=fit_max_s,
+        noise_tail_s=noise_tail_s,
+        noise_mult=noise_mult,
+    )
+    if fit is None:
+        fe = FastEstimate(int(w.hit_id), float(fn_hz), zeta_hp, nan, nan, 0)
+        if np.isfinite(zeta_hp):
+            return fe, result(float(fn_hz), zeta_hp, snr_db, None, None)
+        return fe, result(float(fn_hz), nan, snr_db, None, "too_few_cycles")
+
+    c, m, r2, i0, i1, n_cycles = fit
+    zeta = -m / (2.0 * np.pi * fn_hz)
+    fe = FastEstimate(int(w.hit_id), float(fn_hz), zeta_hp, float(zeta), float(r2), int(n_cycles))
+
+    reason: Optional[str] = None
+    if not np.isfinite(zeta) or zeta <= 0:
+        reason = "bad_zeta"
+    elif not np.isfinite(r2) or r2 < established_r2_min:
+        reason = "low_r2"
+    return fe, result(float(fn_hz), float(zeta), snr_db, (c, m, r2, i0, i1), reason)
+
+
+def zeta_half_power(spectrum: WindowSpectrum, *, fn_hz: float, fmin_hz: float, fmax_hz: float) -> float:
+    """
+    ζ from the half-power band of the ringdown's |rFFT|² peak in
+    [fmin_hz, fmax_hz]; NaN when narrower than _HP_MIN_BINS bins of the
+    unpadded DFT (the ringdown is then truncated, not decayed).
+    """
+    if spectrum.n < 16:
+        return float("nan")
+    f = np.arange(spectrum.spec.size) * (spectrum.fs / spectrum.nfft)
+    p = np.abs(spectrum.spec) ** 2
+    _, f_lo, f_hi = half_power_band(f, p, p, fmin_hz=fmin_hz, fmax_hz=fmax_hz)
+    width = f_hi - f_lo
+    if not np.isfinite(width) or width < _HP_MIN_BINS * spectrum.fs / spectrum.n:
+        return float("nan")
+    return float(width / (2.0 * float(fn_hz)))
+
+
+def log_decrement_fit(
+    x: NDArray[np.floating],
+    fs: float,
+    *,
+    fn_hz: float,
+    transient_s: float,
+    fit_max_s: float,
+    noise_tail_s: float,
+    noise_mult: float,
+) -> tuple[float, float, float, int, int, int] | None:
+    """
+    Line through ln(cycle amplitude) of the ringdown x (mean removed):
+    (c, m, r2, i0, i1, n_cycles), t measured from i0, [i0, i1) the cycles
+    used. None with fewer than _MIN_CYCLES cycles above the noise.
+
+    A cycle runs from one positive peak to the next; its amplitude is
+    sqrt(2 (mean(x²) - noise variance)), which unlike the peak sample is not
+    pulled up by the noise as the ringdown reaches the floor.
+    """
+    fs = float(fs)
+    x = as_f64(x)
+    n = x.size
+    i0 = int(round(max(0.0, float(transient_s)) * fs))
+    i1 = min(n, i0 + int(round(max(0.05, float(fit_max_s)) * fs)))
+    if i1 - i0 < 16:
+        return None
+
+    # noise std from sample-to-sample differences of the tail: the mode
+    # (fn << fs) barely moves between samples, white noise doubles in variance
+    tail = min(n, int(round(max(0.05, float(noise_tail_s)) * fs)))
+    noise_var = float(np.var(np.diff(x[n - tail :]))) / 2.0
+    floor = float(noise_mult) * _RAYLEIGH_MEDIAN * np.sqrt(noise_var)
+
+    # search from 0 so a slope at i0 is not taken for a peak
+    peaks, _ = find_peaks(x[:i1], distance=max(1, int(0.7 * fs / float(fn_hz))))
+    peaks = peaks[peaks >= i0]
+    if peaks.size < 2:
+        return None
+    e2 = np.concatenate(([0.0], np.cumsum(x[: peaks[-1]] ** 2)))
+    ms = (e2[peaks[1:]] - e2[peaks[:-1]]) / np.diff(peaks)
+    amp = np.sqrt(2.0 * np.clip(ms - noise_var, 0.0, None))
+    # contiguous run from the start: stop at the first cycle lost in the noise
+    below = np.flatnonzero(amp <= floor)
+    n_cycles = int(below[0]) if below.size else int(amp.size)
+    if n_cycles < _MIN_CYCLES:
+        return None
+
+    mid = 0.5 * (peaks[:n_cycles] + peaks[1 : n_cycles + 1])
+    c, m, r2 = fit_log_envelope((mid - peaks[0]) / fs, amp[:n_cycles], min_points=_MIN_CYCLES)
+    return float(c), float(m), float(r2), int(peaks[0]), int(peaks[n_cycles]), n_cycles
+
+
+def _fast_is_enough(fe: FastEstimate, r: HitModalResult, *, agree_tol: float) -> bool:
+    if r.reject_reason is not None or not np.isfinite(fe.zeta_log_dec):
+        return False
+    if np.isfinite(fe.zeta_half_power):
+        return abs(fe.zeta_half_power - fe.zeta_log_dec) <= float(agree_tol) * fe.zeta_log_dec
+    return True
@@ -0,0 +1,116 @@
+# src/wav_to_freq/analysis/impact.py
+"""
+Force / response windows of impact-test hits, shared by the FRF estimators
+(analysis.frf: averaged H1, analysis.rfp: per-hit FRFs).
+
+- force: the hammer channel up to force_window_s after the hit, baseline
+  (the median after it) removed, zero elsewhere;
+- response: exp(-t / tau) from the hit on, tau chosen so the window ends at
+  exp_end (the ringdown then dies out inside the window: no leakage).
+  It adds exactly 1 / tau to every pole's decay rate, i.e.
+  1 / (tau · 2π fn) to ζ, which the estimators subtract.
+
+The windows of all hits are stacked and transformed together, hammer and
+response in the same batched rFFT (in chunks, to bound memory).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy import fft
+
+from wav_to_freq.domain.types import HitWindow
+from wav_to_freq.dsp.spectral import get_fft_workers
+from wav_to_freq.dsp.stats import as_work
+
+
+# bytes of spectra held per chunk of hits (hammer + response, complex64)
+_CHUNK_BYTES = 64 << 20
+
+
+@dataclass(frozen=True)
+class ImpactWindowing:
+    """
+    Force / response windows and transform length shared by all hits of one
+    length (see the module docstring). chunks() yields their spectra.
+    """
+
+    fs: float
+    n: int  # window length (samples)
+    nfft: int
+    force_mask: NDArray[np.bool_]
+    resp_win: NDArray[np.float64]
+    exp_tau_s: float | None  # None: rectangular response window
+
+    @classmethod
+    def for_windows(
+        cls,
+        windows: Sequence[HitWindow],
+        fs: float,
+        *,
+        force_window_s: float = 0.010,
+        exp_end: float | None = 0.01,
+        pad: int = 4,
+    ) -> ImpactWindowing:
+        """Windowing for windows[0]'s length and hit position (windows must be non-empty)."""
+        fs = float(fs)
+        n = int(windows[0].accel.size)
+        k_hit = int(round((windows[0].t_hit - windows[0].t_start) * fs))
+        k = np.arange(n)
+
+        k_force = k_hit + int(round(float(force_window_s) * fs))
+
+        exp_tau_s: float | None = None
+        resp_win = np.ones(n)
+        if exp_end is not None and n - k_hit > 1:
+            exp_tau_s = (n - k_hit) / fs / np.log(1.0 / float(exp_end))
+            resp_win = np.exp(-np.clip(k - k_hit, 0, None) / (exp_tau_s * fs))
+
+        return cls(
+            fs=fs,
+            n=n,
+            nfft=fft.next_fast_len(max(1, int(pad)) * n, real=True),
+            force_mask=k <= k_force,
+            resp_win=resp_win,
+            exp_tau_s=exp_tau_s,
+        )
+
+    @property
+    def f_hz(self) -> NDArray[np.float64]:
+        return fft.rfftfreq(self.nfft, 1.0 / self.fs)
+
+    def chunks(
+        self, windows: Sequence[HitWindow]
+    ) -> Iterator[tuple[Sequence[HitWindow], NDArray[np.complexfloating], NDArray[np.complexfloating]]]:
+        """(block, F, A) per chunk of hits; F and A are (len(block), nfft // 2 + 1)."""
+        force_mask = self.force_mask
+        chunk = max(1, _CHUNK_BYTES // (2 * (self.nfft // 2 + 1) * 8))
+        for i0 in range(0, len(windows), chunk):
+            block = windows[i0 : i0 + chunk]
+            x = np.stack(
+                [
+                    np.stack([as_work(w.hammer) for w in block]),
+                    np.stack([as_work(w.accel) for w in block]),
+                ]
+            )  # (2, n_block, n)
+            hammer, accel = x[0], x[1]
+            baseline = np.median(hammer[:, ~force_mask], axis=1, keepdims=True) if (~force_mask).any() else 0.0
+            x[0] = np.where(force_mask, hammer - baseline, 0.0)
+            x[1] = (accel - accel.mean(axis=1, keepdims=True)) * self.resp_win
+
+            spec = fft.rfft(x, self.nfft, axis=-1, workers=get_fft_workers())
+            yield block, spec[0], spec[1]
+
+
+def same_length_windows(windows: Sequence[HitWindow]) -> list[HitWindow]:
+    """The windows of the most common length (hits clipped at the recording edges are left out)."""
+    if not windows:
+        return []
+    lengths = np.array([w.accel.size for w in windows])
+    values, counts = np.unique(lengths, return_counts=True)
+    n = int(values[np.argmax(counts)])
+    return [w for w in windows if w.accel.size == n and w.hammer.size == n]
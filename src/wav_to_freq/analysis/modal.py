@@ -1,13 +1,22 @@
 # ==== FILE: src/wav_to_freq/modal.py ====
 
 from __future__ import annotations
-from typing import Sequence, Optional
+from dataclasses import dataclass
+import time
+from typing import Callable, Sequence, Optional
 
 import numpy as np
 from numpy.typing import NDArray
-from scipy.signal import welch, butter, filtfilt, hilbert
+from scipy.signal import find_peaks
 
-from wav_to_freq.domain.types import HitModalResult, HitWindow
+from wav_to_freq.analysis.gate import GateStats, HitGate, clip_reason, spectrum_reason
+from wav_to_freq.analysis.rfp import fit_rfp_hits
+from wav_to_freq.domain.results import ResultTable
+from wav_to_freq.domain.types import HitModalResult, HitWindow, MultiHitWindows
+from wav_to_freq.dsp.filters import bandpass, mode_band
+from wav_to_freq.dsp.spectral import WindowSpectrum, hilbert_envelope, welch_psd
+from wav_to_freq.dsp.stats import as_f64, as_work
+from wav_to_freq.store.sinks import ResultSink
 
 
 def analyze_all_hits(
@@ -25,11 +34,121 @@ def analyze_all_hits(
     fit_max_s: float = 0.80,
     noise_tail_s: float = 0.20,
     noise_mult: float = 3.0,
-) -> list[HitModalResult]:
-    return [
-        analyze_hit(
+    sink: ResultSink | None = None,
+    on_result: Callable[[HitModalResult], None] | None = None,
+    gate: HitGate | None = None,
+    gate_stats: GateStats | None = None,
+) -> ResultTable:
+    """
+    Analyze every hit window.
+
+    With a sink, each result is appended as soon as it is computed, and hits
+    already present in the sink (resumed run) are reused instead of recomputed.
+    on_result is called with every result in hit order (an exception raised
+    from it stops the loop, e.g. on cancellation).
+
+    gate: pre-checks that reject hopeless hits before the envelope fit (see
+    analysis.gate); gate_stats, when given, accumulates its rejects and the
+    per-hit times behind the time-saved estimate.
+    """
+    done = sink.resumed if sink is not None else {}
+
+    rows: list[HitModalResult] = []
+    for w in windows:
+        r = done.get(int(w.hit_id))
+        if r is None or r.hit_index != w.hit_index:
+            t0 = time.perf_counter()
+            r = analyze_hit(
+                w,
+                fs,
+                settle_s=settle_s,
+                ring_s=ring_s,
+                fmin_hz=fmin_hz,
+                fmax_hz=fmax_hz,
+                transient_s=transient_s,
+                established_min_s=established_min_s,
+                established_r2_min=established_r2_min,
+                fit_max_s=fit_max_s,
+                noise_tail_s=noise_tail_s,
+                noise_mult=noise_mult,
+                gate=gate,
+            )
+            if gate_stats is not None:
+                gate_stats.record(r.reject_reason, time.perf_counter() - t0)
+            if sink is not None:
+                sink.write(r)
+        rows.append(r)
+        if on_result is not None:
+            on_result(r)
+    return ResultTable.from_results(rows)
+
+
+def analyze_multichannel_hits(
+    windows: MultiHitWindows,
+    *,
+    settle_s: float = 0.010,
+    ring_s: float = 1.0,
+    fmin_hz: float = 0.5,
+    fmax_hz: float = 50.0,
+    transient_s: float = 0.20,
+    established_min_s: float = 0.40,
+    established_r2_min: float = 0.95,
+    fit_max_s: float = 0.80,
+    noise_tail_s: float = 0.20,
+    noise_mult: float = 3.0,
+) -> dict[tuple[int, int], HitModalResult]:
+    """
+    Analyze every (hit, response channel) pair of a multichannel recording.
+
+    Windows are read as views of the stacked block, so nothing is re-read or
+    re-detected per channel. Keys are (hit_id, file column of the channel).
+    """
+    results: dict[tuple[int, int], HitModalResult] = {}
+    for i in range(windows.hit_ids.size):
+        for ch, column in enumerate(windows.response_indices):
+            results[(int(windows.hit_ids[i]), int(column))] = analyze_hit(
+                windows.window(i, ch),
+                windows.fs,
+                settle_s=settle_s,
+                ring_s=ring_s,
+                fmin_hz=fmin_hz,
+                fmax_hz=fmax_hz,
+                transient_s=transient_s,
+                established_min_s=established_min_s,
+                established_r2_min=established_r2_min,
+                fit_max_s=fit_max_s,
+                noise_tail_s=noise_tail_s,
+                noise_mult=noise_mult,
+            )
+    return results
+
+
+def analyze_multimode_hits(
+    windows: Sequence[HitWindow],
+    fs: float,
+    *,
+    n_modes: int = 3,
+    settle_s: float = 0.010,
+    ring_s: float = 1.0,
+    fmin_hz: float = 0.5,
+    fmax_hz: float = 50.0,
+    transient_s: float = 0.20,
+    established_min_s: float = 0.40,
+    established_r2_min: float = 0.95,
+    fit_max_s: float = 0.80,
+    noise_tail_s: float = 0.20,
+    noise_mult: float = 3.0,
+) -> dict[tuple[int, int], HitModalResult]:
+    """
+    Up to n_modes modes per hit. Keys are (hit_id, mode), mode 1-based in
+    order of decreasing spectral peak height (mode 1 is normally the analyze_hit peak).
+    """
+    results: dict[tuple[int, int], HitModalResult] = {}
+    for w in windows:
+        modes = analyze_hit_modes(
             w,
             fs,
+            n_modes=n_modes,
             settle_s=settle_s,
             ring_s=ring_s,
             fmin_hz=fmin_hz,
@@ -41,8 +160,117 @@ def analyze_all_hits(
             noise_tail_s=noise_tail_s,
             noise_mult=noise_mult,
         )
-        for w in windows
-    ]
+        for mode, r in enumerate(modes, start=1):
+            results[(int(w.hit_id), mode)] = r
+    return results
+
+
+def analyze_rfp_hits(
+    windows: Sequence[HitWindow],
+    fs: float,
+    *,
+    n_modes: int = 1,
+    settle_s: float = 0.010,
+    ring_s: float = 1.0,
+    fmin_hz: float = 0.5,
+    fmax_hz: float = 50.0,
+    n_poles: int | None = None,
+    r2_min: float = 0.95,
+    force_window_s: float = 0.010,
+    exp_end: float | None = 0.01,
+) -> dict[tuple[int, int], HitModalResult]:
+    """
+    Alternative to analyze_multimode_hits: fn / zeta from RFP fits of each
+    hit's FRF around its peaks in [fmin_hz, fmax_hz] (analysis.rfp,
+    fit_rfp_hits) instead of band-pass envelopes, so close modes do not leak
+    into each other's fit. Keys are (hit_id, mode), mode 1-based by
+    decreasing resonance peak.
+
+    env_fit_r2 is the R² of the FRF fit over the mode's sub-band (r2_min
+    applies to it); there is no log-envelope fit (env_log_c/m are NaN).
+    t0_s / t1_s span the whole impact window the FRF is computed over;
+    settle_s and ring_s only set the segment of the SNR metric. Hits whose
+    window is clipped by the recording edges are rejected ("window_clipped").
+    """
+    fs = float(fs)
+    fitted, modes = fit_rfp_hits(
+        windows,
+        fs,
+        fmin_hz=fmin_hz,
+        fmax_hz=fmax_hz,
+        n_modes=n_modes,
+        n_poles=n_poles,
+        force_window_s=force_window_s,
+        exp_end=exp_end,
+    )
+    row_of = {int(w.hit_id): i for i, w in enumerate(fitted)}
+    nan = float("nan")
+
+    results: dict[tuple[int, int], HitModalResult] = {}
+    for w in windows:
+        start = int(round(settle_s * fs))
+        x = as_work(w.accel)[start : start + int(round(ring_s * fs))]
+        base = dict(
+            hit_id=int(w.hit_id),
+            hit_index=int(w.hit_index),
+            t0_s=float(w.t_start),
+            t1_s=float(w.t_start) + w.accel.size / fs,
+            snr_db=ringdown_snr_db(x - float(np.mean(x))) if x.size else nan,
+            env_log_c=nan,
+            env_log_m=nan,
+        )
+        i = row_of.get(int(w.hit_id))
+        if i is None:
+            results[(int(w.hit_id), 1)] = HitModalResult(
+                **base, fn_hz=nan, zeta=nan, env_fit_r2=0.0, reject_reason="window_clipped"
+            )
+            continue
+
+        found = np.flatnonzero(np.isfinite(modes.fn_hz[i]))
+        if found.size == 0:
+            fitted_r2 = modes.r2[i][np.isfinite(modes.r2[i])]
+            results[(int(w.hit_id), 1)] = HitModalResult(
+                **base,
+                fn_hz=nan,
+                zeta=nan,
+                env_fit_r2=float(fitted_r2.max()) if fitted_r2.size else nan,
+                reject_reason="no_pole_found",
+            )
+            continue
+
+        for k in found:
+            zeta = float(modes.zeta[i, k])
+            r2 = float(modes.r2[i, k])
+            reject_reason: Optional[str] = None
+            if not np.isfinite(zeta) or zeta <= 0:
+                reject_reason = "bad_zeta"
+            elif not np.isfinite(r2) or r2 < r2_min:
+                reject_reason = "low_r2"
+            results[(int(w.hit_id), int(k) + 1)] = HitModalResult(
+                **base, fn_hz=float(modes.fn_hz[i, k]), zeta=zeta, env_fit_r2=r2, reject_reason=reject_reason
+            )
+    return results
+
+
+@dataclass(frozen=True)
+class HitEnvelope:
+    """
+    The knob-independent part of analyze_hit for one hit: ringdown segment,
+    fn and Hilbert envelope of the band-passed ringdown. fit_hit_envelope turns
+    it into a HitModalResult for given damping-fit knobs, so tools that vary
+    only those knobs (TUI preview, sweeps) compute it once.
+    """
+
+    hit_id: int
+    hit_index: int
+    fs: float
+    t_start: float  # window start (s)
+    start: int  # ringdown segment [start, end) in window samples
+    end: int
+    fn_hz: float
+    snr_db: float
+    env: NDArray[np.floating]  # empty when reject_reason is set
+    reject_reason: str | None = None
 
 
 def analyze_hit(
@@ -59,63 +287,219 @@ def analyze_hit(
     fit_max_s: float,
     noise_tail_s: float,
     noise_mult: float,
+    gate: HitGate | None = None,
 ) -> HitModalResult:
-    fs = float(fs)
-    accel: NDArray[np.float64] = np.asarray(w.accel, dtype=np.float64)
+    env = hit_envelope(w, fs, settle_s=settle_s, ring_s=ring_s, fmin_hz=fmin_hz, fmax_hz=fmax_hz, gate=gate)
+    return fit_hit_envelope(
+        env,
+        transient_s=transient_s,
+        established_min_s=established_min_s,
+        established_r2_min=established_r2_min,
+        fit_max_s=fit_max_s,
+        noise_tail_s=noise_tail_s,
+        noise_mult=noise_mult,
+    )
+
 
+def ringdown_bounds(n: int, fs: float, *, settle_s: float, ring_s: float) -> tuple[int, int]:
+    """[start, end) of the ringdown segment analyzed in a window of n samples."""
     start = int(round(settle_s * fs))
-    end = min(len(accel), start + int(round(ring_s * fs)))
+    return start, min(int(n), start + int(round(ring_s * fs)))
+
+
+def hit_envelope(
+    w: HitWindow,
+    fs: float,
+    *,
+    settle_s: float,
+    ring_s: float,
+    fmin_hz: float,
+    fmax_hz: float,
+    gate: HitGate | None = None,
+) -> HitEnvelope:
+    """
+    Ringdown segment -> SNR, fn (Welch peak) -> band-pass around fn -> envelope.
+    A hit failing one of the gate's checks stops before fn is refined, with
+    the check's reject reason.
+    """
+    fs = float(fs)
+    accel: NDArray[np.floating] = as_work(w.accel)
+
+    start, end = ringdown_bounds(len(accel), fs, settle_s=settle_s, ring_s=ring_s)
+    empty = np.empty(0, dtype=accel.dtype)
 
     if end - start < int(0.1 * fs):
-        return HitModalResult(
+        return HitEnvelope(
             hit_id=w.hit_id,
             hit_index=w.hit_index,
-            t0_s=w.t_start + start / fs,
-            t1_s=w.t_start + end / fs,
+            fs=fs,
+            t_start=w.t_start,
+            start=start,
+            end=end,
             fn_hz=float("nan"),
-            zeta=float("nan"),
             snr_db=float("nan"),
-            env_fit_r2=0.0,
-            env_log_c=float("nan"),
-            env_log_m=float("nan"),
+            env=empty,
             reject_reason="ringdown_too_short",
-            fit_t0_s=None,
-            fit_t1_s=None,
         )
 
     x = accel[start:end].copy()
     x -= float(np.mean(x))
 
-    # quick SNR-ish metric
-    n = len(x)
-    a = x[: max(1, n // 5)]
-    b = x[max(1, 4 * n // 5) :]
-    snr_db = 20.0 * np.log10((float(np.std(a)) + 1e-12) / (float(np.std(b)) + 1e-12))
+    snr_db = ringdown_snr_db(x)
 
-    fn_hz = _estimate_fn_psd(x, fs, fmin_hz=fmin_hz, fmax_hz=fmax_hz)
+    psd = None
+    if gate is not None:
+        psd = welch_psd(x, fs)
+        reason = clip_reason(accel, gate) or spectrum_reason(
+            *psd, snr_db=snr_db, fmin_hz=fmin_hz, fmax_hz=fmax_hz, gate=gate
+        )
+        if reason is not None:
+            return HitEnvelope(
+                hit_id=w.hit_id,
+                hit_index=w.hit_index,
+                fs=fs,
+                t_start=w.t_start,
+                start=start,
+                end=end,
+                fn_hz=float("nan"),
+                snr_db=snr_db,
+                env=empty,
+                reject_reason=reason,
+            )
+
+    fn_hz = estimate_fn_psd(x, fs, fmin_hz=fmin_hz, fmax_hz=fmax_hz, psd=psd)
     if not np.isfinite(fn_hz) or fn_hz <= 0:
-        return HitModalResult(
+        return HitEnvelope(
             hit_id=w.hit_id,
             hit_index=w.hit_index,
-            t0_s=w.t_start + start / fs,
-            t1_s=w.t_start + end / fs,
+            fs=fs,
+            t_start=w.t_start,
+            start=start,
+            end=end,
             fn_hz=float("nan"),
-            zeta=float("nan"),
             snr_db=snr_db,
-            env_fit_r2=0.0,
-            env_log_c=float("nan"),
-            env_log_m=float("nan"),
+            env=empty,
             reject_reason="no_peak_found",
-            fit_t0_s=None,
-            fit_t1_s=None,
         )
 
-    y = _bandpass(x, fs, float(fn_hz))
-
-    zeta, r2, c, m, i0_fit, i1_fit = _estimate_zeta_envelope_auto(
-        y,
-        fs,
+    return HitEnvelope(
+        hit_id=w.hit_id,
+        hit_index=w.hit_index,
+        fs=fs,
+        t_start=w.t_start,
+        start=start,
+        end=end,
         fn_hz=float(fn_hz),
+        snr_db=float(snr_db),
+        env=hilbert_envelope(bandpass(x, fs, mode_band(fs, fn_hz))),
+    )
+
+
+def analyze_hit_modes(
+    w: HitWindow,
+    fs: float,
+    *,
+    n_modes: int,
+    settle_s: float,
+    ring_s: float,
+    fmin_hz: float,
+    fmax_hz: float,
+    transient_s: float,
+    established_min_s: float,
+    established_r2_min: float,
+    fit_max_s: float,
+    noise_tail_s: float,
+    noise_mult: float,
+) -> list[HitModalResult]:
+    """analyze_hit for the n_modes strongest PSD peaks (one result per mode found)."""
+    return [
+        fit_hit_envelope(
+            env,
+            transient_s=transient_s,
+            established_min_s=established_min_s,
+            established_r2_min=established_r2_min,
+            fit_max_s=fit_max_s,
+            noise_tail_s=noise_tail_s,
+            noise_mult=noise_mult,
+        )
+        for env in hit_mode_envelopes(
+            w,
+            fs,
+            n_modes=n_modes,
+            settle_s=settle_s,
+            ring_s=ring_s,
+            fmin_hz=fmin_hz,
+            fmax_hz=fmax_hz,
+        )
+    ]
+
+
+def hit_mode_envelopes(
+    w: HitWindow,
+    fs: float,
+    *,
+    n_modes: int,
+    settle_s: float,
+    ring_s: float,
+    fmin_hz: float,
+    fmax_hz: float,
+) -> list[HitEnvelope]:
+    """
+    hit_envelope for up to n_modes modes from one read of the ringdown:
+    one rFFT of the ringdown -> top-n_modes DFT peaks -> all band-pass + Hilbert envelopes
+    from that same rFFT (dsp.spectral.WindowSpectrum, cached SOS
+    designs). A rejected segment yields a single rejected envelope.
+    """
+    fs = float(fs)
+    accel: NDArray[np.floating] = as_work(w.accel)
+
+    start, end = ringdown_bounds(len(accel), fs, settle_s=settle_s, ring_s=ring_s)
+    base = dict(hit_id=w.hit_id, hit_index=w.hit_index, fs=fs, t_start=w.t_start, start=start, end=end)
+    empty = np.empty(0, dtype=accel.dtype)
+
+    if end - start < int(0.1 * fs):
+        return [
+            HitEnvelope(**base, fn_hz=float("nan"), snr_db=float("nan"), env=empty, reject_reason="ringdown_too_short")
+        ]
+
+    x = accel[start:end].copy()
+    x -= float(np.mean(x))
+
+    snr_db = ringdown_snr_db(x)
+
+    spectrum = WindowSpectrum.of(x, fs)
+    modes = _estimate_mode_freqs(spectrum, n_modes=n_modes, fmin_hz=fmin_hz, fmax_hz=fmax_hz)
+    if not modes:
+        return [HitEnvelope(**base, fn_hz=float("nan"), snr_db=snr_db, env=empty, reject_reason="no_peak_found")]
+
+    fns = [fn for fn, above_floor in modes if above_floor]
+    envs = iter(spectrum.envelopes([mode_band(fs, fn) for fn in fns]))
+    return [
+        HitEnvelope(**base, fn_hz=float(fn), snr_db=float(snr_db), env=next(envs))
+        if above_floor
+        else HitEnvelope(**base, fn_hz=float(fn), snr_db=float(snr_db), env=empty, reject_reason="below_noise_floor")
+        for fn, above_floor in modes
+    ]
+
+
+def fit_hit_envelope(
+    env: HitEnvelope,
+    *,
+    transient_s: float,
+    established_min_s: float,
+    established_r2_min: float,
+    fit_max_s: float,
+    noise_tail_s: float,
+    noise_mult: float,
+) -> HitModalResult:
+    """Damping fit on a precomputed envelope (the knob-dependent part of analyze_hit)."""
+    if env.reject_reason is not None:
+        return envelope_result(env, None, established_r2_min=established_r2_min)
+
+    fit = _estimate_zeta_from_envelope(
+        env.env,
+        env.fs,
+        fn_hz=env.fn_hz,
         transient_s=transient_s,
         established_min_s=established_min_s,
         established_r2_min=established_r2_min,
@@ -123,9 +507,41 @@ def analyze_hit(
         noise_tail_s=noise_tail_s,
         noise_mult=noise_mult,
     )
+    return envelope_result(env, fit, established_r2_min=established_r2_min)
+
+
+def envelope_result(
+    env: HitEnvelope,
+    fit: tuple[float, float, float, float, int, int] | None,
+    *,
+    established_r2_min: float,
+) -> HitModalResult:
+    """HitModalResult from an envelope and its (zeta, r2, c, m, i0, i1) fit (None if rejected)."""
+    fs = env.fs
+    t0_s = env.t_start + env.start / fs
+    t1_s = env.t_start + env.end / fs
+
+    if fit is None:
+        return HitModalResult(
+            hit_id=env.hit_id,
+            hit_index=env.hit_index,
+            t0_s=t0_s,
+            t1_s=t1_s,
+            fn_hz=float("nan"),
+            zeta=float("nan"),
+            snr_db=env.snr_db,
+            env_fit_r2=0.0,
+            env_log_c=float("nan"),
+            env_log_m=float("nan"),
+            reject_reason=env.reject_reason,
+            fit_t0_s=None,
+            fit_t1_s=None,
+        )
+
+    zeta, r2, c, m, i0_fit, i1_fit = fit
 
-    fit_t0_s = w.t_start + (start + i0_fit) / fs
-    fit_t1_s = w.t_start + (start + i1_fit) / fs
+    fit_t0_s = env.t_start + (env.start + i0_fit) / fs
+    fit_t1_s = env.t_start + (env.start + i1_fit) / fs
 
     reject_reason: Optional[str] = None
     if not np.isfinite(zeta) or zeta <= 0:
@@ -134,13 +550,13 @@ def analyze_hit(
         reject_reason = "low_r2"
 
     return HitModalResult(
-        hit_id=w.hit_id,
-        hit_index=w.hit_index,
-        t0_s=w.t_start + start / fs,
-        t1_s=w.t_start + end / fs,
-        fn_hz=float(fn_hz),
+        hit_id=env.hit_id,
+        hit_index=env.hit_index,
+        t0_s=t0_s,
+        t1_s=t1_s,
+        fn_hz=float(env.fn_hz),
         zeta=float(zeta),
-        snr_db=float(snr_db),
+        snr_db=float(env.snr_db),
         env_fit_r2=float(r2),
         env_log_c=float(c),
         env_log_m=float(m),
@@ -150,15 +566,36 @@ def analyze_hit(
     )
 
 
-def _estimate_fn_psd(
-    x: NDArray[np.float64], fs: float, *, fmin_hz: float, fmax_hz: float
+def ringdown_snr_db(x: NDArray[np.floating]) -> float:
+    """Quick SNR-ish metric: RMS of the first vs the last fifth of the (mean-removed) ringdown, in dB."""
+    n = len(x)
+    a = x[: max(1, n // 5)]
+    b = x[max(1, 4 * n // 5) :]
+    return float(20.0 * np.log10((float(np.std(a)) + 1e-12) / (float(np.std(b)) + 1e-12)))
+
+
+def estimate_fn_psd(
+    x: NDArray[np.floating],
+    fs: float,
+    *,
+    fmin_hz: float,
+    fmax_hz: float,
+    refine: bool = True,
+    spectrum: WindowSpectrum | None = None,
+    psd: tuple[NDArray[np.float64], NDArray[np.floating]] | None = None,
 ) -> float:
+    """
+    Welch peak in [fmin_hz, fmax_hz]; with refine, moved off the Welch bin
+    grid using the spectrum of the whole segment around it (see _refine_fn).
+    spectrum: the rFFT of x, psd: its Welch (f, pxx), when the caller
+    already has them.
+    """
     fs = float(fs)
-    x = np.asarray(x, dtype=np.float64)
+    x = as_work(x)
     if x.size < 16:
         return float("nan")
 
-    f, pxx = welch(x, fs=fs, nperseg=min(4096, max(256, x.size // 2)))
+    f, pxx = psd if psd is not None else welch_psd(x, fs)
     m = (f >= float(fmin_hz)) & (f <= float(fmax_hz))
     if not np.any(m):
         return float("nan")
@@ -169,36 +606,81 @@ def _estimate_fn_psd(
         return float("nan")
 
     k = int(np.argmax(pp))
-    return float(ff[k])
+    if not refine:
+        return float(ff[k])
+    spectrum = spectrum if spectrum is not None else WindowSpectrum.of(x, fs, pad=1)
+    return _refine_fn(spectrum, float(ff[k]), bin_hz=float(f[1] - f[0]), fmin_hz=fmin_hz, fmax_hz=fmax_hz)
 
 
-def _bandpass(x: NDArray[np.float64], fs: float, fn_hz: float) -> NDArray[np.float64]:
-    fs = float(fs)
-    fn_hz = float(fn_hz)
+def _refine_fn(spectrum: WindowSpectrum, f0_hz: float, *, bin_hz: float, fmin_hz: float, fmax_hz: float) -> float:
+    # the true peak lies within one Welch bin of the coarse one
+    fn = spectrum.peak(f0_hz, half_width_hz=bin_hz)
+    return float(min(max(fn, float(fmin_hz)), float(fmax_hz)))
 
-    lo = max(0.5, 0.6 * fn_hz)
-    hi = min(0.49 * fs, 1.4 * fn_hz)
-    if hi <= lo:
-        return np.asarray(x, dtype=np.float64)
 
-    b, a = butter(4, [lo / (0.5 * fs), hi / (0.5 * fs)], btype="bandpass")
-    return filtfilt(b, a, x).astype(np.float64)
+# a mode peak must clear the noise floor (median DFT power) by this much;
+# the largest of ~10^4 noise-only bins is ~12 dB above it, and noise riding
+# on a mode's spectral tail a few dB more
+_MODE_FLOOR_DB = 20.0
 
 
-def _env(x: NDArray[np.float64]) -> NDArray[np.float64]:
-    x = np.asarray(x, dtype=np.float64)
-    if x.size == 0:
-        return x
-    return np.abs(hilbert(x)).astype(np.float64)
+def _estimate_mode_freqs(
+    spectrum: WindowSpectrum,
+    *,
+    n_modes: int,
+    fmin_hz: float,
+    fmax_hz: float,
+) -> list[tuple[float, bool]]:
+    """
+    The n_modes highest local peaks of the window's spectrum in
+    [fmin_hz, fmax_hz], by decreasing height, as (fn_hz, above_floor).
+
+    Peaks are picked on the full-length DFT (fs/nfft apart) rather than on
+    Welch bins, which at 48 kHz are wider than the gap between low modes,
+    then refined like fn. The window is tapered to zero at its end first
+    (w = cos^2(pi t / 2T), three taps on the grid of a pad=2 spectrum): a
+    lightly damped ringdown cut off mid-decay otherwise leaks sinc ripples
+    that look like modes. above_floor is False for a peak less than
+    _MODE_FLOOR_DB over the noise floor, the median power above fmin_hz (up
+    to fs / 2, where the ringdown's energy is in a few bins).
+    """
+    if spectrum.n < 16 or n_modes < 1:
+        return []
+
+    spec = spectrum.spec
+    df = spectrum.fs / spectrum.nfft
+    j0 = max(1, int(np.ceil(float(fmin_hz) / df)))
+    j1 = min(spec.size - 2, int(np.floor(float(fmax_hz) / df)))
+    if j1 - j0 < 2:
+        return []
+
+    # the floor spans every bin above fmin_hz: a narrow band can be all resonance
+    tapered = 0.5 * spec[j0:-1] + 0.25 * (spec[j0 - 1 : -2] + spec[j0 + 1 :])
+    db_above = 10.0 * np.log10(np.abs(tapered) ** 2 + 1e-300)
+    floor_db = float(np.median(db_above))
+    db = db_above[: j1 - j0 + 1]
+    peaks, _ = find_peaks(db, prominence=6.0)
+    if peaks.size == 0:
+        peaks = np.array([int(np.argmax(db))])
+    order = peaks[np.argsort(db[peaks])[::-1]][: int(n_modes)]
+    return [
+        (
+            _refine_fn(spectrum, float((j0 + k) * df), bin_hz=2.0 * df, fmin_hz=fmin_hz, fmax_hz=fmax_hz),
+            bool(db[k] - floor_db >= _MODE_FLOOR_DB),
+        )
+        for k in order
+    ]
 
 
-def _fit_log_envelope(
-    t: NDArray[np.float64], e: NDArray[np.float64]
+def fit_log_envelope(
+    t: NDArray[np.float64], e: NDArray[np.float64], *, min_points: int = 8
 ) -> tuple[float, float, float]:
-    t = np.asarray(t, dtype=np.float64)
-    e = np.asarray(e, dtype=np.float64)
+    """Least-squares line ln e = c + m t: (c, m, R²), NaNs with fewer than min_points samples."""
+    # float64 on purpose: the log-fit is the numerically sensitive step
+    t = as_f64(t)
+    e = as_f64(e)
 
-    if t.size < 8:
+    if t.size < max(3, int(min_points)):
         return float("nan"), float("nan"), float("nan")
 
     eps = np.finfo(float).eps
@@ -214,7 +696,7 @@ def _fit_log_envelope(
 
 
 def _choose_fit_end(
-    e: NDArray[np.float64],
+    e: NDArray[np.floating],
     fs: float,
     *,
     i0: int,
@@ -226,31 +708,97 @@ def _choose_fit_end(
     Choose i1 to avoid fitting deep into noise.
     i1 is min(i0 + fit_max_s, first index where envelope falls near noise floor, n).
     """
+    return int(
+        choose_fit_ends(
+            e,
+            fs,
+            np.array([i0]),
+            fit_max_s=fit_max_s,
+            noise_tail_s=noise_tail_s,
+            noise_mult=noise_mult,
+        )[0]
+    )
+
+
+def choose_fit_ends(
+    e: NDArray[np.floating],
+    fs: float,
+    i0s: NDArray[np.integer],
+    *,
+    fit_max_s: float,
+    noise_tail_s: float,
+    noise_mult: float,
+) -> NDArray[np.int64]:
+    """_choose_fit_end for many start indices (noise floor and crossings computed once)."""
     fs = float(fs)
     n = int(e.size)
-    if n <= i0 + 16:
-        return n
+    i0s = np.asarray(i0s, dtype=np.int64)
 
-    i1_cap = min(n, i0 + int(round(max(0.05, float(fit_max_s)) * fs)))
+    i1_cap = np.minimum(n, i0s + int(round(max(0.05, float(fit_max_s)) * fs)))
 
     tail = int(round(max(0.05, float(noise_tail_s)) * fs))
     tail = min(tail, n)
     noise_level = float(np.median(e[n - tail :])) if tail >= 8 else float(np.median(e))
     thresh = float(noise_mult) * max(noise_level, np.finfo(float).eps)
 
-    # find first crossing below threshold after i0 (up to cap)
-    seg = e[i0:i1_cap]
-    below = np.where(seg <= thresh)[0]
-    if below.size > 0:
-        i1 = i0 + int(below[0])
-        # keep at least some samples
-        return max(i0 + 16, i1)
+    # first crossing below threshold at or after i0 (if before the cap);
+    # keep at least some samples
+    below = np.flatnonzero(e <= thresh)
+    if below.size:
+        first = below[np.minimum(np.searchsorted(below, i0s), below.size - 1)]
+        first = np.where(first >= i0s, first, n)
+    else:
+        first = np.full_like(i0s, n)
+    i1 = np.where(first < i1_cap, np.maximum(i0s + 16, first), i1_cap)
+
+    return np.where(n <= i0s + 16, n, i1)
+
+
+def log_prefix_sums(
+    ln: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """Prefix sums of ln, k*ln and ln² (k = sample index) for log_fit_r2_prefix."""
+    k = np.arange(ln.size, dtype=np.float64)
+    p0 = np.concatenate(([0.0], np.cumsum(ln)))
+    p1 = np.concatenate(([0.0], np.cumsum(k * ln)))
+    p2 = np.concatenate(([0.0], np.cumsum(ln * ln)))
+    return p0, p1, p2
+
+
+def log_fit_r2_prefix(
+    prefix: tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]],
+    i0s: NDArray[np.integer],
+    i1s: NDArray[np.integer],
+) -> NDArray[np.float64]:
+    """
+    R² of the straight-line fit of ln[i0:i1] for many (i0, i1) at once, from
+    the prefix sums of ln (O(1) per window). Good to ~1e-9; used to screen
+    candidates that fit_log_envelope then fits exactly.
+    """
+    p0, p1, p2 = prefix
+
+    i0s = np.asarray(i0s, dtype=np.int64)
+    i1s = np.asarray(i1s, dtype=np.int64)
+    size = (i1s - i0s).astype(np.float64)
+
+    s0 = p0[i1s] - p0[i0s]
+    s1 = p1[i1s] - p1[i0s] - i0s * s0  # sum of (k - i0) * ln
+    s2 = p2[i1s] - p2[i0s]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sxx = size * (size * size - 1.0) / 12.0
+        sxy = s1 - 0.5 * (size - 1.0) * s0
+        syy = s2 - s0 * s0 / size
+        r2 = sxy * sxy / (sxx * syy)
+    return np.where((syy > 0) & (size >= 8), r2, np.nan)
+
 
-    return i1_cap
+# slack on the prefix-sum R² screen (it can round just below the exact fit's R²)
+R2_SCREEN_TOL = 1e-6
 
 
-def _estimate_zeta_envelope_auto(
-    y: NDArray[np.float64],
+def _estimate_zeta_from_envelope(
+    e: NDArray[np.floating],
     fs: float,
     *,
     fn_hz: float,
@@ -263,14 +811,11 @@ def _estimate_zeta_envelope_auto(
 ) -> tuple[float, float, float, float, int, int]:
     fs = float(fs)
     fn_hz = float(fn_hz)
-    y = np.asarray(y, dtype=np.float64)
 
-    n = y.size
+    n = e.size
     if n < int(0.2 * fs):
         return float("nan"), float("nan"), float("nan"), float("nan"), 0, n
 
-    e = _env(y)
-
     i0_floor = int(round(max(0.0, float(transient_s)) * fs))
     i0_min = int(round(max(float(transient_s), float(established_min_s)) * fs))
 
@@ -281,20 +826,25 @@ def _estimate_zeta_envelope_auto(
 
     best: tuple[float, int, int, float, float] | None = None  # (r2, i0, i1, c, m)
 
-    for i0 in range(i0_floor, i0_min + 1, step):
-        i1 = _choose_fit_end(
-            e,
-            fs,
-            i0=i0,
-            fit_max_s=fit_max_s,
-            noise_tail_s=noise_tail_s,
-            noise_mult=noise_mult,
-        )
-        if i1 - i0 < 32:
-            continue
+    # First start i0 (5 ms steps) whose fit reaches established_r2_min. All
+    # starts are screened at once with prefix sums; only plausible ones are
+    # fitted exactly, in order, so the pick matches an exact scan.
+    i0s = np.arange(i0_floor, i0_min + 1, step)
+    i1s = choose_fit_ends(
+        e,
+        fs,
+        i0s,
+        fit_max_s=fit_max_s,
+        noise_tail_s=noise_tail_s,
+        noise_mult=noise_mult,
+    )
+    ln = np.log(np.clip(as_f64(e), np.finfo(float).eps, None))
+    r2_screen = log_fit_r2_prefix(log_prefix_sums(ln), i0s, i1s)
+    candidates = (i1s - i0s >= 32) & (r2_screen >= established_r2_min - R2_SCREEN_TOL)
 
+    for i0, i1 in zip(i0s[candidates].tolist(), i1s[candidates].tolist()):
         t = (np.arange(i0, i1, dtype=np.float64) - float(i0)) / fs
-        c, m, r2 = _fit_log_envelope(t, e[i0:i1])
+        c, m, r2 = fit_log_envelope(t, e[i0:i1])
         if not np.isfinite(r2):
             continue
         if r2 >= established_r2_min:
@@ -312,7 +862,7 @@ def _estimate_zeta_envelope_auto(
             noise_mult=noise_mult,
         )
         t = (np.arange(i0, i1, dtype=np.float64) - float(i0)) / fs
-        c, m, r2 = _fit_log_envelope(t, e[i0:i1])
+        c, m, r2 = fit_log_envelope(t, e[i0:i1])
         best = (float(r2), int(i0), int(i1), float(c), float(m))
 
     r2_fit, i0_fit, i1_fit, c_fit, m_fit = best
@@ -0,0 +1,104 @@
+# src/wav_to_freq/analysis/preview.py
+"""
+Interactive single-hit preview.
+
+Keeps one recording's hit windows in memory and re-runs only the damping fit
+of one hit when a fit knob changes. The band-passed envelope of a hit depends
+only on settle_s / ring_s / fmin_hz / fmax_hz and is cached, so editing
+transient_s, established_min_s, established_r2_min, fit_max_s, noise_tail_s or
+noise_mult costs one fit_hit_envelope call (a few ms).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Sequence
+
+from wav_to_freq.analysis.modal import HitEnvelope, fit_hit_envelope, hit_envelope
+from wav_to_freq.domain.enums import StereoChannel
+from wav_to_freq.domain.types import HitModalResult, HitWindow, StereoWav
+from wav_to_freq.io.hit_detection import prepare_hits
+
+
+class HitPreview:
+    def __init__(self, stereo: StereoWav, windows: Sequence[HitWindow]) -> None:
+        self.stereo = stereo
+        self.windows = list(windows)
+        self._envelopes: dict[tuple[int, float, float, float, float], HitEnvelope] = {}
+
+    @classmethod
+    def load(
+        cls,
+        wav_path: str | Path,
+        *,
+        hammer_channel: StereoChannel = StereoChannel.UNKNOWN,
+        pre_s: float = 0.05,
+        post_s: float = 1.50,
+        min_separation_s: float = 0.30,
+        threshold_sigma: float = 8.0,
+    ) -> HitPreview:
+        stereo, windows, _ = prepare_hits(
+            wav_path,
+            hammer_channel=hammer_channel,
+            pre_s=pre_s,
+            post_s=post_s,
+            min_separation_s=min_separation_s,
+            threshold_sigma=threshold_sigma,
+        )
+        return cls(stereo, windows)
+
+    def __len__(self) -> int:
+        return len(self.windows)
+
+    def envelope(
+        self,
+        i: int,
+        *,
+        settle_s: float,
+        ring_s: float,
+        fmin_hz: float,
+        fmax_hz: float,
+    ) -> HitEnvelope:
+        """Envelope of hit i (0-based), computed once per band/segment setting."""
+        key = (int(i), float(settle_s), float(ring_s), float(fmin_hz), float(fmax_hz))
+        env = self._envelopes.get(key)
+        if env is None:
+            # only the current band setting is worth keeping
+            self._envelopes = {k: v for k, v in self._envelopes.items() if k[1:] == key[1:]}
+            env = hit_envelope(
+                self.windows[i],
+                self.stereo.fs,
+                settle_s=settle_s,
+                ring_s=ring_s,
+                fmin_hz=fmin_hz,
+                fmax_hz=fmax_hz,
+            )
+            self._envelopes[key] = env
+        return env
+
+    def evaluate(
+        self,
+        i: int,
+        *,
+        settle_s: float,
+        ring_s: float,
+        fmin_hz: float,
+        fmax_hz: float,
+        transient_s: float,
+        established_min_s: float,
+        established_r2_min: float,
+        fit_max_s: float,
+        noise_tail_s: float,
+        noise_mult: float,
+    ) -> HitModalResult:
+        """Same result as analyze_hit for hit i, reusing the cached envelope."""
+        env = self.envelope(i, settle_s=settle_s, ring_s=ring_s, fmin_hz=fmin_hz, fmax_hz=fmax_hz)
+        return fit_hit_envelope(
+            env,
+            transient_s=transient_s,
+            established_min_s=established_min_s,
+            established_r2_min=established_r2_min,
+            fit_max_s=fit_max_s,
+            noise_tail_s=noise_tail_s,
+            noise_mult=noise_mult,
+        )
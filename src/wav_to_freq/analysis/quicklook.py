@@ -0,0 +1,113 @@
+# src/wav_to_freq/analysis/quicklook.py
+"""
+Deadline-bounded first look at a recording's hits (on-site triage).
+
+  windows -> bit-reversed hit order (every prefix is spread over the recording)
+    -> per hit, while the next one fits before the deadline:
+       anti-alias low-pass + decimate to ~_OVERSAMPLE x fmax_hz
+       -> fast tier (analysis.fast: log decrement / half-power bandwidth)
+
+The table is provisional: a subset of the hits, cheaper estimators than
+the envelope fit. pipeline.run_full_report(mode="quicklook") writes it and
+then runs the full analysis in the background.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, replace
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from wav_to_freq.analysis.fast import fast_hit_estimate
+from wav_to_freq.domain.results import ResultTable
+from wav_to_freq.domain.types import HitModalResult, HitWindow
+from wav_to_freq.dsp.filters import decimate
+from wav_to_freq.dsp.stats import as_f64
+
+# decimated rate, in multiples of fmax_hz
+_OVERSAMPLE = 8.0
+
+
+@dataclass(frozen=True)
+class Quicklook:
+    table: ResultTable  # analyzed hits, in hit order
+    n_hits: int  # hits detected
+    decimate: int
+    elapsed_s: float
+
+    @property
+    def complete(self) -> bool:
+        return len(self.table) == self.n_hits
+
+
+def quicklook_hits(
+    windows: Sequence[HitWindow],
+    fs: float,
+    *,
+    deadline: float,
+    settle_s: float = 0.010,
+    ring_s: float = 1.0,
+    fmin_hz: float = 0.5,
+    fmax_hz: float = 50.0,
+    transient_s: float = 0.20,
+    established_min_s: float = 0.40,
+    established_r2_min: float = 0.95,
+    fit_max_s: float = 0.80,
+    noise_tail_s: float = 0.20,
+    noise_mult: float = 3.0,
+) -> Quicklook:
+    """
+    Fast-tier estimates of as many hits as fit before deadline (a
+    time.perf_counter() value): a hit is started only if the mean time of the
+    previous ones still fits. At least one hit is analyzed unless the
+    deadline has already passed.
+    """
+    t0 = time.perf_counter()
+    fs = float(fs)
+    q = max(1, int(fs // (_OVERSAMPLE * float(fmax_hz))))
+    fs_q = fs / q
+
+    rows: list[HitModalResult] = []
+    for i in spread_order(len(windows)):
+        now = time.perf_counter()
+        per_hit = (now - t0) / len(rows) if rows else 0.0
+        if now + per_hit > deadline:
+            break
+        w = windows[i]
+        wq = replace(w, accel=decimate(as_f64(w.accel), fs, q)) if q > 1 else w
+        _, r = fast_hit_estimate(
+            wq,
+            fs_q,
+            settle_s=settle_s,
+            ring_s=ring_s,
+            fmin_hz=fmin_hz,
+            fmax_hz=fmax_hz,
+            transient_s=transient_s,
+            established_min_s=established_min_s,
+            established_r2_min=established_r2_min,
+            fit_max_s=fit_max_s,
+            noise_tail_s=noise_tail_s,
+            noise_mult=noise_mult,
+        )
+        rows.append(r)
+
+    rows.sort(key=lambda r: r.hit_id)
+    return Quicklook(
+        table=ResultTable.from_results(rows),
+        n_hits=len(windows),
+        decimate=q,
+        elapsed_s=time.perf_counter() - t0,
+    )
+
+
+def spread_order(n: int) -> NDArray[np.int64]:
+    """0..n-1 by bit-reversed value (0, n/2, n/4, 3n/4, ... for n a power of 2)."""
+    idx = np.arange(int(n), dtype=np.int64)
+    bits = max(1, int(n - 1).bit_length())
+    rev = np.zeros_like(idx)
+    for b in range(bits):
+        rev |= ((idx >> b) & 1) << (bits - 1 - b)
+    return idx[np.argsort(rev, kind="stable")]
@@ -0,0 +1,328 @@
+# src/wav_to_freq/analysis/rfp.py
+"""
+Rational-fraction-polynomial (RFP) modal fit of FRFs.
+
+Over the band [fmin, fmax] each FRF is fitted as one ratio of polynomials
+
+    H(ω) ≈ B(z) / A(z),   z = (ω - ωc) / ωh ∈ [-1, 1]
+
+(ωc, ωh the band center and half width), A of order n_poles with its
+leading coefficient fixed to 1, B of the same order. Both are expanded on
+Chebyshev polynomials of z, which are near-orthogonal on the band; the
+numerator basis is additionally orthonormalized on the actual frequency
+grid (QR, the Forsythe construction), which lets B be eliminated from the
+linearized least squares
+
+    B(z_i) - H_i A(z_i) = H_i T_n(z_i)   (in the unknown coefficients)
+
+so that only the n_poles denominator coefficients are solved per FRF.
+That problem is solved for all FRFs at once (one batched pseudo-inverse);
+nothing is iterative.
+
+Each root z_p of A is a pole s_p = j(ωc + ωh z_p), with residue
+j ωh B(z_p) / A'(z_p). The model has complex coefficients: every pole is
+fitted locally, and the mirror poles (and modes outside the band) are
+absorbed by the spare poles beyond n_modes. Physical poles are those inside
+the band, decaying and less damped than _ZETA_MAX (after the window
+correction below); the n_modes with the highest resonance peak
+|residue| / |Re s_p| are kept.
+
+A few poles cannot follow a whole recording band (1 Hz to kHz around
+resonances a fraction of a Hz wide), so fit_rfp_peaks fits a sub-band
+around each of the n_modes largest response peaks instead (peaks closer
+than their sub-bands share one fit), and fit_rfp_hits goes through it.
+
+For impact tests the FRFs come from the force / exponential windows of
+analysis.impact (ImpactWindowing); the exponential window shifts every pole
+by -1 / tau, which is added back exactly.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+from numpy.polynomial import chebyshev as cheb
+from numpy.typing import NDArray
+
+from scipy.signal import find_peaks
+
+from wav_to_freq.analysis.impact import ImpactWindowing, same_length_windows
+from wav_to_freq.domain.types import HitWindow
+
+# poles more damped than this are treated as noise (as analysis.era)
+_ZETA_MAX = 0.5
+# sub-band of fit_rfp_peaks: the peak +- this fraction of its frequency,
+_BAND_REL = 0.3
+# widened to at least this many bins per unknown of its fit
+_BINS_PER_UNKNOWN = 3
+
+
+@dataclass(frozen=True)
+class RfpModes:
+    """Modes of a stack of FRFs, by decreasing resonance peak; NaN where fewer were found."""
+
+    fn_hz: NDArray[np.float64]  # (n_frf, n_modes)
+    zeta: NDArray[np.float64]  # (n_frf, n_modes)
+    residue: NDArray[np.complex128]  # (n_frf, n_modes), per rad/s pole
+    r2: NDArray[np.float64]  # (n_frf, n_modes), of the fit (band) each mode came from
+
+    @property
+    def n_found(self) -> NDArray[np.int64]:
+        return np.sum(np.isfinite(self.fn_hz), axis=-1)
+
+
+def fit_rfp(
+    f_hz: NDArray[np.floating],
+    h: NDArray[np.complexfloating],
+    *,
+    fmin_hz: float,
+    fmax_hz: float,
+    n_modes: int = 1,
+    n_poles: int | None = None,
+    weights: NDArray[np.floating] | None = None,
+    exp_tau_s: float | None = None,
+) -> RfpModes:
+    """
+    Fit every FRF of h ((n_freq,) or (n_frf, n_freq), on the grid f_hz)
+    over the single band [fmin_hz, fmax_hz].
+
+    The band must be narrow enough for n_poles to follow: a few modes and a
+    few of their half-power widths either side (fit_rfp_peaks picks such
+    bands). Over a whole recording band every fit comes out poor (R² < 0.5
+    on clean data). n_poles defaults to n_modes + 4 (spare poles for the
+    mirror poles and out-of-band modes). weights (n_freq,) scale each bin's
+    equation, e.g. the coherence. exp_tau_s: the exponential response
+    window, if any.
+    """
+    f = np.asarray(f_hz, dtype=np.float64)
+    h = np.atleast_2d(np.asarray(h, dtype=np.complex128))
+    n_modes = max(1, int(n_modes))
+    n_poles = int(n_poles) if n_poles is not None else n_modes + 4
+    n_frf = h.shape[0]
+
+    band = (f >= float(fmin_hz)) & (f <= float(fmax_hz))
+    out = _nan_modes(n_frf, n_modes)
+    # 2 n_poles + 1 unknowns
+    if np.count_nonzero(band) < 2 * n_poles + 2 or n_poles < 1:
+        return out
+
+    w_c = np.pi * (f[band][0] + f[band][-1])
+    w_h = np.pi * (f[band][-1] - f[band][0])
+    z = (2.0 * np.pi * f[band] - w_c) / w_h
+    t = cheb.chebvander(z, n_poles)  # (n_band, n_poles + 1)
+    wt = np.ones(z.size) if weights is None else np.asarray(weights, dtype=np.float64)[band]
+
+    hb = h[:, band]
+    ok = np.all(np.isfinite(hb), axis=1) & np.any(hb != 0, axis=1)
+    if not ok.any():
+        return out
+    hb = hb[ok]
+    wh = wt * hb  # (k, n_band)
+
+    # numerator basis, orthonormal on the grid: P = Qp Rp
+    qp, rp = np.linalg.qr(wt[:, None] * t)
+    d = -wh[:, :, None] * t[None, :, :n_poles]  # (k, n_band, n_poles)
+    r = wh * t[:, n_poles]
+
+    # eliminate B: project onto the complement of the numerator space
+    m = d - qp @ (qp.T @ d)
+    y = r - (r @ qp) @ qp.T
+    a = (np.linalg.pinv(m) @ y[:, :, None])[:, :, 0]
+    a = np.concatenate([a, np.ones((a.shape[0], 1))], axis=1)  # (k, n_poles + 1)
+    b_orth = (r - np.einsum("kfn,kn->kf", d, a[:, :n_poles])) @ qp
+    b = np.linalg.solve(rp, b_orth.T).T  # Chebyshev coefficients of B
+
+    fit = (b @ t.T) / (a @ t.T)
+    sse = np.sum(np.abs(wt * (hb - fit)) ** 2, axis=1)
+    sst = np.sum(np.abs(wt * (hb - hb.mean(axis=1, keepdims=True))) ** 2, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out.r2[ok] = (1.0 - sse / sst)[:, None]
+
+    shift = 1.0 / float(exp_tau_s) if exp_tau_s is not None else 0.0
+    w_lo, w_hi = 2.0 * np.pi * float(fmin_hz), 2.0 * np.pi * float(fmax_hz)
+    for row, a_k, b_k in zip(np.flatnonzero(ok), a, b):
+        zp = cheb.chebroots(a_k)
+        sp = 1j * (w_c + w_h * zp)
+        res = 1j * w_h * cheb.chebval(zp, b_k) / cheb.chebval(zp, cheb.chebder(a_k))
+
+        # decaying once the window's damping is removed (the slower poles are
+        # spurious), and not so damped that they only patch the fit's baseline
+        with np.errstate(divide="ignore", invalid="ignore"):
+            zeta = -(sp.real + shift) / np.abs(sp + shift)
+        phys = (zeta > 0) & (zeta < _ZETA_MAX) & (sp.imag >= w_lo) & (sp.imag <= w_hi)
+        if not phys.any():
+            continue
+        sp, res = sp[phys], res[phys]
+        keep = np.argsort(np.abs(res) / sp.real)[:n_modes]  # decreasing |res| / |Re s|
+        s_true = sp[keep] + shift
+        wn = np.abs(s_true)
+        out.fn_hz[row, : keep.size] = wn / (2.0 * np.pi)
+        out.zeta[row, : keep.size] = -s_true.real / wn
+        out.residue[row, : keep.size] = res[keep]
+    return out
+
+
+def rfp_bands(
+    f_hz: NDArray[np.floating],
+    power: NDArray[np.floating],
+    *,
+    fmin_hz: float,
+    fmax_hz: float,
+    n_modes: int,
+    n_poles: int | None = None,
+) -> list[tuple[float, float, int]]:
+    """
+    Sub-bands (lo_hz, hi_hz, modes in it) around the n_modes largest local
+    peaks (6 dB prominent) of power in [fmin_hz, fmax_hz], e.g. the
+    response's mean auto-spectrum. Each peak fp gets fp +- _BAND_REL fp,
+    widened to _BINS_PER_UNKNOWN bins per unknown of a one-mode fit and
+    clipped to the band; overlapping sub-bands are merged.
+    """
+    f = np.asarray(f_hz, dtype=np.float64)
+    p = np.asarray(power, dtype=np.float64)
+    band = np.flatnonzero((f >= float(fmin_hz)) & (f <= float(fmax_hz)) & np.isfinite(p))
+    if band.size < 3 or n_modes < 1:
+        return []
+
+    db = 10.0 * np.log10(p[band] + 1e-300)
+    peaks, _ = find_peaks(db, prominence=6.0)
+    if peaks.size == 0:
+        peaks = np.array([int(np.argmax(db))])
+    peaks = np.sort(peaks[np.argsort(db[peaks])[::-1]][: int(n_modes)])
+
+    df = float(f[1] - f[0])
+    n_unknowns = 2 * (int(n_poles) if n_poles is not None else 5) + 1
+    min_half = 0.5 * _BINS_PER_UNKNOWN * n_unknowns * df
+
+    spans: list[list[float]] = []
+    for k in peaks:
+        fp = float(f[band[k]])
+        half = max(_BAND_REL * fp, min_half)
+        lo, hi = max(float(fmin_hz), fp - half), min(float(fmax_hz), fp + half)
+        if spans and lo <= spans[-1][1]:
+            spans[-1][1] = max(spans[-1][1], hi)
+            spans[-1][2] += 1
+        else:
+            spans.append([lo, hi, 1])
+    return [(lo, hi, int(k)) for lo, hi, k in spans]
+
+
+def fit_rfp_peaks(
+    f_hz: NDArray[np.floating],
+    h: NDArray[np.complexfloating],
+    power: NDArray[np.floating],
+    *,
+    fmin_hz: float,
+    fmax_hz: float,
+    n_modes: int = 1,
+    n_poles: int | None = None,
+    weights: NDArray[np.floating] | None = None,
+    exp_tau_s: float | None = None,
+) -> RfpModes:
+    """
+    fit_rfp over each sub-band of rfp_bands(f_hz, power, ...), the modes of
+    all sub-bands ranked together by resonance peak. n_poles applies per
+    sub-band (default: its modes + 4).
+    """
+    h = np.atleast_2d(np.asarray(h, dtype=np.complex128))
+    n_modes = max(1, int(n_modes))
+    parts = [
+        fit_rfp(
+            f_hz,
+            h,
+            fmin_hz=lo,
+            fmax_hz=hi,
+            n_modes=k,
+            n_poles=n_poles,
+            weights=weights,
+            exp_tau_s=exp_tau_s,
+        )
+        for lo, hi, k in rfp_bands(f_hz, power, fmin_hz=fmin_hz, fmax_hz=fmax_hz, n_modes=n_modes, n_poles=n_poles)
+    ]
+    if not parts:
+        return _nan_modes(h.shape[0], n_modes)
+
+    fn = np.concatenate([p.fn_hz for p in parts], axis=1)
+    zeta = np.concatenate([p.zeta for p in parts], axis=1)
+    residue = np.concatenate([p.residue for p in parts], axis=1)
+    r2 = np.concatenate([p.r2 for p in parts], axis=1)
+
+    # the ranking of fit_rfp: |res| / |Re s| of the windowed pole
+    shift = 1.0 / float(exp_tau_s) if exp_tau_s is not None else 0.0
+    with np.errstate(invalid="ignore"):
+        peak = np.abs(residue) / (2.0 * np.pi * fn * zeta + shift)
+    order = np.argsort(np.where(np.isfinite(peak), -peak, np.inf), axis=1)
+    pad = max(0, n_modes - fn.shape[1])
+
+    def pick(a: NDArray, fill: complex) -> NDArray:
+        a = np.take_along_axis(a, order, axis=1)[:, :n_modes]
+        return np.pad(a, ((0, 0), (0, pad)), constant_values=fill)
+
+    return RfpModes(
+        fn_hz=pick(fn, np.nan),
+        zeta=pick(zeta, np.nan),
+        residue=pick(residue, np.nan + 0j),
+        r2=pick(r2, np.nan),
+    )
+
+
+def fit_rfp_hits(
+    windows: Sequence[HitWindow],
+    fs: float,
+    *,
+    fmin_hz: float,
+    fmax_hz: float,
+    n_modes: int = 1,
+    n_poles: int | None = None,
+    force_window_s: float = 0.010,
+    exp_end: float | None = 0.01,
+    pad: int = 1,
+) -> tuple[list[HitWindow], RfpModes]:
+    """
+    RFP fit of every hit's own FRF (A / F of its windowed spectra), all
+    hits solved together (fit_rfp_peaks: one fit per sub-band around the
+    peaks of the hits' mean response auto-spectrum). Returns the hits
+    fitted (those of the most common window length, see analysis.impact) and
+    their modes.
+
+    Unlike a half-power read-off, the fit needs no zero-padding: it is
+    global over each sub-band.
+    """
+    windows = same_length_windows(windows)
+    if not windows:
+        return [], _nan_modes(0, n_modes)
+
+    win = ImpactWindowing.for_windows(windows, fs, force_window_s=force_window_s, exp_end=exp_end, pad=pad)
+    f = win.f_hz
+    band = np.flatnonzero((f >= float(fmin_hz)) & (f <= float(fmax_hz)))
+    sl = slice(int(band[0]), int(band[-1]) + 1) if band.size else slice(0, 0)
+
+    hs: list[NDArray[np.complex128]] = []
+    power = np.zeros(f[sl].size)
+    for _, F, A in win.chunks(windows):
+        F, A = F[:, sl], A[:, sl]
+        power += np.sum(np.abs(A) ** 2, axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            hs.append(np.where(F != 0, A / F, np.nan + 0j))
+    return windows, fit_rfp_peaks(
+        f[sl],
+        np.concatenate(hs),
+        power,
+        fmin_hz=fmin_hz,
+        fmax_hz=fmax_hz,
+        n_modes=n_modes,
+        n_poles=n_poles,
+        exp_tau_s=win.exp_tau_s,
+    )
+
+
+def _nan_modes(n_frf: int, n_modes: int) -> RfpModes:
+    n_modes = max(1, int(n_modes))
+    return RfpModes(
+        fn_hz=np.full((n_frf, n_modes), np.nan),
+        zeta=np.full((n_frf, n_modes), np.nan),
+        residue=np.full((n_frf, n_modes), np.nan + 0j),
+        r2=np.full((n_frf, n_modes), np.nan),
+    )
@@ -0,0 +1,398 @@
+# src/wav_to_freq/analysis/sweep.py
+"""
+Damping-fit parameter sweep / sensitivity analysis.
+
+Re-running analyze_all_hits for every point of a transient_s x
+established_min_s x established_r2_min x noise_mult grid redoes the
+band-pass, Hilbert envelope and every fit per point. Here, per hit:
+
+  hit_envelope (once) -> log envelope + prefix sums (once)
+    -> for each (transient_s, noise_mult): fit ends of all candidate starts
+       and their screening R² (one vectorized pass)
+    -> for all (established_min_s, established_r2_min) at once: first
+       candidate start passing the screen, verified with an exact fit
+
+Exact fits are cached per (start, end) window, and most grid points share
+windows, so a grid costs little more than one analyze_all_hits. Every grid
+point gives the same HitModalResult as analyze_all_hits with those knobs.
+
+Usage:
+    python -m wav_to_freq.analysis.sweep rec.wav --out sweep/ \
+        --transient 0.1,0.2,0.3 --established-min 0.3,0.4,0.6 \
+        --r2-min 0.9,0.95,0.98 --noise-mult 2,3,4
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import ClassVar, Iterator, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from wav_to_freq.analysis.modal import (
+    R2_SCREEN_TOL,
+    HitEnvelope,
+    choose_fit_ends,
+    envelope_result,
+    fit_log_envelope,
+    hit_envelope,
+    log_fit_r2_prefix,
+    log_prefix_sums,
+)
+from wav_to_freq.domain.types import HitModalResult, HitWindow
+from wav_to_freq.dsp.stats import as_f64
+
+_PER_POINT_FIELDS = (
+    "zeta",
+    "env_fit_r2",
+    "env_log_c",
+    "env_log_m",
+    "fit_t0_s",
+    "fit_t1_s",
+)
+
+
+@dataclass(frozen=True)
+class SweepGrid:
+    """Values of each swept knob; fit_max_s and noise_tail_s stay fixed."""
+
+    AXES: ClassVar[tuple[str, ...]] = (
+        "transient_s",
+        "established_min_s",
+        "established_r2_min",
+        "noise_mult",
+    )
+
+    transient_s: tuple[float, ...] = (0.10, 0.20, 0.30)
+    established_min_s: tuple[float, ...] = (0.30, 0.40, 0.60)
+    established_r2_min: tuple[float, ...] = (0.90, 0.95, 0.98)
+    noise_mult: tuple[float, ...] = (2.0, 3.0, 4.0)
+    fit_max_s: float = 0.80
+    noise_tail_s: float = 0.20
+
+    def __post_init__(self) -> None:
+        for axis in self.AXES:
+            values = tuple(float(v) for v in getattr(self, axis))
+            if not values:
+                raise ValueError(f"SweepGrid.{axis} is empty")
+            object.__setattr__(self, axis, values)
+
+    @property
+    def shape(self) -> tuple[int, int, int, int]:
+        return (
+            len(self.transient_s),
+            len(self.established_min_s),
+            len(self.established_r2_min),
+            len(self.noise_mult),
+        )
+
+    def points(self) -> Iterator[tuple[tuple[int, ...], dict[str, float]]]:
+        """(grid index, knob values) for every point, in C order."""
+        for idx in np.ndindex(*self.shape):
+            yield idx, {axis: getattr(self, axis)[k] for axis, k in zip(self.AXES, idx)}
+
+
+@dataclass(frozen=True)
+class SweepPointSummary:
+    transient_s: float
+    established_min_s: float
+    established_r2_min: float
+    noise_mult: float
+    n_hits: int
+    n_accepted: int
+    zeta_median: float
+    zeta_p25: float
+    zeta_p75: float
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """
+    Per-hit x per-grid-point fit results.
+
+    Per-point arrays have shape (n_hits, *grid.shape); reject_reason uses ""
+    for accepted fits (as ResultTable does).
+    """
+
+    grid: SweepGrid
+    hit_id: NDArray[np.int64]
+    hit_index: NDArray[np.int64]
+    t0_s: NDArray[np.float64]
+    t1_s: NDArray[np.float64]
+    fn_hz: NDArray[np.float64]
+    snr_db: NDArray[np.float64]
+    zeta: NDArray[np.float64]
+    env_fit_r2: NDArray[np.float64]
+    env_log_c: NDArray[np.float64]
+    env_log_m: NDArray[np.float64]
+    fit_t0_s: NDArray[np.float64]
+    fit_t1_s: NDArray[np.float64]
+    reject_reason: NDArray[np.str_]
+
+    @property
+    def n_hits(self) -> int:
+        return int(self.hit_id.size)
+
+    @property
+    def accepted(self) -> NDArray[np.bool_]:
+        return self.reject_reason == ""
+
+    def result(self, i: int, idx: Sequence[int]) -> HitModalResult:
+        """HitModalResult of hit i (0-based) at grid index idx."""
+        at = (i, *idx)
+        t0, t1 = float(self.fit_t0_s[at]), float(self.fit_t1_s[at])
+        return HitModalResult(
+            hit_id=int(self.hit_id[i]),
+            hit_index=int(self.hit_index[i]),
+            t0_s=float(self.t0_s[i]),
+            t1_s=float(self.t1_s[i]),
+            fn_hz=float(self.fn_hz[i]),
+            zeta=float(self.zeta[at]),
+            snr_db=float(self.snr_db[i]),
+            env_fit_r2=float(self.env_fit_r2[at]),
+            env_log_c=float(self.env_log_c[at]),
+            env_log_m=float(self.env_log_m[at]),
+            reject_reason=str(self.reject_reason[at]) or None,
+            fit_t0_s=t0 if np.isfinite(t0) else None,
+            fit_t1_s=t1 if np.isfinite(t1) else None,
+        )
+
+    def zeta_quantiles(self, q: Sequence[float]) -> NDArray[np.float64]:
+        """Quantiles of accepted ζ over hits, shape (len(q), *grid.shape) (NaN if none)."""
+        z = np.where(self.accepted, self.zeta, np.nan)
+        out = np.full((len(q), *self.grid.shape), np.nan)
+        has = np.any(self.accepted, axis=0)
+        if np.any(has):
+            out[:, has] = np.nanquantile(z[:, has], q, axis=0)
+        return out
+
+    def summary(self) -> list[SweepPointSummary]:
+        """One row per grid point: accepted count and ζ median / quartiles."""
+        n_acc = self.accepted.sum(axis=0)
+        p25, p50, p75 = self.zeta_quantiles((0.25, 0.5, 0.75))
+        return [
+            SweepPointSummary(
+                **knobs,
+                n_hits=self.n_hits,
+                n_accepted=int(n_acc[idx]),
+                zeta_median=float(p50[idx]),
+                zeta_p25=float(p25[idx]),
+                zeta_p75=float(p75[idx]),
+            )
+            for idx, knobs in self.grid.points()
+        ]
+
+    def write_csv(self, path: str | Path) -> Path:
+        """Tidy table: one row per (hit, grid point), knob columns first."""
+        path = Path(path)
+        names = [f.name for f in fields(HitModalResult)]
+        with path.open("w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow([*SweepGrid.AXES, *names])
+            for idx, knobs in self.grid.points():
+                for i in range(self.n_hits):
+                    r = self.result(i, idx)
+                    w.writerow([*knobs.values(), *("" if getattr(r, k) is None else getattr(r, k) for k in names)])
+        return path
+
+    def write_summary_csv(self, path: str | Path) -> Path:
+        path = Path(path)
+        rows = self.summary()
+        names = [f.name for f in fields(SweepPointSummary)]
+        with path.open("w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(names)
+            for row in rows:
+                w.writerow([getattr(row, k) for k in names])
+        return path
+
+
+def sweep_hits(
+    windows: Sequence[HitWindow],
+    fs: float,
+    grid: SweepGrid,
+    *,
+    settle_s: float = 0.010,
+    ring_s: float = 1.0,
+    fmin_hz: float = 0.5,
+    fmax_hz: float = 50.0,
+) -> SweepResult:
+    """Evaluate every grid point on every hit (envelopes computed once per hit)."""
+    envs = [
+        hit_envelope(w, fs, settle_s=settle_s, ring_s=ring_s, fmin_hz=fmin_hz, fmax_hz=fmax_hz)
+        for w in windows
+    ]
+    return sweep_envelopes(envs, grid)
+
+
+def sweep_envelopes(envs: Sequence[HitEnvelope], grid: SweepGrid) -> SweepResult:
+    shape = (len(envs), *grid.shape)
+    per_point = {k: np.full(shape, np.nan) for k in _PER_POINT_FIELDS}
+    reject = np.full(shape, "", dtype=object)
+
+    for h, env in enumerate(envs):
+        for idx, fit in _sweep_one(env, grid):
+            r = envelope_result(
+                env, fit, established_r2_min=grid.established_r2_min[idx[2]]
+            )
+            at = (h, *idx)
+            for k in _PER_POINT_FIELDS:
+                v = getattr(r, k)
+                per_point[k][at] = np.nan if v is None else v
+            reject[at] = r.reject_reason or ""
+
+    def _col(name: str, dtype: type) -> NDArray:
+        return np.asarray([getattr(e, name) for e in envs], dtype=dtype)
+
+    fs = np.asarray([e.fs for e in envs], dtype=np.float64)
+    t_start = _col("t_start", np.float64)
+    return SweepResult(
+        grid=grid,
+        hit_id=_col("hit_id", np.int64),
+        hit_index=_col("hit_index", np.int64),
+        t0_s=t_start + _col("start", np.float64) / fs if envs else t_start,
+        t1_s=t_start + _col("end", np.float64) / fs if envs else t_start,
+        fn_hz=_col("fn_hz", np.float64),
+        snr_db=_col("snr_db", np.float64),
+        reject_reason=reject.astype(str),
+        **per_point,
+    )
+
+
+def _sweep_one(
+    env: HitEnvelope, grid: SweepGrid
+) -> Iterator[tuple[tuple[int, int, int, int], tuple[float, float, float, float, int, int] | None]]:
+    """
+    (grid index, fit) for every grid point of one hit; fit as returned by
+    _estimate_zeta_from_envelope (None when the envelope itself is rejected).
+    """
+    if env.reject_reason is not None:
+        for idx, _ in grid.points():
+            yield idx, None
+        return
+
+    fs = float(env.fs)
+    e = env.env
+    n = int(e.size)
+    omega_n = 2.0 * np.pi * float(env.fn_hz)
+
+    if n < int(0.2 * fs):
+        for idx, _ in grid.points():
+            yield idx, (float("nan"), float("nan"), float("nan"), float("nan"), 0, n)
+        return
+
+    ln = np.log(np.clip(as_f64(e), np.finfo(float).eps, None))
+    prefix = log_prefix_sums(ln)
+    step = max(1, int(round(0.005 * fs)))
+    thr = np.asarray(grid.established_r2_min)
+
+    exact: dict[tuple[int, int], tuple[float, float, float]] = {}
+
+    def _exact(i0: int, i1: int) -> tuple[float, float, float]:
+        cmr = exact.get((i0, i1))
+        if cmr is None:
+            t = (np.arange(i0, i1, dtype=np.float64) - float(i0)) / fs
+            cmr = exact[(i0, i1)] = fit_log_envelope(t, e[i0:i1])
+        return cmr
+
+    def _fit(i0: int, i1: int, c: float, m: float, r2: float) -> tuple[float, float, float, float, int, int]:
+        return float(-m / (omega_n + 1e-12)), float(r2), float(c), float(m), int(i0), int(i1)
+
+    for a, transient_s in enumerate(grid.transient_s):
+        # same clamping as _estimate_zeta_from_envelope
+        i0_floor = max(0, min(int(round(max(0.0, transient_s) * fs)), n - 32))
+        i0_mins = np.asarray(
+            [
+                max(i0_floor, min(int(round(max(transient_s, est) * fs)), n - 32))
+                for est in grid.established_min_s
+            ],
+            dtype=np.int64,
+        )
+        # candidate starts of the largest established_min_s; smaller ones use a prefix
+        i0s = np.arange(i0_floor, int(i0_mins.max()) + 1, step)
+        n_cand = np.searchsorted(i0s, i0_mins, side="right")
+
+        for d, noise_mult in enumerate(grid.noise_mult):
+            i1_all = choose_fit_ends(
+                e,
+                fs,
+                np.concatenate((i0s, i0_mins)),
+                fit_max_s=grid.fit_max_s,
+                noise_tail_s=grid.noise_tail_s,
+                noise_mult=noise_mult,
+            )
+            i1s, i1_fallback = i1_all[: i0s.size], i1_all[i0s.size :]
+            r2_screen = log_fit_r2_prefix(prefix, i0s, i1s)
+
+            # (established_min_s, established_r2_min, candidate start)
+            ok = (
+                ((i1s - i0s) >= 32)[None, None, :]
+                & (r2_screen[None, None, :] >= (thr - R2_SCREEN_TOL)[None, :, None])
+                & (np.arange(i0s.size)[None, None, :] < n_cand[:, None, None])
+            )
+            for b, c_ in np.ndindex(ok.shape[0], ok.shape[1]):
+                fit = None
+                for k in np.flatnonzero(ok[b, c_]).tolist():
+                    c, m, r2 = _exact(int(i0s[k]), int(i1s[k]))
+                    if np.isfinite(r2) and r2 >= thr[c_]:
+                        fit = _fit(int(i0s[k]), int(i1s[k]), c, m, r2)
+                        break
+                if fit is None:
+                    i0, i1 = int(i0_mins[b]), int(i1_fallback[b])
+                    c, m, r2 = _exact(i0, i1)
+                    fit = _fit(i0, i1, c, m, r2)
+                yield (a, b, c_, d), fit
+
+
+def _parse_values(raw: str) -> tuple[float, ...]:
+    return tuple(float(v) for v in raw.split(",") if v.strip())
+
+
+def main() -> None:
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    from wav_to_freq.pipeline import run_sweep_report
+
+    default = SweepGrid()
+    ap = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    ap.add_argument("wav", type=Path)
+    ap.add_argument("--out", type=Path, required=True)
+    ap.add_argument("--transient", default=",".join(map(str, default.transient_s)))
+    ap.add_argument("--established-min", default=",".join(map(str, default.established_min_s)))
+    ap.add_argument("--r2-min", default=",".join(map(str, default.established_r2_min)))
+    ap.add_argument("--noise-mult", default=",".join(map(str, default.noise_mult)))
+    ap.add_argument("--fit-max", type=float, default=default.fit_max_s)
+    ap.add_argument("--noise-tail", type=float, default=default.noise_tail_s)
+    ap.add_argument("--fmin", type=float, default=1.0)
+    ap.add_argument("--fmax", type=float, default=2000.0)
+    ap.add_argument("--no-pdf", action="store_true", help="skip the PDF export")
+    args = ap.parse_args()
+
+    grid = SweepGrid(
+        transient_s=_parse_values(args.transient),
+        established_min_s=_parse_values(args.established_min),
+        established_r2_min=_parse_values(args.r2_min),
+        noise_mult=_parse_values(args.noise_mult),
+        fit_max_s=args.fit_max,
+        noise_tail_s=args.noise_tail,
+    )
+    art = run_sweep_report(
+        args.wav,
+        out_dir=args.out,
+        grid=grid,
+        fmin_hz=args.fmin,
+        fmax_hz=args.fmax,
+        export_pdf=not args.no_pdf,
+    )
+    print(f"{np.prod(grid.shape)} grid points -> {art.results_csv}")
+    print(f"report: {art.report_md}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+# src/wav_to_freq/batch/executor.py
+"""
+Stage-pipelined batch executor.
+
+run_full_report does decode -> detect -> analyze -> render -> write strictly in
+sequence, so across a batch the disk idles while the CPU analyzes and the CPU
+idles while the next file is decoded. Here every stage has its own worker
+threads and the stages are connected by bounded queues:
+
+  decode -> detect/extract -> analyze -> render figures -> write reports/PDF
+
+so file N+1 decodes while file N is analyzed and file N-1 renders. A full
+queue blocks the stage feeding it, which bounds how many decoded recordings
+are held in memory at once.
+
+Threads (not processes) keep the arrays shared without pickling: decoding,
+filtering and PNG encoding release the GIL for most of their work. Per-stage
+utilization (busy time / (wall time x workers)) shows which stage to give
+more workers.
+
+The outputs of one file match run_full_report's (without the results
+database, stream sink and checkpoints; use batch.runner for resumable runs).
+
+Usage:
+    wav-to-freq-pipelined recordings/ --out out/ --render-workers 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping
+
+from wav_to_freq.analysis.bootstrap import ModalConfidence, bootstrap_confidence
+from wav_to_freq.analysis.modal import analyze_all_hits
+from wav_to_freq.domain.enums import StereoChannel
+from wav_to_freq.domain.results import ResultTable
+from wav_to_freq.domain.types import HitDetectionReport, HitWindow, StereoWav
+from wav_to_freq.dsp.spectral import share_fft_workers
+from wav_to_freq.io.hit_detection import detect_and_extract_hits
+from wav_to_freq.io.wav_reader import load_stereo_wav
+from wav_to_freq.reporting.sections.modal import render_hit_figures
+from wav_to_freq.reporting.writers.modal import write_modal_report
+from wav_to_freq.reporting.writers.preprocess import (
+    render_preprocess_figures,
+    write_preprocess_report,
+)
+from wav_to_freq.utils.paths import ensure_dir, make_unique_dir, sanitize_dirname
+
+STAGES: tuple[str, ...] = ("decode", "detect", "analyze", "render", "write")
+
+DEFAULT_WORKERS: dict[str, int] = {
+    "decode": 1,
+    "detect": 1,
+    "analyze": 1,
+    "render": 1,
+    "write": 1,
+}
+
+
+@dataclass(frozen=True)
+class StageStats:
+    name: str
+    workers: int
+    items: int
+    busy_s: float
+    utilization: float
+
+
+@dataclass(frozen=True)
+class PipelinedBatchReport:
+    wall_s: float
+    stages: list[StageStats]
+    outputs: dict[Path, Path]  # recording -> run folder
+    failed: dict[Path, str]  # recording -> "stage: error"
+
+
+@dataclass
+class _Job:
+    path: Path
+    out_dir: Path
+    stereo: StereoWav | None = None
+    windows: list[HitWindow] = field(default_factory=list)
+    report: HitDetectionReport | None = None
+    results: ResultTable | None = None
+    confidence: ModalConfidence | None = None
+    error: str | None = None
+
+
+_DONE = object()
+
+
+class _Stage:
+    def __init__(self, name: str, fn: Callable[[_Job], None], workers: int, maxsize: int) -> None:
+        self.name = name
+        self.fn = fn
+        self.workers = max(1, int(workers))
+        self.inbox: queue.Queue[Any] = queue.Queue(maxsize=maxsize)
+        self.busy_s = 0.0
+        self.items = 0
+        self.alive = self.workers
+        self.lock = threading.Lock()
+
+
+def run_pipelined_batch(
+    files: Iterable[str | Path],
+    out_root: str | Path,
+    *,
+    workers: Mapping[str, int] | None = None,
+    queue_size: int = 2,
+    hammer_channel: StereoChannel = StereoChannel.UNKNOWN,
+    # hit detection / extraction
+    pre_s: float = 0.05,
+    post_s: float = 1.50,
+    min_separation_s: float = 0.30,
+    threshold_sigma: float = 8.0,
+    # modal analysis
+    fmin_hz: float = 1.0,
+    fmax_hz: float = 2000.0,
+    settle_s: float = 0.010,
+    ring_s: float = 1.0,
+    transient_s: float = 0.20,
+    established_min_s: float = 0.40,
+    established_r2_min: float = 0.95,
+    fit_max_s: float = 0.80,
+    noise_tail_s: float = 0.20,
+    noise_mult: float = 3.0,
+    # reporting
+    title_preprocess: str = "WAV preprocessing report",
+    title_modal: str = "Modal report",
+    max_plot_seconds: float | None = None,
+    bootstrap_n: int = 1000,
+    export_pdf: bool = True,
+) -> PipelinedBatchReport:
+    """
+    Run the full report for every file, one run folder per file under out_root.
+
+    workers overrides DEFAULT_WORKERS per stage name (see STAGES); queue_size
+    is the capacity of each inter-stage queue.
+    """
+    out_root = ensure_dir(Path(out_root))
+    n_workers = {**DEFAULT_WORKERS, **dict(workers or {})}
+    unknown = set(n_workers) - set(STAGES)
+    if unknown:
+        raise ValueError(f"Unknown stage(s) {sorted(unknown)}; expected {STAGES}")
+
+    def _decode(job: _Job) -> None:
+        job.stereo = load_stereo_wav(job.path, hammer_channel=hammer_channel)
+
+    def _detect(job: _Job) -> None:
+        assert job.stereo is not None
+        job.windows, job.report = detect_and_extract_hits(
+            job.stereo,
+            threshold_sigma=threshold_sigma,
+            min_separation_s=min_separation_s,
+            pre_s=pre_s,
+            post_s=post_s,
+        )
+
+    def _analyze(job: _Job) -> None:
+        assert job.stereo is not None
+        job.results = analyze_all_hits(
+            windows=job.windows,
+            fs=job.stereo.fs,
+            settle_s=settle_s,
+            ring_s=ring_s,
+            fmin_hz=fmin_hz,
+            fmax_hz=fmax_hz,
+            transient_s=transient_s,
+            established_min_s=established_min_s,
+            established_r2_min=established_r2_min,
+            fit_max_s=fit_max_s,
+            noise_tail_s=noise_tail_s,
+            noise_mult=noise_mult,
+        )
+        if bootstrap_n > 0:
+            job.confidence = bootstrap_confidence(
+                job.windows,
+                job.stereo.fs,
+                job.results,
+                settle_s=settle_s,
+                ring_s=ring_s,
+                fmin_hz=fmin_hz,
+                fmax_hz=fmax_hz,
+                n_boot=bootstrap_n,
+            )
+
+    def _render(job: _Job) -> None:
+        assert job.stereo is not None and job.results is not None
+        render_preprocess_figures(
+            job.out_dir, stereo=job.stereo, windows=job.windows, max_plot_seconds=max_plot_seconds
+        )
+        hits_dir = ensure_dir(job.out_dir / "figures" / "hits")
+        render_hit_figures(job.windows, job.results, transient_s, job.stereo.fs, hits_dir)
+
+    def _write(job: _Job) -> None:
+        assert job.stereo is not None and job.report is not None and job.results is not None
+        write_preprocess_report(
+            job.out_dir,
+            stereo=job.stereo,
+            windows=job.windows,
+            report=job.report,
+            title=title_preprocess,
+            max_plot_seconds=max_plot_seconds,
+            export_pdf=export_pdf,
+            render_figures=False,
+        )
+        write_modal_report(
+            results=job.results,
+            out_dir=job.out_dir,
+            windows=job.windows,
+            fs=job.stereo.fs,
+            title=title_modal,
+            transient_s=transient_s,
+            export_pdf=export_pdf,
+            render_figures=False,
+            confidence=job.confidence,
+        )
+
+    fns = {
+        "decode": _decode,
+        "detect": _detect,
+        "analyze": _analyze,
+        "render": _render,
+        "write": _write,
+    }
+    if n_workers["analyze"] > 1:
+        share_fft_workers(n_workers["analyze"])
+    stages = [_Stage(name, fns[name], n_workers[name], max(1, queue_size)) for name in STAGES]
+    finished: list[_Job] = []
+    finished_lock = threading.Lock()
+
+    def _worker(i: int) -> None:
+        stage = stages[i]
+        nxt = stages[i + 1] if i + 1 < len(stages) else None
+        while (job := stage.inbox.get()) is not _DONE:
+            if job.error is None:
+                t0 = time.perf_counter()
+                try:
+                    stage.fn(job)
+                except Exception as e:
+                    job.error = f"{stage.name}: {type(e).__name__}: {e}"
+                dt = time.perf_counter() - t0
+                with stage.lock:
+                    stage.busy_s += dt
+                    stage.items += 1
+            if nxt is not None:
+                nxt.inbox.put(job)  # blocks while the next stage is saturated
+            else:
+                job.stereo, job.windows, job.results, job.confidence = None, [], None, None
+                with finished_lock:
+                    finished.append(job)
+        with stage.lock:
+            stage.alive -= 1
+            last = stage.alive == 0
+        if last and nxt is not None:
+            for _ in range(nxt.workers):
+                nxt.inbox.put(_DONE)
+
+    threads = [
+        threading.Thread(target=_worker, args=(i,), name=f"w2f-{s.name}-{k}", daemon=True)
+        for i, s in enumerate(stages)
+        for k in range(s.workers)
+    ]
+    t_start = time.perf_counter()
+    for t in threads:
+        t.start()
+
+    for p in map(Path, files):
+        out_dir = make_unique_dir(out_root / sanitize_dirname(p.stem))
+        out_dir.mkdir(parents=True)
+        stages[0].inbox.put(_Job(path=p, out_dir=out_dir))
+    for _ in range(stages[0].workers):
+        stages[0].inbox.put(_DONE)
+
+    for t in threads:
+        t.join()
+    wall_s = time.perf_counter() - t_start
+
+    return PipelinedBatchReport(
+        wall_s=wall_s,
+        stages=[
+            StageStats(
+                name=s.name,
+                workers=s.workers,
+                items=s.items,
+                busy_s=s.busy_s,
+                utilization=s.busy_s / (wall_s * s.workers) if wall_s > 0 else 0.0,
+            )
+            for s in stages
+        ],
+        outputs={j.path: j.out_dir for j in finished if j.error is None},
+        failed={j.path: j.error for j in finished if j.error is not None},
+    )
+
+
+def main() -> None:
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    from wav_to_freq.batch.runner import collect_audio_files
+
+    ap = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    ap.add_argument("inputs", nargs="+", type=Path, help="audio files and/or folders")
+    ap.add_argument("--out", type=Path, required=True)
+    for name in STAGES:
+        ap.add_argument(f"--{name}-workers", type=int, default=DEFAULT_WORKERS[name])
+    ap.add_argument("--queue-size", type=int, default=2)
+    ap.add_argument("--no-pdf", action="store_true", help="skip the PDF exports")
+    args = ap.parse_args()
+
+    rep = run_pipelined_batch(
+        collect_audio_files(args.inputs),
+        args.out,
+        workers={name: getattr(args, f"{name}_workers") for name in STAGES},
+        queue_size=args.queue_size,
+        export_pdf=not args.no_pdf,
+    )
+
+    print(f"{len(rep.outputs)} done, {len(rep.failed)} failed in {rep.wall_s:.2f} s")
+    print(f"{'stage':<8} {'workers':>7} {'items':>6} {'busy (s)':>9} {'util':>6}")
+    for s in rep.stages:
+        print(f"{s.name:<8} {s.workers:>7} {s.items:>6} {s.busy_s:>9.2f} {s.utilization:>6.0%}")
+    for path, error in rep.failed.items():
+        print(f"FAILED {path}: {error}")
+
+
+if __name__ == "__main__":
+    main()
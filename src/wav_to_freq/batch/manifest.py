@@ -0,0 +1,304 @@
+# src/wav_to_freq/batch/manifest.py
+"""
+Batch manifest: which files of a batch are done, running or failed, and which
+pipeline stages each file has already completed.
+
+Stored in one SQLite file next to the batch output so several worker
+processes (same machine or a shared filesystem with working locks) can run
+the same batch:
+  - claim() picks the next file inside a BEGIN IMMEDIATE transaction, so two
+    workers never get the same file;
+  - a claimed file carries a heartbeat, renewed by a background thread while
+    the file is processed (keep_alive); if its worker dies, the lease expires
+    and another worker reclaims it;
+  - completed stages are recorded per file, so a retry only re-runs what
+    did not finish (see pipeline.CHECKPOINT_STAGES).
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping
+
+from wav_to_freq.utils.paths import sanitize_dirname
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS files (
+    path       TEXT PRIMARY KEY,
+    run_dir    TEXT NOT NULL UNIQUE,
+    status     TEXT NOT NULL DEFAULT 'pending',
+    worker     TEXT,
+    claimed_at REAL,
+    heartbeat  REAL,
+    attempts   INTEGER NOT NULL DEFAULT 0,
+    error      TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_files_status ON files(status);
+
+CREATE TABLE IF NOT EXISTS stages (
+    path        TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    stage       TEXT NOT NULL,
+    finished_at REAL NOT NULL,
+    seconds     REAL NOT NULL,
+    PRIMARY KEY (path, stage)
+);
+"""
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    path: Path
+    run_dir: Path
+    attempt: int
+    completed_stages: frozenset[str]
+
+
+class BatchManifest:
+    """
+    Usage:
+        with BatchManifest(out_root / "batch_manifest.sqlite", params=params) as m:
+            m.add_files(wavs, out_root)
+            while (item := m.claim("worker-1")) is not None:
+                with m.keep_alive(item.path):
+                    ...  # m.mark_stage_done(...), then m.mark_file_done / mark_file_failed
+
+    params fingerprints the analysis settings: reopening a manifest with other
+    settings raises ValueError, since its completed stages would not apply.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        params: Mapping[str, Any] | None = None,
+        lease_s: float = 1800.0,
+        max_attempts: int = 3,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease_s = float(lease_s)
+        self.max_attempts = int(max_attempts)
+
+        # isolation_level=None: transactions are explicit (BEGIN IMMEDIATE below)
+        self._con = sqlite3.connect(str(self.path), timeout=60.0, isolation_level=None)
+        self._con.execute("PRAGMA journal_mode=WAL")
+        self._con.execute("PRAGMA foreign_keys=ON")
+        self._con.executescript(_SCHEMA)
+
+        if params is not None:
+            fingerprint = json.dumps(dict(params), sort_keys=True, default=str)
+            with self._write():
+                row = self._con.execute("SELECT value FROM meta WHERE key = 'params'").fetchone()
+                if row is None:
+                    self._con.execute(
+                        "INSERT INTO meta (key, value) VALUES ('params', ?)", (fingerprint,)
+                    )
+                elif row[0] != fingerprint:
+                    raise ValueError(
+                        f"{self.path} was created with other analysis parameters; "
+                        "use a new manifest (or output folder) for this batch."
+                    )
+
+    def close(self) -> None:
+        self._con.close()
+
+    def __enter__(self) -> BatchManifest:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # -----------------------
+    # Files
+    # -----------------------
+
+    def add_files(self, paths: Iterable[str | Path], out_root: str | Path) -> int:
+        """
+        Register files (already known paths are left untouched) and give each a
+        run folder under out_root, unique within the batch. Returns the number added.
+        """
+        out_root = Path(out_root)
+        added = 0
+        with self._write():
+            taken = {r[0] for r in self._con.execute("SELECT run_dir FROM files")}
+            for p in paths:
+                key = str(Path(p).resolve())
+                if self._con.execute("SELECT 1 FROM files WHERE path = ?", (key,)).fetchone():
+                    continue
+                base = out_root / sanitize_dirname(Path(p).stem)
+                run_dir, i = base, 2
+                while str(run_dir) in taken:
+                    run_dir = base.parent / f"{base.name}_{i}"
+                    i += 1
+                taken.add(str(run_dir))
+                self._con.execute(
+                    "INSERT INTO files (path, run_dir) VALUES (?, ?)", (key, str(run_dir))
+                )
+                added += 1
+        return added
+
+    def retry_failed(self) -> int:
+        """Put files that exhausted their attempts back in the queue (stages kept)."""
+        with self._write():
+            cur = self._con.execute(
+                "UPDATE files SET status = ?, attempts = 0, error = NULL WHERE status = ?",
+                (PENDING, FAILED),
+            )
+        return cur.rowcount
+
+    def claim(self, worker_id: str) -> BatchItem | None:
+        """
+        Atomically take the next pending file (or one whose worker's lease
+        expired). None when nothing is left to do.
+        """
+        now = time.time()
+        with self._write():
+            row = self._con.execute(
+                "SELECT path, run_dir, attempts FROM files"
+                " WHERE status = ? OR (status = ? AND heartbeat < ?)"
+                " ORDER BY attempts, path LIMIT 1",
+                (PENDING, RUNNING, now - self.lease_s),
+            ).fetchone()
+            if row is None:
+                return None
+            path, run_dir, attempts = row
+            self._con.execute(
+                "UPDATE files SET status = ?, worker = ?, claimed_at = ?, heartbeat = ?,"
+                " attempts = attempts + 1 WHERE path = ?",
+                (RUNNING, worker_id, now, now, path),
+            )
+        return BatchItem(
+            path=Path(path),
+            run_dir=Path(run_dir),
+            attempt=int(attempts) + 1,
+            completed_stages=frozenset(self.completed_stages(path)),
+        )
+
+    @contextmanager
+    def keep_alive(self, path: str | Path) -> Iterator[None]:
+        """
+        Renew the file's heartbeat every lease_s / 3 from a background thread
+        for as long as the block runs, so a stage longer than the lease is not
+        reclaimed by another worker while this one is still writing.
+        """
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=self._heartbeat_loop,
+            args=(str(path), stop),
+            name=f"lease:{Path(path).name}",
+            daemon=True,
+        )
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def _heartbeat_loop(self, path: str, stop: threading.Event) -> None:
+        # sqlite3 connections belong to the thread that opened them
+        con = sqlite3.connect(str(self.path), timeout=60.0, isolation_level=None)
+        try:
+            while not stop.wait(self.lease_s / 3.0):
+                with _Immediate(con):
+                    con.execute(
+                        "UPDATE files SET heartbeat = ? WHERE path = ? AND status = ?",
+                        (time.time(), path, RUNNING),
+                    )
+        finally:
+            con.close()
+
+    def mark_file_done(self, path: str | Path) -> None:
+        with self._write():
+            self._con.execute(
+                "UPDATE files SET status = ?, error = NULL, heartbeat = ? WHERE path = ?",
+                (DONE, time.time(), str(path)),
+            )
+
+    def mark_file_failed(self, path: str | Path, error: str) -> str:
+        """
+        Record a failure. The file goes back to pending while it has attempts
+        left, else it is parked as failed. Returns the new status.
+        """
+        with self._write():
+            row = self._con.execute(
+                "SELECT attempts FROM files WHERE path = ?", (str(path),)
+            ).fetchone()
+            status = FAILED if row is None or row[0] >= self.max_attempts else PENDING
+            self._con.execute(
+                "UPDATE files SET status = ?, worker = NULL, error = ? WHERE path = ?",
+                (status, error, str(path)),
+            )
+        return status
+
+    # -----------------------
+    # Stages
+    # -----------------------
+
+    def completed_stages(self, path: str | Path) -> set[str]:
+        rows = self._con.execute("SELECT stage FROM stages WHERE path = ?", (str(path),))
+        return {str(r[0]) for r in rows}
+
+    def mark_stage_done(self, path: str | Path, stage: str, seconds: float) -> None:
+        """Record one finished stage; also renews the file's lease."""
+        now = time.time()
+        with self._write():
+            self._con.execute(
+                "INSERT OR REPLACE INTO stages (path, stage, finished_at, seconds)"
+                " VALUES (?, ?, ?, ?)",
+                (str(path), stage, now, float(seconds)),
+            )
+            self._con.execute("UPDATE files SET heartbeat = ? WHERE path = ?", (now, str(path)))
+
+    # -----------------------
+    # Reporting
+    # -----------------------
+
+    def summary(self) -> dict[str, int]:
+        """Number of files per status."""
+        counts = {PENDING: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+        for status, n in self._con.execute("SELECT status, COUNT(*) FROM files GROUP BY status"):
+            counts[str(status)] = int(n)
+        return counts
+
+    def failures(self) -> dict[Path, str]:
+        rows = self._con.execute(
+            "SELECT path, error FROM files WHERE status = ? ORDER BY path", (FAILED,)
+        )
+        return {Path(p): str(e or "") for p, e in rows}
+
+    # -----------------------
+    # Internals
+    # -----------------------
+
+    def _write(self) -> _Immediate:
+        return _Immediate(self._con)
+
+
+class _Immediate:
+    """BEGIN IMMEDIATE ... COMMIT/ROLLBACK: takes the write lock up front."""
+
+    def __init__(self, con: sqlite3.Connection) -> None:
+        self._con = con
+
+    def __enter__(self) -> None:
+        self._con.execute("BEGIN IMMEDIATE")
+
+    def __exit__(self, exc_type: object, *exc: object) -> None:
+        self._con.execute("COMMIT" if exc_type is None else "ROLLBACK")
@@ -0,0 +1,159 @@
+# src/wav_to_freq/batch/runner.py
+"""
+Resumable batch processing of many recordings.
+
+Each file gets its own run folder under out_root and goes through
+run_full_report with per-stage checkpoints kept in a BatchManifest:
+  - rerunning the same command skips finished files,
+  - a file that failed at (say) the PDF export only re-runs that stage,
+  - an interrupted analysis resumes after the last hit in
+    <run_dir>/modal_results.stream.jsonl,
+  - several workers (--workers, or separate processes pointed at the same
+    out_root) share the queue without processing a file twice.
+
+Files that used up their attempts stay failed until the batch is rerun with
+--retry-failed.
+
+Usage:
+    wav-to-freq-batch recordings/ --out out/batch --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable
+
+from wav_to_freq.batch.manifest import BatchManifest
+from wav_to_freq.domain.enums import ProgressKind
+from wav_to_freq.domain.progress import ProgressEvent
+from wav_to_freq.dsp.spectral import share_fft_workers
+from wav_to_freq.io.wav_reader import is_audio_file
+from wav_to_freq.pipeline import run_full_report
+
+MANIFEST_NAME = "batch_manifest.sqlite"
+STREAM_NAME = "modal_results.stream.jsonl"
+
+
+def collect_audio_files(inputs: Iterable[str | Path]) -> list[Path]:
+    """Audio files given directly, plus those found (non-recursively) in given folders."""
+    files: list[Path] = []
+    for p in map(Path, inputs):
+        if p.is_dir():
+            files.extend(sorted(f for f in p.iterdir() if f.is_file() and is_audio_file(f)))
+        elif p.is_file():
+            files.append(p)
+        else:
+            raise FileNotFoundError(p)
+    return files
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def run_batch(
+    files: Iterable[str | Path],
+    out_root: str | Path,
+    *,
+    manifest_path: str | Path | None = None,
+    worker_id: str | None = None,
+    max_attempts: int = 3,
+    lease_s: float = 1800.0,
+    **report_kwargs: Any,
+) -> dict[str, int]:
+    """
+    Process files until the manifest has nothing left to claim.
+
+    report_kwargs are passed to run_full_report (hammer_channel, fmin_hz, ...)
+    and fingerprint the batch: the same out_root cannot be resumed with other
+    settings. Returns the manifest summary (files per status).
+    """
+    out_root = Path(out_root)
+    manifest_path = Path(manifest_path) if manifest_path else out_root / MANIFEST_NAME
+    worker_id = worker_id or default_worker_id()
+
+    with BatchManifest(
+        manifest_path, params=report_kwargs, lease_s=lease_s, max_attempts=max_attempts
+    ) as manifest:
+        manifest.add_files(files, out_root)
+
+        while (item := manifest.claim(worker_id)) is not None:
+            item.run_dir.mkdir(parents=True, exist_ok=True)
+
+            def _stage_done(event: ProgressEvent, path: Path = item.path) -> None:
+                if event.kind is ProgressKind.STAGE_DONE:
+                    manifest.mark_stage_done(path, str(event.stage), float(event.seconds or 0.0))
+
+            try:
+                with manifest.keep_alive(item.path):
+                    run_full_report(
+                        item.path,
+                        out_dir=item.run_dir,
+                        results_stream=item.run_dir / STREAM_NAME,
+                        skip_stages=item.completed_stages,
+                        on_progress=_stage_done,
+                        **report_kwargs,
+                    )
+            except Exception as e:  # keep the batch going; the manifest records it
+                manifest.mark_file_failed(item.path, f"{type(e).__name__}: {e}")
+            else:
+                manifest.mark_file_done(item.path)
+
+        return manifest.summary()
+
+
+def _worker(args: tuple[list[Path], Path, str, dict[str, Any]]) -> dict[str, int]:
+    files, out_root, worker_id, kwargs = args
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    return run_batch(files, out_root, worker_id=worker_id, **kwargs)
+
+
+def main() -> None:
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    ap = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    ap.add_argument("inputs", nargs="+", type=Path, help="audio files and/or folders")
+    ap.add_argument("--out", type=Path, required=True, help="batch output root")
+    ap.add_argument("--workers", type=int, default=1)
+    ap.add_argument("--max-attempts", type=int, default=3)
+    ap.add_argument("--no-pdf", action="store_true", help="skip the PDF exports")
+    ap.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="give files that used up their attempts another --max-attempts",
+    )
+    args = ap.parse_args()
+
+    files = collect_audio_files(args.inputs)
+    if args.retry_failed:
+        # once, before any worker starts claiming
+        with BatchManifest(args.out / MANIFEST_NAME) as manifest:
+            manifest.retry_failed()
+    kwargs: dict[str, Any] = {"max_attempts": args.max_attempts}
+    if args.no_pdf:
+        kwargs["export_pdf"] = False
+
+    n = max(1, args.workers)
+    if n == 1:
+        run_batch(files, args.out, **kwargs)
+    else:
+        base = default_worker_id()
+        jobs = [(files, args.out, f"{base}/{i}", kwargs) for i in range(n)]
+        with ProcessPoolExecutor(max_workers=n, initializer=share_fft_workers, initargs=(n,)) as pool:
+            list(pool.map(_worker, jobs))
+
+    with BatchManifest(args.out / MANIFEST_NAME) as manifest:
+        summary = manifest.summary()
+        failures = manifest.failures()
+    print(", ".join(f"{k}: {v}" for k, v in summary.items()))
+    for path, error in failures.items():
+        print(f"FAILED {path}: {error}")
+
+
+if __name__ == "__main__":
+    main()
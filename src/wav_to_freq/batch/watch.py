@@ -0,0 +1,295 @@
+# src/wav_to_freq/batch/watch.py
+"""
+Headless watch-folder daemon.
+
+Recordings dropped into input_dir are analyzed as soon as they are fully
+written, then moved into their run folder (same layout as the TUI Run button):
+  output_dir/<recording stem>/{reports..., <recording>}
+
+Pipeline:
+  scan input_dir -> wait until size/mtime are stable for settle_s
+    -> bounded queue -> `workers` processes running run_full_report -> move
+
+Change notifications come from inotify on Linux (through libc, no extra
+dependency) and from a plain directory poll everywhere else; either way they
+only trigger a rescan. The queue is bounded: when `workers + max_queued`
+recordings are in flight, new files are simply left in input_dir until a slot
+frees up, so a burst of recordings never piles up in memory.
+
+Usage:
+    wav-to-freq-watch input/ --out output/ --workers 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from wav_to_freq.dsp.spectral import share_fft_workers
+from wav_to_freq.io.wav_reader import is_audio_file
+from wav_to_freq.utils.paths import make_unique_dir, move_into_run_dir, sanitize_dirname
+
+
+@dataclass(frozen=True)
+class WatchResult:
+    source: Path
+    run_dir: Path
+    moved_to: Path | None = None
+    error: str | None = None
+
+
+def process_recording(path: Path, run_dir: Path, report_kwargs: dict[str, Any]) -> WatchResult:
+    """Analyze one recording into run_dir and move it there (runs in a worker process)."""
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    from wav_to_freq.pipeline import run_full_report
+
+    try:
+        run_full_report(path, out_dir=run_dir, **report_kwargs)
+    except Exception as e:
+        return WatchResult(source=path, run_dir=run_dir, error=f"{type(e).__name__}: {e}")
+    try:
+        moved = move_into_run_dir(path, run_dir)
+    except OSError as e:
+        return WatchResult(source=path, run_dir=run_dir, error=f"move failed: {e}")
+    return WatchResult(source=path, run_dir=run_dir, moved_to=moved)
+
+
+class FolderWatcher:
+    """
+    Watch input_dir and process new recordings with at most `workers` running
+    and `max_queued` waiting. Call run() (blocking) and stop() from another
+    thread or a signal handler.
+    """
+
+    def __init__(
+        self,
+        input_dir: str | Path,
+        output_dir: str | Path,
+        *,
+        workers: int = 1,
+        max_queued: int = 2,
+        settle_s: float = 2.0,
+        poll_s: float = 1.0,
+        use_inotify: bool = True,
+        on_result: Callable[[WatchResult], None] | None = None,
+        **report_kwargs: Any,
+    ) -> None:
+        self.input_dir = Path(input_dir)
+        self.output_dir = Path(output_dir)
+        self.workers = max(1, int(workers))
+        self.settle_s = float(settle_s)
+        self.poll_s = float(poll_s)
+        self.on_result = on_result
+        self.report_kwargs = report_kwargs
+
+        self._slots = threading.BoundedSemaphore(self.workers + max(0, int(max_queued)))
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._in_flight: set[Path] = set()
+        # path -> (size, mtime_ns, time first seen with that signature)
+        self._seen: dict[Path, tuple[int, int, float]] = {}
+        # path -> (size, mtime_ns) of a failed attempt; retried only once the file changes
+        self._failed: dict[Path, tuple[int, int]] = {}
+        self._notify = _InotifyWakeup.open(self.input_dir) if use_inotify else None
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._notify is not None
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def run(self, *, max_files: int | None = None) -> int:
+        """
+        Process recordings until stop() (or after max_files were submitted).
+        Waits for in-flight recordings before returning. Returns the number submitted.
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        submitted = 0
+        pending: list[Future[WatchResult]] = []
+        with ProcessPoolExecutor(
+            max_workers=self.workers, initializer=share_fft_workers, initargs=(self.workers,)
+        ) as pool:
+            try:
+                while not self._stop.is_set():
+                    for path in self._ready_files():
+                        # backpressure: wait for a slot, the file stays on disk meanwhile
+                        while not self._slots.acquire(timeout=self.poll_s):
+                            if self._stop.is_set():
+                                break
+                        else:
+                            pending.append(self._submit(pool, path))
+                            submitted += 1
+                            if max_files is not None and submitted >= max_files:
+                                self._stop.set()
+                        if self._stop.is_set():
+                            break
+                    pending = [f for f in pending if not f.done()]
+                    if not self._stop.is_set():
+                        self._wait_for_change()
+            finally:
+                for f in pending:
+                    f.exception()
+                if self._notify is not None:
+                    self._notify.close()
+        return submitted
+
+    # -----------------------
+    # Internals
+    # -----------------------
+
+    def _submit(self, pool: ProcessPoolExecutor, path: Path) -> Future[WatchResult]:
+        run_dir = make_unique_dir(self.output_dir / sanitize_dirname(path.stem))
+        run_dir.mkdir(parents=True)
+        with self._lock:
+            self._in_flight.add(path)
+        fut = pool.submit(process_recording, path, run_dir, self.report_kwargs)
+        fut.add_done_callback(lambda f, p=path, d=run_dir: self._done(p, d, f))
+        return fut
+
+    def _done(self, path: Path, run_dir: Path, fut: Future[WatchResult]) -> None:
+        exc = fut.exception()
+        result = fut.result() if exc is None else WatchResult(path, run_dir, error=repr(exc))
+        with self._lock:
+            self._in_flight.discard(path)
+            if result.error is not None:
+                try:
+                    st = path.stat()
+                    self._failed[path] = (st.st_size, st.st_mtime_ns)
+                except FileNotFoundError:
+                    pass
+        self._slots.release()
+        if self.on_result is not None:
+            self.on_result(result)
+
+    def _ready_files(self) -> list[Path]:
+        """Files whose size and mtime have not changed for settle_s, oldest first."""
+        now = time.monotonic()
+        ready: list[tuple[int, Path]] = []
+        present: set[Path] = set()
+        with self._lock:
+            busy = set(self._in_flight)
+        for p in self.input_dir.iterdir():
+            if not p.is_file() or not is_audio_file(p) or p in busy:
+                continue
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            present.add(p)
+            sig = (st.st_size, st.st_mtime_ns)
+            if self._failed.get(p) == sig:
+                continue
+            prev = self._seen.get(p)
+            if prev is None or prev[:2] != sig:
+                self._seen[p] = (*sig, now)
+                continue
+            if st.st_size > 0 and now - prev[2] >= self.settle_s:
+                ready.append((st.st_mtime_ns, p))
+        for p in set(self._seen) - present:
+            del self._seen[p]
+        return [p for _, p in sorted(ready)]
+
+    def _wait_for_change(self) -> None:
+        # with files still settling, come back after poll_s even without events
+        if self._notify is not None:
+            self._notify.wait(self.poll_s)
+        else:
+            self._stop.wait(self.poll_s)
+
+
+class _InotifyWakeup:
+    """Minimal inotify watch on one directory (Linux, via libc)."""
+
+    _MASK = 0x00000008 | 0x00000080 | 0x00000002  # IN_CLOSE_WRITE | IN_MOVED_TO | IN_MODIFY
+
+    def __init__(self, fd: int) -> None:
+        self._fd = fd
+
+    @classmethod
+    def open(cls, directory: Path) -> _InotifyWakeup | None:
+        """None when inotify is unavailable; callers then fall back to polling."""
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, os.fsencode(directory), cls._MASK) < 0:
+            os.close(fd)
+            return None
+        return cls(fd)
+
+    def wait(self, timeout_s: float) -> bool:
+        """Block until an event or timeout; drain pending events. True on event."""
+        readable, _, _ = select.select([self._fd], [], [], timeout_s)
+        if not readable:
+            return False
+        try:
+            while os.read(self._fd, 64 * struct.calcsize("iIII")):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def main() -> None:
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    ap = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    ap.add_argument("input_dir", type=Path)
+    ap.add_argument("--out", type=Path, required=True, help="output folder (one run folder per file)")
+    ap.add_argument("--workers", type=int, default=1, help="recordings analyzed concurrently")
+    ap.add_argument("--max-queued", type=int, default=2, help="ready recordings waiting for a worker")
+    ap.add_argument("--settle", type=float, default=2.0, help="seconds a file must stay unchanged")
+    ap.add_argument("--poll", type=float, default=1.0, help="rescan interval (s)")
+    ap.add_argument("--no-inotify", action="store_true")
+    ap.add_argument("--no-pdf", action="store_true", help="skip the PDF exports")
+    args = ap.parse_args()
+
+    def _print(result: WatchResult) -> None:
+        if result.error is None:
+            print(f"done   {result.source.name} -> {result.run_dir}", flush=True)
+        else:
+            print(f"FAILED {result.source.name}: {result.error}", flush=True)
+
+    kwargs: dict[str, Any] = {}
+    if args.no_pdf:
+        kwargs["export_pdf"] = False
+
+    watcher = FolderWatcher(
+        args.input_dir,
+        args.out,
+        workers=args.workers,
+        max_queued=args.max_queued,
+        settle_s=args.settle,
+        poll_s=args.poll,
+        use_inotify=not args.no_inotify,
+        on_result=_print,
+        **kwargs,
+    )
+    mode = "inotify" if watcher.uses_inotify else "polling"
+    print(f"Watching {args.input_dir} ({mode}); Ctrl+C to stop.", flush=True)
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        print("Stopping: waiting for recordings in progress...", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,19 @@
 EPS = 1e-30
 """Little epsilon value introduced in computing to avoid division by 0"""
+
+WORK_DTYPE = "float32"
+"""
+Default dtype for sample storage, detection, filtering and plotting.
+16/24-bit PCM fits in float32; numerically sensitive steps (log-envelope fit,
+PSD peak refinement) still run in float64. Override with set_work_dtype() or
+the WAV_TO_FREQ_DTYPE environment variable ("float32" | "float64").
+"""
+
+FFT_WORKERS = -1
+"""
+Threads per scipy.fft transform (dsp.spectral); -1 uses every core, since
+analyze_all_hits analyzes one hit after another. The batch runner, the watch
+folder and the pipelined executor run several analyses at once and split the
+cores between them (dsp.spectral.share_fft_workers). Override with
+set_fft_workers() or the WAV_TO_FREQ_FFT_WORKERS environment variable.
+"""
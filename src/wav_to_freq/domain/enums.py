@@ -5,3 +5,10 @@ class StereoChannel(Enum):
     LEFT = "left"
     RIGHT = "right"
     UNKNOWN = "unknown"
+
+
+class ProgressKind(Enum):
+    STAGE_DONE = "stage_done"
+    HITS_DETECTED = "hits_detected"
+    HIT_ANALYZED = "hit_analyzed"
+    FIGURE_WRITTEN = "figure_written"
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from wav_to_freq.domain.enums import ProgressKind
+from wav_to_freq.domain.types import HitModalResult
+
+
+class RunCancelled(RuntimeError):
+    """Raised inside a pipeline run once its CancelToken is cancelled."""
+
+
+class CancelToken:
+    """
+    Thread-safe cancellation flag. The pipeline checks it between stages,
+    hits and figures, so a cancelled run stops at the next such step.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise RunCancelled("run cancelled")
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    kind: ProgressKind
+    stage: str | None = None  # STAGE_DONE
+    seconds: float | None = None  # STAGE_DONE
+    index: int = 0  # 1-based position for HIT_ANALYZED / FIGURE_WRITTEN
+    total: int = 0  # number of hits (0 when not applicable)
+    result: HitModalResult | None = None  # HIT_ANALYZED
+    path: Path | None = None  # FIGURE_WRITTEN
+
+
+ProgressCallback = Callable[[ProgressEvent], None]
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping, Sequence, overload
+
+import numpy as np
+
+from wav_to_freq.domain.types import HitModalResult
+
+FIELDS: tuple[str, ...] = tuple(f.name for f in fields(HitModalResult))
+"""Column names, in HitModalResult (and CSV) order."""
+
+_INT_FIELDS = ("hit_id", "hit_index")
+_STR_FIELDS = ("reject_reason",)
+_OPTIONAL_FLOAT_FIELDS = ("fit_t0_s", "fit_t1_s")
+
+
+@dataclass(frozen=True)
+class FieldSummary:
+    n: int
+    mean: float | None
+    min: float | None
+    max: float | None
+
+
+class ResultTable:
+    """
+    Columnar per-hit results: one numpy array per HitModalResult field.
+
+    Missing values are stored column-friendly: reject_reason=None as "" and
+    fit_t0_s/fit_t1_s=None as NaN. Row access (indexing, iteration) returns
+    HitModalResult views with the original None semantics, so code written
+    against list[HitModalResult] keeps working.
+    """
+
+    def __init__(self, columns: dict[str, np.ndarray]) -> None:
+        missing = [k for k in FIELDS if k not in columns]
+        if missing:
+            raise ValueError(f"ResultTable is missing columns: {missing}")
+        n = {int(np.asarray(columns[k]).shape[0]) for k in FIELDS}
+        if len(n) > 1:
+            raise ValueError(f"ResultTable columns have different lengths: {sorted(n)}")
+        self._cols: dict[str, np.ndarray] = {k: np.asarray(columns[k]) for k in FIELDS}
+
+    # -----------------------
+    # Construction
+    # -----------------------
+
+    @classmethod
+    def from_results(cls, results: Iterable[HitModalResult]) -> ResultTable:
+        if isinstance(results, ResultTable):
+            return results
+        rows = list(results)
+        return cls.from_values({k: [getattr(r, k) for r in rows] for k in FIELDS})
+
+    @classmethod
+    def from_values(cls, values: Mapping[str, Sequence[Any]]) -> ResultTable:
+        """Build from per-column Python values (None allowed where the row type allows it)."""
+        cols: dict[str, np.ndarray] = {}
+        for k in FIELDS:
+            values_k = values[k]
+            if k in _INT_FIELDS:
+                cols[k] = np.asarray(values_k, dtype=np.int64)
+            elif k in _STR_FIELDS:
+                cols[k] = np.asarray([v or "" for v in values_k], dtype=str)
+            else:
+                cols[k] = np.asarray(
+                    [np.nan if v is None else v for v in values_k], dtype=np.float64
+                )
+        return cls(cols)
+
+    @classmethod
+    def read_npz(cls, path: str | Path) -> ResultTable:
+        with np.load(Path(path), allow_pickle=False) as data:
+            return cls({k: data[k] for k in FIELDS})
+
+    # -----------------------
+    # Column / row access
+    # -----------------------
+
+    def column(self, name: str) -> np.ndarray:
+        return self._cols[name]
+
+    def values(self, name: str) -> list[Any]:
+        """Column as Python values, with None where HitModalResult would hold None."""
+        values = self._cols[name].tolist()
+        if name in _STR_FIELDS:
+            return [v or None for v in values]
+        if name in _OPTIONAL_FLOAT_FIELDS:
+            return [None if v != v else v for v in values]
+        return values
+
+    def __len__(self) -> int:
+        return int(self._cols["hit_id"].shape[0])
+
+    def row(self, i: int) -> HitModalResult:
+        values: dict[str, object] = {}
+        for k in FIELDS:
+            v = self._cols[k][i].item()
+            if k in _STR_FIELDS:
+                v = v or None
+            elif k in _OPTIONAL_FLOAT_FIELDS and v != v:  # NaN -> None
+                v = None
+            values[k] = v
+        return HitModalResult(**values)  # type: ignore[arg-type]
+
+    @overload
+    def __getitem__(self, i: int) -> HitModalResult: ...
+    @overload
+    def __getitem__(self, i: slice | np.ndarray) -> ResultTable: ...
+    def __getitem__(self, i: int | slice | np.ndarray) -> HitModalResult | ResultTable:
+        if isinstance(i, (int, np.integer)):
+            n = len(self)
+            if not -n <= int(i) < n:
+                raise IndexError(i)
+            return self.row(int(i))
+        return ResultTable({k: v[i] for k, v in self._cols.items()})
+
+    def __iter__(self) -> Iterator[HitModalResult]:
+        for i in range(len(self)):
+            yield self.row(i)
+
+    def __repr__(self) -> str:
+        return f"ResultTable(n={len(self)}, accepted={int(np.sum(self.accepted_mask))})"
+
+    # -----------------------
+    # Vectorized summaries
+    # -----------------------
+
+    @property
+    def accepted_mask(self) -> np.ndarray:
+        return self._cols["reject_reason"] == ""
+
+    def accepted(self) -> ResultTable:
+        return self[self.accepted_mask]
+
+    def rejected(self) -> ResultTable:
+        return self[~self.accepted_mask]
+
+    def summary(self, name: str, mask: np.ndarray | None = None) -> FieldSummary:
+        """n/mean/min/max over finite values of a numeric column (optionally masked)."""
+        x = self._cols[name].astype(np.float64, copy=False)
+        if mask is not None:
+            x = x[mask]
+        x = x[np.isfinite(x)]
+        if x.size == 0:
+            return FieldSummary(n=0, mean=None, min=None, max=None)
+        return FieldSummary(
+            n=int(x.size), mean=float(np.mean(x)), min=float(np.min(x)), max=float(np.max(x))
+        )
+
+    def reject_counts(self) -> dict[str, int]:
+        """Rejected hits per reason, most frequent first (ties by name)."""
+        reasons = self._cols["reject_reason"]
+        keys, counts = np.unique(reasons[reasons != ""], return_counts=True)
+        order = sorted(zip(keys.tolist(), counts.tolist()), key=lambda kv: (-kv[1], kv[0]))
+        return {str(k): int(v) for k, v in order}
+
+    def group_by_reject_reason(self) -> dict[str | None, ResultTable]:
+        """Sub-tables keyed by reject reason (None = accepted)."""
+        reasons = self._cols["reject_reason"]
+        return {
+            (str(k) or None): self[reasons == k] for k in np.unique(reasons).tolist()
+        }
+
+    # -----------------------
+    # Bulk writers
+    # -----------------------
+
+    def write_csv(self, path: str | Path) -> Path:
+        """
+        Write one row per hit with the HitModalResult field order.
+        Cells match csv.DictWriter(asdict(row)) output (None -> empty cell).
+        An empty table writes an empty file.
+        """
+        path = Path(path)
+        cols = [self.values(k) for k in FIELDS]  # csv writes None as ""
+
+        with path.open("w", newline="", encoding="utf-8") as f:
+            if len(self):
+                w = csv.writer(f)
+                w.writerow(FIELDS)
+                w.writerows(zip(*cols))
+        return path
+
+    def write_npz(self, path: str | Path) -> Path:
+        path = Path(path)
+        with path.open("wb") as f:
+            np.savez_compressed(f, **self._cols)
+        return path
+
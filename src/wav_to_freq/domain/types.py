@@ -31,6 +31,19 @@ class StereoWav:
     hammer_channel: StereoChannel = StereoChannel.UNKNOWN
 
 
+@dataclass(frozen=True)
+class MultiChannelWav:
+    """Raw multichannel acquisition: hammer + N response channels in the same WAV."""
+
+    fs: float
+    hammer: np.ndarray  # (n_samples,)
+    responses: np.ndarray  # (n_samples, n_channels)
+    path: Path
+    hammer_index: int  # 0-based column of the hammer in the file
+    response_indices: tuple[int, ...]  # file column of each response channel
+    hammer_scores: tuple[float, ...] | None = None  # autodetect score per column
+
+
 @dataclass(frozen=True)
 class HitWindow:
     """One extracted hit window, aligned on the detected impact peak."""
@@ -45,6 +58,34 @@ class HitWindow:
     hammer: np.ndarray  # windowed hammer samples
     accel: np.ndarray  # windowed accel samples
 
+@dataclass(frozen=True)
+class MultiHitWindows:
+    """All hit windows of a multichannel recording, stacked for batch analysis."""
+
+    fs: float
+    hit_ids: np.ndarray  # (n_hits,) 1-based
+    hit_indices: np.ndarray  # (n_hits,) sample index in the full signal
+    pre_n: int  # samples kept before each hit
+
+    hammer: np.ndarray  # (n_hits, n_window)
+    responses: np.ndarray  # (n_hits, n_channels, n_window)
+    response_indices: tuple[int, ...]  # file column of each response channel
+
+    def window(self, i: int, ch: int) -> HitWindow:
+        """Hit i / response channel ch (position in response_indices) as a HitWindow view."""
+        fs = float(self.fs)
+        hit_index = int(self.hit_indices[i])
+        i0 = hit_index - self.pre_n
+        return HitWindow(
+            hit_id=int(self.hit_ids[i]),
+            hit_index=hit_index,
+            t_hit=hit_index / fs,
+            t_start=i0 / fs,
+            t_end=(i0 + self.responses.shape[-1]) / fs,
+            hammer=self.hammer[i],
+            accel=self.responses[i, ch],
+        )
+
 @dataclass(frozen=True)
 class HitDetectionReport:
     n_hits_found: int
@@ -1,6 +1,77 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
 import numpy as np
 from scipy import signal
-from wav_to_freq.dsp.stats import as_f64
+from wav_to_freq.dsp.stats import as_f64, as_work
+
+
+@dataclass(frozen=True)
+class SosFilter:
+    """
+    A Butterworth design in SOS form plus the state sosfiltfilt would
+    recompute on every call: the step-response initial conditions and the
+    odd-extension pad length. Arrays are read-only (instances are shared).
+    """
+
+    sos: np.ndarray
+    zi: np.ndarray  # sosfilt_zi(sos), shape (n_sections, 2)
+    padlen: int
+
+    def filtfilt(self, x: np.ndarray) -> np.ndarray:
+        """Zero-phase filtering, same result as signal.sosfiltfilt(sos, x), in x's float dtype."""
+        x = np.asarray(x)
+        if x.dtype not in (np.float32, np.float64):
+            x = as_work(x)
+        if x.size <= self.padlen:
+            raise ValueError(f"input length {x.size} must be greater than padlen={self.padlen}")
+
+        # SOS sections are well conditioned in single precision; matching the
+        # coefficient dtype keeps sosfilt from upcasting the whole signal.
+        # (a writable copy: sosfilt rejects the cached read-only array)
+        sos = np.array(self.sos, dtype=x.dtype)
+        zi = self.zi.astype(x.dtype, copy=False)
+
+        edge = self.padlen
+        ext = np.concatenate(
+            (2 * x[0] - x[edge:0:-1], x, 2 * x[-1] - x[-2 : -(edge + 2) : -1])
+        )
+        y = signal.sosfilt(sos, ext, zi=zi * ext[0])[0]
+        y = signal.sosfilt(sos, y[::-1], zi=zi * y[-1])[0]
+        return y[::-1][edge:-edge]
+
+
+def butter_sos(
+    fs: float,
+    cutoff_hz: float | tuple[float, float],
+    *,
+    order: int = 4,
+    btype: str = "bandpass",
+) -> SosFilter:
+    """
+    Cached Butterworth design (LRU, keyed on fs, cutoff, order and type).
+
+    Every filter in the package goes through here: the SOS form stays stable
+    for the narrow low-frequency bands used at high fs, where the (b, a)
+    polynomials lose all precision.
+    """
+    if isinstance(cutoff_hz, tuple):
+        key: float | tuple[float, float] = (float(cutoff_hz[0]), float(cutoff_hz[1]))
+    else:
+        key = float(cutoff_hz)
+    return _butter_sos(float(fs), key, int(order), str(btype))
+
+
+@lru_cache(maxsize=256)
+def _butter_sos(fs: float, cutoff_hz: float | tuple[float, float], order: int, btype: str) -> SosFilter:
+    sos = signal.butter(order, cutoff_hz, btype=btype, fs=fs, output="sos")
+    zi = signal.sosfilt_zi(sos)
+    # sosfiltfilt's default pad: 3 * (number of taps), minus trivial zeros
+    ntaps = 2 * sos.shape[0] + 1 - min(int((sos[:, 2] == 0).sum()), int((sos[:, 5] == 0).sum()))
+    sos.setflags(write=False)
+    zi.setflags(write=False)
+    return SosFilter(sos=sos, zi=zi, padlen=3 * ntaps)
+
 
 def highpass(
     x: np.ndarray, fs: float, fc_hz: float = 200.0, order: int = 4
@@ -9,8 +80,41 @@ def highpass(
     High-pass filter to emphasize the hammer impulse vs the long ringdown.
     fc_hz=200 Hz is a decent default for typical impact testing recordings.
     """
-    x = as_f64(x)
+    x = as_work(x)
     nyq = 0.5 * fs
     fc = max(1.0, min(fc_hz, 0.45 * nyq))
-    sos = signal.butter(order, fc / nyq, btype="highpass", output="sos")
-    return signal.sosfiltfilt(sos, x)
+    return butter_sos(fs, fc, order=order, btype="highpass").filtfilt(x)
+
+
+def decimate(x: np.ndarray, fs: float, q: int) -> np.ndarray:
+    """
+    Mean-removed x, zero-phase low-passed at 0.4 fs / q and kept every q-th
+    sample (empty when x is too short for the filter's padding).
+    """
+    x = x - float(np.mean(x))
+    if q == 1:
+        return x
+    lp = butter_sos(fs, 0.4 * fs / q, order=8, btype="lowpass")
+    if x.size <= lp.padlen:
+        return np.empty(0)
+    return lp.filtfilt(x)[::q]
+
+
+def mode_band(fs: float, fn_hz: float) -> tuple[float, float] | None:
+    """Band-pass edges used around a mode at fn_hz (None: band collapses, no filtering)."""
+    lo = max(0.5, 0.6 * float(fn_hz))
+    hi = min(0.49 * float(fs), 1.4 * float(fn_hz))
+    return (lo, hi) if hi > lo else None
+
+
+def bandpass(x: np.ndarray, fs: float, band: tuple[float, float] | None, order: int = 4) -> np.ndarray:
+    """
+    Zero-phase Butterworth band-pass of x (a None band leaves x unfiltered).
+
+    Filtered in float64: for narrow low bands at high fs the poles sit within
+    ~1e-3 of the unit circle and a float32 filter state is off by tens of %.
+    """
+    x = as_work(x)
+    if band is None:
+        return x
+    return butter_sos(fs, band, order=order).filtfilt(as_f64(x)).astype(x.dtype)
@@ -0,0 +1,137 @@
+"""
+Sub-bin spectral peak refinement.
+
+A Welch peak is only as precise as its bin width fs / nperseg (~12 Hz at
+48 kHz with nperseg=4096). Making the segments longer costs more everywhere;
+instead the coarse peak is refined on the full segment, over a narrow band:
+
+- Jacobsen: on the unpadded-length DFT of the segment (bin fs / len(x)),
+  the maximum within f0 ± half_width, moved by jacobsen_offset on the three
+  complex bins around it. Cheapest, and what the analysis uses (it comes
+  for free with the window's rFFT, see dsp.spectral.WindowSpectrum.peak).
+- zoom_peak: chirp-z zoom FFT over f0 ± half_width, then a parabola through
+  the log-magnitude around the maximum. Finer grid, but the chirp-z costs
+  about three FFTs of the segment (see scripts/bench_fn_refinement.py).
+
+Neither is windowed: a ringdown decays to the noise floor within the
+segment, and a Hann window would suppress its strongest (first) part.
+
+half_power_band reads a peak and its half-power crossings off a power
+spectrum (analysis.fast's bandwidth estimate of zeta).
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy import signal
+
+from wav_to_freq.dsp.stats import as_f64
+
+
+def parabolic_offset(y_m1: float, y_0: float, y_p1: float) -> float:
+    """Vertex offset (in bins, within ±0.5) of the parabola through three samples."""
+    den = y_m1 - 2.0 * y_0 + y_p1
+    if not np.isfinite(den) or den >= 0.0:
+        return 0.0
+    return float(np.clip(0.5 * (y_m1 - y_p1) / den, -0.5, 0.5))
+
+
+def jacobsen_offset(x_m1: complex, x_0: complex, x_p1: complex) -> float:
+    """Jacobsen's estimator of the peak offset (in bins) from three complex DFT bins."""
+    den = 2.0 * x_0 - x_m1 - x_p1
+    if den == 0:
+        return 0.0
+    return float(np.clip(np.real((x_m1 - x_p1) / den), -0.5, 0.5))
+
+
+def spectrum_peak(f: NDArray[np.floating], p: NDArray[np.floating], k: int) -> float:
+    """Frequency of the peak at bin k of a power spectrum, refined by a log-power parabola."""
+    if k <= 0 or k >= p.size - 1:
+        return float(f[k])
+    eps = np.finfo(float).eps
+    y = np.log(np.asarray(p[k - 1 : k + 2], dtype=np.float64) + eps)
+    return float(f[k] + parabolic_offset(*y) * (f[1] - f[0]))
+
+
+def half_power_band(
+    f: NDArray[np.float64],
+    search: NDArray[np.float64],
+    p: NDArray[np.float64],
+    *,
+    fmin_hz: float,
+    fmax_hz: float,
+) -> tuple[float, float, float]:
+    """
+    Peak of p at the largest `search` bin in the band (moved to the local
+    maximum of p), and the half-power crossings of p either side of it.
+    """
+    nan = float("nan")
+    band = np.flatnonzero((f >= float(fmin_hz)) & (f <= float(fmax_hz)) & np.isfinite(search) & np.isfinite(p))
+    if band.size < 3:
+        return nan, nan, nan
+    lo_edge, hi_edge = int(band[0]), int(band[-1])
+
+    k = int(band[np.argmax(search[band])])
+    while k > lo_edge and p[k - 1] > p[k]:
+        k -= 1
+    while k < hi_edge and p[k + 1] > p[k]:
+        k += 1
+    fn = spectrum_peak(f, p, k)
+    half = 0.5 * _peak_value(p, k)
+
+    f_lo = nan
+    i = k
+    while i > lo_edge and p[i] > half:
+        i -= 1
+    if p[i] <= half:
+        f_lo = float(np.interp(half, [p[i], p[i + 1]], [f[i], f[i + 1]]))
+
+    f_hi = nan
+    i = k
+    while i < hi_edge and p[i] > half:
+        i += 1
+    if p[i] <= half:
+        f_hi = float(np.interp(half, [p[i], p[i - 1]], [f[i], f[i - 1]]))
+
+    return float(fn), f_lo, f_hi
+
+
+def _peak_value(p: NDArray[np.float64], k: int) -> float:
+    # height of the log-power parabola through the peak bin and its neighbours
+    if k <= 0 or k >= p.size - 1 or np.any(p[k - 1 : k + 2] <= 0):
+        return float(p[k])
+    y_m1, y_0, y_p1 = np.log(p[k - 1 : k + 2])
+    offset = parabolic_offset(y_m1, y_0, y_p1)
+    return float(np.exp(y_0 - 0.25 * (y_m1 - y_p1) * offset))
+
+
+def zoom_peak(
+    x: NDArray[np.floating],
+    fs: float,
+    f0_hz: float,
+    *,
+    half_width_hz: float,
+    n_points: int = 64,
+) -> float:
+    """
+    Refine a coarse peak at f0_hz: magnitude maximum of the zoom FFT of x over
+    [f0 - half_width, f0 + half_width], interpolated between grid points.
+    Returns f0_hz when the band or signal is unusable.
+    """
+    fs = float(fs)
+    x = as_f64(x)
+    lo = max(0.0, float(f0_hz) - float(half_width_hz))
+    hi = min(0.5 * fs, float(f0_hz) + float(half_width_hz))
+    if x.size < 16 or hi <= lo or n_points < 3:
+        return float(f0_hz)
+
+    mag = np.abs(signal.zoom_fft(x - float(np.mean(x)), [lo, hi], m=int(n_points), fs=fs, endpoint=True))
+    k = int(np.argmax(mag))
+    step = (hi - lo) / (int(n_points) - 1)
+    if 0 < k < mag.size - 1:
+        eps = np.finfo(float).eps
+        offset = parabolic_offset(*np.log(mag[k - 1 : k + 2] + eps))
+    else:
+        offset = 0.0
+    return float(lo + (k + offset) * step)
@@ -0,0 +1,175 @@
+"""
+FFT-length-aware spectral helpers.
+
+Window lengths come from round(ring_s * fs) and friends and often have large
+prime factors (47870 = 2 * 5 * 4787), where a plain FFT is several times
+slower than at a nearby 5-smooth length. Everything here pads to
+scipy.fft.next_fast_len, and transforms run on get_fft_workers() threads.
+
+WindowSpectrum holds one rFFT of a window and serves the sub-bin peak
+refinement (from the unpadded-length DFT) and, when padded 2x, zero-phase
+band-pass / Hilbert envelopes for any number of bands (one stacked multiply,
+one batched inverse FFT). hilbert_envelope is the drop-in for abs(scipy.signal.hilbert(x)), and
+welch_psd for signal.welch.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy import fft, signal
+
+from wav_to_freq.domain.config import FFT_WORKERS
+from wav_to_freq.dsp.filters import butter_sos
+from wav_to_freq.dsp.peaks import jacobsen_offset
+from wav_to_freq.dsp.stats import as_f64, as_work
+
+Band = tuple[float, float] | None
+
+
+_fft_workers: int = int(os.environ.get("WAV_TO_FREQ_FFT_WORKERS", FFT_WORKERS))
+
+
+def set_fft_workers(workers: int) -> None:
+    """Set the process-wide scipy.fft thread count (-1: all cores)."""
+    global _fft_workers
+    _fft_workers = int(workers)
+
+
+def get_fft_workers() -> int:
+    return _fft_workers
+
+
+def share_fft_workers(n_parallel: int) -> None:
+    """
+    Split the cores between n_parallel analyses running at once (worker
+    processes or threads): cpu_count // n_parallel threads per transform.
+    A WAV_TO_FREQ_FFT_WORKERS setting takes precedence.
+    """
+    if "WAV_TO_FREQ_FFT_WORKERS" not in os.environ:
+        set_fft_workers(max(1, (os.cpu_count() or 1) // max(1, int(n_parallel))))
+
+
+def welch_nperseg(n: int) -> int:
+    """Welch segment length used for a window of n samples."""
+    return min(4096, max(256, int(n) // 2))
+
+
+def welch_psd(
+    x: NDArray[np.floating], fs: float, *, nperseg: int | None = None
+) -> tuple[NDArray[np.float64], NDArray[np.floating]]:
+    """Welch PSD with segments zero-padded to a fast FFT length."""
+    x = as_work(x)
+    nperseg = welch_nperseg(x.size) if nperseg is None else int(nperseg)
+    with fft.set_workers(_fft_workers):  # welch's internal transforms
+        return signal.welch(x, fs=float(fs), nperseg=nperseg, nfft=fft.next_fast_len(nperseg, real=True))
+
+
+@lru_cache(maxsize=64)
+def _zero_phase_gain(fs: float, band: Band, order: int, nfft: int) -> np.ndarray:
+    # |H|² on the rfft grid: the magnitude of a forward-backward (filtfilt) pass
+    if band is None:
+        gain = np.ones(nfft // 2 + 1)
+    else:
+        _, h = signal.sosfreqz(butter_sos(fs, band, order=order).sos, worN=fft.rfftfreq(nfft, 1.0 / fs), fs=fs)
+        gain = np.abs(h) ** 2
+    gain.setflags(write=False)
+    return gain
+
+
+@lru_cache(maxsize=64)
+def _analytic_weight(nfft: int) -> np.ndarray:
+    # analytic signal: keep DC/Nyquist, double positive frequencies, drop negative ones
+    weight = np.full(nfft // 2 + 1, 2.0)
+    weight[0] = 1.0
+    if nfft % 2 == 0:
+        weight[-1] = 1.0
+    weight.setflags(write=False)
+    return weight
+
+
+@dataclass(frozen=True)
+class WindowSpectrum:
+    """
+    rFFT of a window zero-padded to nfft = pad * next_fast_len(n). Every
+    pad-th bin is exactly the DFT of the window padded to next_fast_len(n),
+    which is all peak() needs (pad=1). analytic() and envelopes() need pad=2:
+    at least twice the window's length, so zero-phase filters and the Hilbert
+    transform do not wrap around.
+    """
+
+    fs: float
+    n: int
+    nfft: int
+    spec: NDArray[np.complex128]
+    dtype: np.dtype  # dtype of the input window (outputs are cast back)
+    pad: int = 2
+
+    @classmethod
+    def of(cls, x: NDArray[np.floating], fs: float, *, pad: int = 2) -> WindowSpectrum:
+        if pad not in (1, 2):
+            raise ValueError(f"pad must be 1 or 2, got {pad!r}")
+        x = as_work(x)
+        nfft = pad * fft.next_fast_len(max(1, x.size), real=True)
+        spec = fft.rfft(as_f64(x), nfft, workers=_fft_workers)
+        return cls(fs=float(fs), n=int(x.size), nfft=int(nfft), spec=spec, dtype=x.dtype, pad=int(pad))
+
+    def peak(self, f0_hz: float, *, half_width_hz: float) -> float:
+        """
+        Refine a coarse peak at f0_hz: largest bin of the unpadded-length DFT
+        within f0 ± half_width, moved by Jacobsen's offset. Returns f0_hz when
+        no bin of the band has neighbours on both sides.
+        """
+        spec = self.spec[:: self.pad]
+        df = self.pad * self.fs / self.nfft
+        k0 = max(1, int(np.ceil((float(f0_hz) - float(half_width_hz)) / df)))
+        k1 = min(spec.size - 2, int(np.floor((float(f0_hz) + float(half_width_hz)) / df)))
+        if self.n < 16 or k1 < k0:
+            return float(f0_hz)
+
+        k = k0 + int(np.argmax(np.abs(spec[k0 : k1 + 1])))
+        return float((k + jacobsen_offset(spec[k - 1], spec[k], spec[k + 1])) * df)
+
+    def analytic(self, bands: list[Band], *, order: int = 4) -> NDArray[np.complexfloating]:
+        """
+        Analytic signals of the window band-passed (zero phase) to each band,
+        shape (len(bands), n): the real part is the filtered window, the
+        magnitude its Hilbert envelope. A None band leaves the window unfiltered.
+
+        The inverse transform runs at the window's precision (complex64 for
+        float32 work data, ~2.5x faster); the forward rFFT stays float64
+        for peak refinement.
+        """
+        if self.pad < 2:
+            raise ValueError("analytic() needs a spectrum padded 2x (WindowSpectrum.of(x, fs, pad=2))")
+        ctype = np.result_type(self.dtype, np.complex64)
+        if self.n == 0 or not bands:
+            return np.zeros((len(bands), self.n), dtype=ctype)
+        gains = np.stack([_zero_phase_gain(self.fs, b, int(order), self.nfft) for b in bands])
+        weighted = self.spec * _analytic_weight(self.nfft)
+        z = (gains * weighted).astype(ctype, copy=False)
+        return fft.ifft(z, self.nfft, axis=-1, workers=_fft_workers)[:, : self.n]
+
+    def envelopes(self, bands: list[Band], *, order: int = 4) -> NDArray[np.floating]:
+        """Hilbert envelopes of the window band-passed to each band, shape (len(bands), n)."""
+        return np.abs(self.analytic(bands, order=order)).astype(self.dtype)
+
+
+def hilbert_envelope(x: NDArray[np.floating]) -> NDArray[np.floating]:
+    """
+    abs(scipy.signal.hilbert(x)), with the transform zero-padded to a fast length.
+
+    Circular, like scipy's: the end of a ringdown envelope carries energy
+    wrapped around from its (much larger) start. The damping fit's noise-tail
+    rules were tuned on exactly that envelope, so it is kept for the analysis.
+    """
+    x = as_work(x)
+    if x.size == 0:
+        return x
+    nfft = fft.next_fast_len(x.size, real=True)
+    spec = fft.rfft(x, nfft, workers=_fft_workers) * _analytic_weight(nfft)
+    return np.abs(fft.ifft(spec, nfft, workers=_fft_workers)[: x.size]).astype(x.dtype)
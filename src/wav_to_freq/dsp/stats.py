@@ -1,24 +1,54 @@
+import os
+
 import numpy as np
 from scipy import signal
-from wav_to_freq.domain.config import EPS
+from wav_to_freq.domain.config import EPS, WORK_DTYPE
+
+_ALLOWED_WORK_DTYPES = ("float32", "float64")
+
+
+def _check_work_dtype(dtype: str | type | np.dtype) -> np.dtype:
+    dt = np.dtype(dtype)
+    if dt.name not in _ALLOWED_WORK_DTYPES:
+        raise ValueError(f"work dtype must be one of {_ALLOWED_WORK_DTYPES}. Got {dt.name!r}")
+    return dt
+
+
+_work_dtype: np.dtype = _check_work_dtype(os.environ.get("WAV_TO_FREQ_DTYPE", WORK_DTYPE))
+
+
+def set_work_dtype(dtype: str | type | np.dtype) -> None:
+    """Set the process-wide storage/compute dtype ("float32" or "float64")."""
+    global _work_dtype
+    _work_dtype = _check_work_dtype(dtype)
+
+
+def get_work_dtype() -> np.dtype:
+    return _work_dtype
 
 
 def as_f64(x: np.ndarray) -> np.ndarray:
+    """Force float64 (for numerically sensitive steps only)."""
     return np.asarray(x, dtype=np.float64)
 
 
+def as_work(x: np.ndarray) -> np.ndarray:
+    """Cast to the configured work dtype (no copy when already matching)."""
+    return np.asarray(x, dtype=_work_dtype)
+
+
 def moving_mean(x: np.ndarray, win: int) -> np.ndarray:
     """Fast moving average using convolution. win must be >= 1."""
-    x = as_f64(x)
+    x = as_work(x)
     if win <= 1:
         return x
-    k = np.ones(int(win), dtype=np.float64) / float(win)
+    k = np.full(int(win), 1.0 / float(win), dtype=x.dtype)
     return np.convolve(x, k, mode="same")
 
 
 def robust_sigma_mad(x: np.ndarray) -> float:
     """Robust sigma estimate based on MAD."""
-    x = as_f64(x)
+    x = as_work(x)
     med = float(np.median(x))
     mad = float(np.median(np.abs(x - med)) + EPS)
     return 1.4826 * mad
@@ -20,3 +20,15 @@ def auto_pick_hammer_channel(
         ch = StereoChannel.RIGHT
 
     return ch, float(sL), float(sR)
+
+
+def auto_pick_hammer_index(data: np.ndarray, fs: float) -> tuple[int, list[float]]:
+    """
+    Multichannel variant: pick the most impulsive column of data (n_samples, n_channels).
+    Returns (column index, per-column kurtosis scores).
+    """
+    scores = [
+        kurtosis_spikiness(highpass(data[:, k], fs, fc_hz=200.0))
+        for k in range(data.shape[1])
+    ]
+    return int(np.argmax(scores)), [float(s) for s in scores]
@@ -1,40 +1,93 @@
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal, Sequence
 import numpy as np
 
 from wav_to_freq.domain.enums import StereoChannel
-from wav_to_freq.domain.types import HitDetectionReport, HitWindow, StereoWav
+from wav_to_freq.domain.types import (
+    HitDetectionReport,
+    HitWindow,
+    MultiChannelWav,
+    MultiHitWindows,
+    StereoWav,
+)
 from wav_to_freq.dsp.filters import highpass
-from wav_to_freq.dsp.stats import as_f64, moving_mean, robust_sigma_mad
+from wav_to_freq.dsp.stats import as_work, moving_mean, robust_sigma_mad
 
 from scipy import signal
 
-from wav_to_freq.io.wav_reader import load_stereo_wav
+from wav_to_freq.io.wav_reader import load_multichannel_wav, load_stereo_wav
 
-def detect_hits(
+@dataclass(frozen=True)
+class DetectionEnvelope:
+    """
+    Pre-peak detection envelope of the hammer channel.
+
+    Holds everything `detect_hits` computes before the peak search (high-pass,
+    rectification, smoothing, baseline statistics), so re-tuning
+    threshold_sigma / min_separation_s only re-runs `find_peaks`.
+    """
+
+    y: np.ndarray
+    fs: float
+    baseline_median: float
+    baseline_sigma: float
+    p999: float
+
+    def threshold(
+        self,
+        *,
+        threshold_sigma: float = 8.0,
+        min_abs_threshold: float | None = None,
+    ) -> float:
+        thr_noise = float(self.baseline_median + threshold_sigma * self.baseline_sigma)
+
+        # percentile fallback (important when baseline is too quiet)
+        if min_abs_threshold is None:
+            min_abs_threshold = 0.25 * self.p999
+
+        return max(thr_noise, float(min_abs_threshold))
+
+    def detect(
+        self,
+        *,
+        threshold_sigma: float = 8.0,
+        min_separation_s: float = 0.30,
+        min_abs_threshold: float | None = None,
+        prominence_factor: float = 8.0,
+    ) -> tuple[np.ndarray, float]:
+        """Run the peak search only. Returns (hit indices, threshold)."""
+        thr = self.threshold(
+            threshold_sigma=threshold_sigma, min_abs_threshold=min_abs_threshold
+        )
+
+        # prominence to reject small bumps
+        prom = max(float(prominence_factor * self.baseline_sigma), 0.25 * thr)
+
+        min_sep = int(max(1, round(min_separation_s * self.fs)))
+        peaks, _ = signal.find_peaks(
+            self.y, height=thr, distance=min_sep, prominence=prom
+        )
+        return peaks.astype(int, copy=False), thr
+
+
+def compute_detection_envelope(
     hammer: np.ndarray,
     fs: float,
     *,
     baseline_s: float = 2.0,
-    threshold_sigma: float = 8.0,
-    min_separation_s: float = 0.30,
     polarity: Literal["abs", "positive", "negative"] = "abs",
-    min_abs_threshold: float | None = None,
-    prominence_factor: float = 8.0,
     highpass_hz: float = 200.0,
     smooth_s: float = 0.003,
-) -> tuple[np.ndarray, float]:
+) -> DetectionEnvelope:
     """
-    Detect hit indices from the hammer channel.
-
-    Robust strategy:
+    Build the reusable pre-peak envelope:
       - high-pass to remove ringdown “bulk”
       - abs envelope (or polarity)
       - smooth a little
-      - baseline MAD threshold + percentile fallback
-      - prominence + min separation
+      - baseline MAD statistics + 99.9th percentile
     """
-    hammer = as_f64(hammer)
+    hammer = as_work(hammer)
 
     xhp = highpass(hammer, fs, fc_hz=highpass_hz)
     if polarity == "abs":
@@ -50,23 +103,55 @@ def detect_hits(
     n0 = int(max(1000, min(y.size, round(baseline_s * fs))))
     base = y[:n0]
 
-    sigma = robust_sigma_mad(base)
-    thr_noise = float(np.median(base) + threshold_sigma * sigma)
-
-    # percentile fallback (important when baseline is too quiet)
-    if min_abs_threshold is None:
-        p = float(np.percentile(y, 99.9))
-        min_abs_threshold = 0.25 * p
+    return DetectionEnvelope(
+        y=y,
+        fs=float(fs),
+        baseline_median=float(np.median(base)),
+        baseline_sigma=robust_sigma_mad(base),
+        p999=float(np.percentile(y, 99.9)),
+    )
 
-    thr = max(thr_noise, float(min_abs_threshold))
 
-    # prominence to reject small bumps
-    prom = max(float(prominence_factor * sigma), 0.25 * thr)
+def detect_hits(
+    hammer: np.ndarray,
+    fs: float,
+    *,
+    baseline_s: float = 2.0,
+    threshold_sigma: float = 8.0,
+    min_separation_s: float = 0.30,
+    polarity: Literal["abs", "positive", "negative"] = "abs",
+    min_abs_threshold: float | None = None,
+    prominence_factor: float = 8.0,
+    highpass_hz: float = 200.0,
+    smooth_s: float = 0.003,
+) -> tuple[np.ndarray, float]:
+    """
+    Detect hit indices from the hammer channel.
 
-    min_sep = int(max(1, round(min_separation_s * fs)))
-    peaks, _ = signal.find_peaks(y, height=thr, distance=min_sep, prominence=prom)
+    Robust strategy:
+      - high-pass to remove ringdown “bulk”
+      - abs envelope (or polarity)
+      - smooth a little
+      - baseline MAD threshold + percentile fallback
+      - prominence + min separation
 
-    return peaks.astype(int, copy=False), thr
+    For repeated detection with different thresholds, build the envelope once
+    with `compute_detection_envelope` and call `DetectionEnvelope.detect`.
+    """
+    envelope = compute_detection_envelope(
+        hammer,
+        fs,
+        baseline_s=baseline_s,
+        polarity=polarity,
+        highpass_hz=highpass_hz,
+        smooth_s=smooth_s,
+    )
+    return envelope.detect(
+        threshold_sigma=threshold_sigma,
+        min_separation_s=min_separation_s,
+        min_abs_threshold=min_abs_threshold,
+        prominence_factor=prominence_factor,
+    )
 
 def extract_hit_windows(
     stereo: StereoWav,
@@ -134,7 +219,29 @@ def prepare_hits(
       - extract per-hit windows
     """
     stereo = load_stereo_wav(wav_path, hammer_channel=hammer_channel)
+    windows, report = detect_and_extract_hits(
+        stereo,
+        baseline_s=baseline_s,
+        threshold_sigma=threshold_sigma,
+        min_separation_s=min_separation_s,
+        polarity=polarity,
+        pre_s=pre_s,
+        post_s=post_s,
+    )
+    return stereo, windows, report
 
+
+def detect_and_extract_hits(
+    stereo: StereoWav,
+    *,
+    baseline_s: float = 2.0,
+    threshold_sigma: float = 8.0,
+    min_separation_s: float = 0.30,
+    polarity: Literal["abs", "positive", "negative"] = "abs",
+    pre_s: float = 0.05,
+    post_s: float = 1.50,
+) -> tuple[list[HitWindow], HitDetectionReport]:
+    """prepare_hits without the load step (for an already decoded recording)."""
     hit_index, thr = detect_hits(
         stereo.hammer,
         stereo.fs,
@@ -154,4 +261,89 @@ def prepare_hits(
         pre_s=float(pre_s),
         post_s=float(post_s),
     )
-    return stereo, windows, report
+    return windows, report
+
+def extract_multichannel_windows(
+    multi: MultiChannelWav,
+    hit_indices: Sequence[int],
+    *,
+    pre_s: float = 0.05,
+    post_s: float = 1.50,
+) -> MultiHitWindows:
+    """
+    Extract the windows of every hit for every response channel in one strided
+    gather. All windows share the same length, so hits whose window would run
+    past the signal bounds are dropped.
+    """
+    fs = float(multi.fs)
+    pre_n = int(round(pre_s * fs))
+    post_n = int(round(post_s * fs))
+    n_win = pre_n + post_n
+    n_samples = multi.hammer.size
+
+    hit_indices = np.asarray(hit_indices, dtype=int)
+    hit_ids = np.arange(1, hit_indices.size + 1)
+    keep = (hit_indices - pre_n >= 0) & (hit_indices + post_n <= n_samples)
+    if n_win > n_samples:
+        keep[:] = False
+    hit_indices = hit_indices[keep]
+    hit_ids = hit_ids[keep]
+    starts = hit_indices - pre_n
+
+    # (n_samples - n_win + 1, n_channels, n_win) view; fancy indexing copies once
+    n_view = max(1, min(n_win, n_samples))
+    resp_view = np.lib.stride_tricks.sliding_window_view(multi.responses, n_view, axis=0)
+    hammer_view = np.lib.stride_tricks.sliding_window_view(multi.hammer, n_view)
+
+    return MultiHitWindows(
+        fs=fs,
+        hit_ids=hit_ids,
+        hit_indices=hit_indices,
+        pre_n=pre_n,
+        hammer=hammer_view[starts],
+        responses=resp_view[starts],
+        response_indices=multi.response_indices,
+    )
+
+
+def prepare_multichannel_hits(
+    wav_path: str | Path,
+    *,
+    hammer_index: int | None = None,
+    # detection params
+    baseline_s: float = 2.0,
+    threshold_sigma: float = 8.0,
+    min_separation_s: float = 0.30,
+    polarity: Literal["abs", "positive", "negative"] = "abs",
+    # window params
+    pre_s: float = 0.05,
+    post_s: float = 1.50,
+) -> tuple[MultiChannelWav, MultiHitWindows, HitDetectionReport]:
+    """
+    Multichannel counterpart of `prepare_hits`:
+      - load the WAV once (auto or forced hammer column)
+      - detect hits once on the hammer
+      - extract windows for all response channels at once
+    """
+    multi = load_multichannel_wav(wav_path, hammer_index=hammer_index)
+
+    hit_index, thr = detect_hits(
+        multi.hammer,
+        multi.fs,
+        baseline_s=baseline_s,
+        threshold_sigma=threshold_sigma,
+        min_separation_s=min_separation_s,
+        polarity=polarity,
+    )
+
+    windows = extract_multichannel_windows(multi, hit_index, pre_s=pre_s, post_s=post_s)
+
+    report = HitDetectionReport(
+        n_hits_found=int(len(hit_index)),
+        n_hits_used=int(windows.hit_ids.size),
+        threshold=float(thr),
+        min_separation_s=float(min_separation_s),
+        pre_s=float(pre_s),
+        post_s=float(post_s),
+    )
+    return multi, windows, report
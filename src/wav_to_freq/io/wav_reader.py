@@ -2,22 +2,49 @@ from pathlib import Path
 import soundfile as sf
 import numpy as np
 from wav_to_freq.domain.enums import StereoChannel
-from wav_to_freq.domain.types import AutoDetectInfo, StereoWav
-from wav_to_freq.dsp.stats import as_f64
-from wav_to_freq.io.channel_pick import auto_pick_hammer_channel
+from wav_to_freq.domain.types import AutoDetectInfo, MultiChannelWav, StereoWav
+from wav_to_freq.dsp.stats import as_work, get_work_dtype
+from wav_to_freq.io.channel_pick import auto_pick_hammer_channel, auto_pick_hammer_index
+
+AUDIO_SUFFIXES: tuple[str, ...] = (".wav", ".flac", ".ogg")
+"""Input formats accepted by the readers (matched case-insensitively)."""
+
+
+def is_audio_file(path: Path) -> bool:
+    return path.suffix.lower() in AUDIO_SUFFIXES
+
+
+def read_audio(path: str | Path) -> tuple[np.ndarray, float]:
+    """
+    Read any supported audio file as (data (n_samples, n_channels), fs),
+    decoded straight into the work dtype in one call (libsndfile decodes
+    FLAC/OGG as it reads).
+    """
+    data, fs = sf.read(str(path), dtype=get_work_dtype().name, always_2d=True)
+    return data, float(fs)
+
+
+def find_latest_audio(input_dir: Path) -> Path | None:
+    """Newest supported audio file (by mtime) directly inside input_dir."""
+    if not input_dir.exists() or not input_dir.is_dir():
+        return None
+    files = [p for p in input_dir.iterdir() if p.is_file() and is_audio_file(p)]
+    if not files:
+        return None
+    return max(files, key=lambda p: p.stat().st_mtime)
 
 
 def read_wav_stereo(path: str | Path) -> tuple[np.ndarray, np.ndarray, float, Path]:
     """
-    Read a stereo wav and return (left, right, fs, Path).
+    Read a stereo wav (or FLAC/OGG) and return (left, right, fs, Path).
     """
     p = Path(path)
-    data, fs = sf.read(str(p), always_2d=True)
+    data, fs = read_audio(p)
     if data.shape[1] != 2:
         raise ValueError(f"Expected stereo WAV (2 channels). Got shape={data.shape}")
 
-    left = as_f64(data[:, 0])
-    right = as_f64(data[:, 1])
+    left = np.ascontiguousarray(as_work(data[:, 0]))
+    right = np.ascontiguousarray(as_work(data[:, 1]))
     return left, right, float(fs), p
 
 def load_stereo_wav(
@@ -63,6 +90,52 @@ def load_stereo_wav(
         autodetect=autodetect,
     )
 
+def read_wav_multichannel(path: str | Path) -> tuple[np.ndarray, float, Path]:
+    """
+    Read a WAV with 2+ channels and return (data (n_samples, n_channels), fs, Path).
+    """
+    p = Path(path)
+    data, fs = read_audio(p)
+    if data.shape[1] < 2:
+        raise ValueError(
+            f"Expected a WAV with hammer + response channels (>= 2). Got shape={data.shape}"
+        )
+    return as_work(data), float(fs), p
+
+
+def load_multichannel_wav(
+    path: str | Path,
+    *,
+    hammer_index: int | None = None,
+) -> MultiChannelWav:
+    """
+    Load a multichannel WAV: one hammer column + N response columns.
+
+    If hammer_index is None the hammer is picked with the same impulsiveness
+    score as the stereo path, applied to every column.
+    """
+    data, fs, p = read_wav_multichannel(path)
+    n_ch = data.shape[1]
+
+    scores: tuple[float, ...] | None = None
+    if hammer_index is None:
+        hammer_index, score_list = auto_pick_hammer_index(data, fs)
+        scores = tuple(score_list)
+    elif not 0 <= hammer_index < n_ch:
+        raise ValueError(f"hammer_index must be in [0, {n_ch}). Got {hammer_index!r}")
+
+    response_indices = tuple(k for k in range(n_ch) if k != hammer_index)
+
+    return MultiChannelWav(
+        fs=fs,
+        hammer=np.ascontiguousarray(data[:, hammer_index]),
+        responses=np.ascontiguousarray(data[:, list(response_indices)]),
+        path=p,
+        hammer_index=int(hammer_index),
+        response_indices=response_indices,
+        hammer_scores=scores,
+    )
+
 def _validate_channel(ch: StereoChannel) -> None:
     if ch not in (StereoChannel.LEFT, StereoChannel.RIGHT):
         raise ValueError(f"hammer_channel must be 'left' or 'right'. Got {ch!r}")
@@ -1,28 +1,89 @@
 # ==== FILE: src/wav_to_freq/pipeline.py ====
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import contextlib
+import itertools
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
+from typing import Any, AsyncIterator, Collection, Literal
 
-from wav_to_freq.analysis.modal import analyze_all_hits
-from wav_to_freq.domain.enums import StereoChannel
-from wav_to_freq.io.hit_detection import prepare_hits
-from wav_to_freq.reporting.writers.modal import ModalReportArtifacts, write_modal_report
+from wav_to_freq.analysis.bootstrap import bootstrap_confidence
+from wav_to_freq.analysis.era import identify_era_hits
+from wav_to_freq.analysis.fast import TIERS, Tier, analyze_hits_tiered
+from wav_to_freq.analysis.gate import GateStats, HitGate
+from wav_to_freq.analysis.frf import estimate_frf
+from wav_to_freq.analysis.modal import (
+    analyze_all_hits,
+    analyze_multichannel_hits,
+    analyze_multimode_hits,
+)
+from wav_to_freq.analysis.quicklook import quicklook_hits
+from wav_to_freq.analysis.sweep import SweepGrid, sweep_hits
+from wav_to_freq.domain.enums import ProgressKind, StereoChannel
+from wav_to_freq.domain.progress import CancelToken, ProgressCallback, ProgressEvent
+from wav_to_freq.domain.types import HitDetectionReport, HitModalResult
+from wav_to_freq.io.hit_detection import prepare_hits, prepare_multichannel_hits
+from wav_to_freq.reporting.writers.era import EraReportArtifacts, write_era_report
+from wav_to_freq.reporting.writers.frf import FrfReportArtifacts, write_frf_report
+from wav_to_freq.reporting.writers.modal import (
+    ModalReportArtifacts,
+    write_modal_report,
+    write_multichannel_results_csv,
+    write_multimode_results_csv,
+)
 from wav_to_freq.reporting.writers.preprocess import (
     PreprocessReportArtifacts,
     write_preprocess_report,
 )
+from wav_to_freq.reporting.writers.pdf import md_to_pdf, md_to_pdf_async
+from wav_to_freq.reporting.writers.quicklook import QuicklookReportArtifacts, write_quicklook_report
+from wav_to_freq.reporting.writers.sweep import SweepReportArtifacts, write_sweep_report
+from wav_to_freq.store.sinks import open_result_sink
+from wav_to_freq.store.sqlite import ResultsDb
+
+CHECKPOINT_STAGES: tuple[str, ...] = (
+    "preprocess_report",
+    "preprocess_pdf",
+    "modal_report",
+    "modal_pdf",
+    "results_db",
+)
+"""
+Stages run_full_report can skip when a previous attempt completed them
+(see skip_stages). prepare_hits always runs (its windows feed the later
+stages) and analyze resumes hit by hit from results_stream instead.
+"""
+
+RunMode = Literal["full", "quicklook"]
+RUN_MODES: tuple[str, ...] = ("full", "quicklook")
 
 
 @dataclass(frozen=True)
 class PipelineArtifacts:
     out_dir: Path
 
-    # preprocessing
-    preprocess: PreprocessReportArtifacts
+    # preprocessing (None for mode="quicklook": see refined)
+    preprocess: PreprocessReportArtifacts | None
 
-    # modal report
-    modal: ModalReportArtifacts
+    # modal report (None for mode="quicklook": see refined)
+    modal: ModalReportArtifacts | None
+
+    # wall time per stage (s), in execution order
+    timings: dict[str, float] = field(default_factory=dict)
+
+    # row id in the results database (when results_db is given)
+    run_id: int | None = None
+
+    # tier_results.csv (when tier is not "full")
+    tier_csv: Path | None = None
+
+    # mode="quicklook": the provisional report, and the full run refining it
+    # in the background (its result has the full artifacts)
+    quicklook: QuicklookReportArtifacts | None = None
+    refined: Future[PipelineArtifacts] | None = None
 
 
 def run_full_report(
@@ -54,21 +115,144 @@ def run_full_report(
     fit_max_s: float = 0.80,
     noise_tail_s: float = 0.20,
     noise_mult: float = 3.0,
+    # estimator tier (see analysis.fast)
+    tier: Tier = "full",
+    agree_tol: float = 0.25,
+    # early-reject pre-checks (see analysis.gate)
+    gate: HitGate | None = None,
     # ----------------------------
     # Reporting
     # ----------------------------
     title_preprocess: str = "WAV preprocessing report",
     title_modal: str = "Modal report",
     max_plot_seconds: float | None = None,
+    bootstrap_n: int = 1000,
+    # ----------------------------
+    # Optional survey database sink
+    # ----------------------------
+    results_db: str | Path | None = None,
+    structure: str | None = None,
+    preset: str | None = None,
+    # ----------------------------
+    # Optional streaming sink (.csv / .jsonl), resumable
+    # ----------------------------
+    results_stream: str | Path | None = None,
+    # ----------------------------
+    # Checkpointing (batch reruns)
+    # ----------------------------
+    export_pdf: bool = True,
+    skip_stages: Collection[str] = (),
+    # ----------------------------
+    # Progress / cancellation
+    # ----------------------------
+    on_progress: ProgressCallback | None = None,
+    cancel: CancelToken | None = None,
+    # ----------------------------
+    # Quick look (on-site triage)
+    # ----------------------------
+    mode: RunMode = "full",
+    time_budget_s: float = 10.0,
+    refine: bool = True,
 ) -> PipelineArtifacts:
     """
     One-call end-to-end report generator.
 
     Pipeline:
-      prepare_hits -> write_preprocess_report -> analyze_all_hits -> write_modal_report
+      prepare_hits -> write_preprocess_report (+ PDF) -> analyze_all_hits
+        -> bootstrap_confidence -> write_modal_report (+ PDF)
+        [-> ResultsDb.record_run when results_db is given]
+
+    bootstrap_n is the number of bootstrap replicates behind the confidence
+    intervals of the modal summary (0 leaves them out).
+
+    tier="fast" or "auto" replaces analyze_all_hits by analyze_hits_tiered
+    (log-decrement / half-power estimates, with tier="auto" falling back to
+    the envelope fit where they are rejected or disagree by more than
+    agree_tol) and writes tier_results.csv.
+
+    gate rejects hopeless hits (clipped, low SNR, peak at a band edge or not
+    prominent) before their envelope fit; the modal report counts them and
+    the time saved.
+
+    With results_stream, every hit is appended to that file as soon as it is
+    analyzed; rerunning with the same file and parameters resumes after the
+    last written hit.
+
+    Stages listed in skip_stages (names from CHECKPOINT_STAGES) are assumed to
+    have completed in out_dir on a previous attempt and are not re-run.
+
+    on_progress receives a ProgressEvent per finished stage, detected hit
+    count, analyzed hit and written figure (from the calling thread). A
+    cancelled token raises RunCancelled before the next stage, hit or figure
+    (a running pandoc is killed); once the database insert has started the run
+    completes.
+
+    mode="quicklook" returns within about time_budget_s (see _run_quicklook):
+    hit detection, then fast-tier estimates of as many hits (spread over the
+    recording, decimated) as the budget allows, written to
+    out_dir/quicklook/ without figures or PDFs. With refine, the same call
+    with mode="full" then runs on a background thread (artifacts.refined),
+    so the final artifacts are those of a full run; preprocess and modal are
+    None until then (the reports do not exist yet).
     """
+    # every other argument, for the refinement of a quick look (taken first,
+    # so parameters added later are forwarded too)
+    full = {k: v for k, v in locals().items() if k not in ("wav_path", "mode", "time_budget_s", "refine")}
+    if mode not in RUN_MODES:
+        raise ValueError(f"mode must be one of {RUN_MODES}, got {mode!r}")
+    if tier not in TIERS:
+        raise ValueError(f"tier must be one of {TIERS}, got {tier!r}")
+    if mode == "quicklook":
+        return _run_quicklook(Path(wav_path), time_budget_s=time_budget_s, refine=refine, full=full)
     wav_path = Path(wav_path)
     out_dir = Path(out_dir)
+    skip = set(skip_stages)
+    timings: dict[str, float] = {}
+    t_stage = time.perf_counter()
+
+    def _check() -> None:
+        if cancel is not None:
+            cancel.raise_if_cancelled()
+
+    def _emit(event: ProgressEvent) -> None:
+        if on_progress is not None:
+            on_progress(event)
+
+    def _lap(stage: str) -> None:
+        nonlocal t_stage
+        now = time.perf_counter()
+        timings[stage] = now - t_stage
+        t_stage = now
+        _emit(ProgressEvent(ProgressKind.STAGE_DONE, stage=stage, seconds=timings[stage]))
+
+    def _run(stage: str) -> bool:
+        """False when the stage is checkpointed as done (its time is not counted)."""
+        nonlocal t_stage
+        if stage in skip:
+            t_stage = time.perf_counter()
+            return False
+        _check()
+        return True
+
+    def _on_result(r: HitModalResult) -> None:
+        _emit(
+            ProgressEvent(
+                ProgressKind.HIT_ANALYZED, index=next(hit_counter), total=n_hits, result=r
+            )
+        )
+        _check()
+
+    def _on_figure(png: Path) -> None:
+        _emit(
+            ProgressEvent(
+                ProgressKind.FIGURE_WRITTEN, index=next(fig_counter), total=n_hits, path=png
+            )
+        )
+        _check()
+
+    hit_counter = itertools.count(1)
+    fig_counter = itertools.count(1)
+    _check()
 
     stereo, windows, rep = prepare_hits(
         wav_path,
@@ -78,19 +262,462 @@ def run_full_report(
         threshold_sigma=threshold_sigma,
         hammer_channel=hammer_channel,
     )
+    n_hits = len(windows)
+    _emit(ProgressEvent(ProgressKind.HITS_DETECTED, total=n_hits))
+    _lap("prepare_hits")
+
+    if _run("preprocess_report"):
+        preprocess = write_preprocess_report(
+            out_dir,
+            stereo=stereo,
+            windows=windows,
+            report=rep,
+            title=title_preprocess,
+            max_plot_seconds=max_plot_seconds,
+            export_pdf=False,
+        )
+        _emit(ProgressEvent(ProgressKind.FIGURE_WRITTEN, path=preprocess.fig_overview))
+        _lap("preprocess_report")
+    else:
+        preprocess = PreprocessReportArtifacts(
+            report_md=out_dir / "report_preprocess.md",
+            fig_overview=out_dir / "figures" / "overview_two_channels.png",
+        )
+
+    if export_pdf:
+        pdf_path = preprocess.report_md.with_suffix(".pdf")
+        if _run("preprocess_pdf"):
+            # root_dir=out_dir so relative image links like figures/... resolve
+            pdf_path = md_to_pdf(
+                preprocess.report_md, root_dir=out_dir, title=title_preprocess, cancel=cancel
+            ).pdf_path
+            _lap("preprocess_pdf")
+        preprocess = replace(preprocess, report_pdf=pdf_path)
+
+    params = dict(
+        pre_s=pre_s,
+        post_s=post_s,
+        min_separation_s=min_separation_s,
+        threshold_sigma=threshold_sigma,
+        fmin_hz=fmin_hz,
+        fmax_hz=fmax_hz,
+        settle_s=settle_s,
+        ring_s=ring_s,
+        transient_s=transient_s,
+        established_min_s=established_min_s,
+        established_r2_min=established_r2_min,
+        fit_max_s=fit_max_s,
+        noise_tail_s=noise_tail_s,
+        noise_mult=noise_mult,
+    )
+    if tier != "full":
+        # only recorded off the default, so streams of earlier runs still resume
+        params.update(tier=tier, agree_tol=agree_tol)
+    if gate is not None:
+        params.update(gate=asdict(gate))
+    gate_stats = GateStats() if gate is not None else None
+    sink = None
+    if results_stream is not None:
+        sink = open_result_sink(
+            results_stream,
+            params={**params, "wav": wav_path.name, "hammer_channel": stereo.hammer_channel.value},
+        )
+
+    _check()
+    # analyze is not a checkpoint: with a results_stream, completed hits are
+    # read back from the sink instead of being recomputed.
+    tier_csv: Path | None = None
+    envelope_hits: set[int] | None = None  # tiered runs: hits whose ζ is the envelope fit
+    try:
+        if tier == "full":
+            results = analyze_all_hits(
+                windows=windows,
+                fs=stereo.fs,
+                settle_s=settle_s,
+                ring_s=ring_s,
+                fmin_hz=fmin_hz,
+                fmax_hz=fmax_hz,
+                transient_s=transient_s,
+                established_min_s=established_min_s,
+                established_r2_min=established_r2_min,
+                fit_max_s=fit_max_s,
+                noise_tail_s=noise_tail_s,
+                noise_mult=noise_mult,
+                sink=sink,
+                on_result=_on_result,
+                gate=gate,
+                gate_stats=gate_stats,
+            )
+        else:
+            tiered = analyze_hits_tiered(
+                windows,
+                stereo.fs,
+                tier=tier,
+                agree_tol=agree_tol,
+                settle_s=settle_s,
+                ring_s=ring_s,
+                fmin_hz=fmin_hz,
+                fmax_hz=fmax_hz,
+                transient_s=transient_s,
+                established_min_s=established_min_s,
+                established_r2_min=established_r2_min,
+                fit_max_s=fit_max_s,
+                noise_tail_s=noise_tail_s,
+                noise_mult=noise_mult,
+                sink=sink,
+                on_result=_on_result,
+                gate=gate,
+                gate_stats=gate_stats,
+            )
+            results = tiered.table
+            envelope_hits = {r.hit_id for r, used in zip(tiered.table, tiered.tier_used) if used == "full"}
+            out_dir.mkdir(parents=True, exist_ok=True)
+            tier_csv = tiered.write_csv(out_dir / "tier_results.csv")
+    finally:
+        if sink is not None:
+            sink.close()
+    _lap("analyze")
+
+    if _run("modal_report"):
+        confidence = None
+        if bootstrap_n > 0:
+            confidence = bootstrap_confidence(
+                windows,
+                stereo.fs,
+                results,
+                settle_s=settle_s,
+                ring_s=ring_s,
+                fmin_hz=fmin_hz,
+                fmax_hz=fmax_hz,
+                n_boot=bootstrap_n,
+                envelope_hits=envelope_hits,
+            )
+        modal = write_modal_report(
+            results=results,
+            out_dir=out_dir,
+            windows=windows,
+            fs=stereo.fs,
+            title=title_modal,
+            export_pdf=False,
+            on_figure=_on_figure,
+            confidence=confidence,
+            gate_stats=gate_stats,
+        )
+        _lap("modal_report")
+    else:
+        modal = ModalReportArtifacts(
+            report_csv=out_dir / "modal_results.csv",
+            report_md=out_dir / "modal_report.md",
+        )
+
+    if export_pdf:
+        pdf_path = modal.report_md.with_suffix(".pdf")
+        if _run("modal_pdf"):
+            pdf_path = md_to_pdf(
+                modal.report_md, root_dir=out_dir, title=title_modal, cancel=cancel
+            ).pdf_path
+            _lap("modal_pdf")
+        modal = replace(modal, report_pdf=pdf_path)
+
+    run_id: int | None = None
+    if results_db is not None and _run("results_db"):
+        with ResultsDb(results_db) as db:
+            run_id = db.record_run(
+                results=results,
+                wav_path=wav_path,
+                fs=stereo.fs,
+                params=params,
+                structure=structure,
+                preset=preset,
+                hammer_channel=stereo.hammer_channel.value,
+                autodetect=stereo.autodetect,
+                timings=timings,
+            )
+        _lap("results_db")
+
+    return PipelineArtifacts(
+        out_dir=out_dir,
+        preprocess=preprocess,
+        modal=modal,
+        timings=timings,
+        run_id=run_id,
+        tier_csv=tier_csv,
+    )
+
+
+def _run_quicklook(
+    wav_path: Path, *, time_budget_s: float, refine: bool, full: dict[str, Any]
+) -> PipelineArtifacts:
+    """
+    run_full_report(mode="quicklook"): full holds the other arguments of the
+    call. Hit detection is not decimated (the refinement must find the same
+    hits); only the quick-look estimates run on decimated windows.
+    on_progress / cancel also apply to the refinement (called from its thread).
+    """
+    deadline = time.perf_counter() + float(time_budget_s)
+    out_dir = Path(full["out_dir"])
+    on_progress, cancel = full["on_progress"], full["cancel"]
+    timings: dict[str, float] = {}
+    t_stage = time.perf_counter()
+
+    def _lap(stage: str) -> None:
+        nonlocal t_stage
+        now = time.perf_counter()
+        timings[stage] = now - t_stage
+        t_stage = now
+        if on_progress is not None:
+            on_progress(ProgressEvent(ProgressKind.STAGE_DONE, stage=stage, seconds=timings[stage]))
+
+    if cancel is not None:
+        cancel.raise_if_cancelled()
+    stereo, windows, _ = prepare_hits(
+        wav_path,
+        pre_s=full["pre_s"],
+        post_s=full["post_s"],
+        min_separation_s=full["min_separation_s"],
+        threshold_sigma=full["threshold_sigma"],
+        hammer_channel=full["hammer_channel"],
+    )
+    if on_progress is not None:
+        on_progress(ProgressEvent(ProgressKind.HITS_DETECTED, total=len(windows)))
+    _lap("prepare_hits")
+
+    ql = quicklook_hits(
+        windows,
+        stereo.fs,
+        deadline=deadline,
+        settle_s=full["settle_s"],
+        ring_s=full["ring_s"],
+        fmin_hz=full["fmin_hz"],
+        fmax_hz=full["fmax_hz"],
+        transient_s=full["transient_s"],
+        established_min_s=full["established_min_s"],
+        established_r2_min=full["established_r2_min"],
+        fit_max_s=full["fit_max_s"],
+        noise_tail_s=full["noise_tail_s"],
+        noise_mult=full["noise_mult"],
+    )
+    quicklook = write_quicklook_report(ql=ql, out_dir=out_dir / "quicklook")
+    _lap("quicklook")
+
+    refined: Future[PipelineArtifacts] | None = None
+    if refine:
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wav-to-freq-refine")
+        refined = pool.submit(run_full_report, wav_path, **full)
+        pool.shutdown(wait=False)
+
+    return PipelineArtifacts(
+        out_dir=out_dir,
+        preprocess=None,
+        modal=None,
+        timings=timings,
+        quicklook=quicklook,
+        refined=refined,
+    )
 
-    preprocess = write_preprocess_report(
-        out_dir,
-        stereo=stereo,
-        windows=windows,
-        report=rep,
-        title=title_preprocess,
-        max_plot_seconds=max_plot_seconds,
+
+# ----------------------------
+# asyncio API
+# ----------------------------
+
+
+class AsyncReportRun:
+    """
+    Handle on a run_full_report started from an event loop (see start_full_report).
+
+        run = start_full_report(wav, out_dir=out)
+        async for event in run:  # ProgressEvent, until the run ends
+            ...
+        artifacts = await run.result()
+
+    The CPU stages run on a worker thread; PDFs are rendered with an asyncio
+    pandoc subprocess. Cancelling (run.cancel(), or cancelling a task awaiting
+    run.result()) stops the worker at its next stage/hit/figure and kills a
+    running pandoc before the cancellation propagates.
+    """
+
+    def __init__(
+        self,
+        wav_path: str | Path,
+        *,
+        executor: ThreadPoolExecutor | None,
+        kwargs: dict[str, Any],
+    ) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._events: asyncio.Queue[ProgressEvent | None] = asyncio.Queue()
+        self._cancel = CancelToken()
+        self._task = asyncio.create_task(self._main(Path(wav_path), executor, kwargs))
+
+    def cancel(self) -> None:
+        self._task.cancel()
+
+    async def result(self) -> PipelineArtifacts:
+        return await self._task
+
+    def __aiter__(self) -> AsyncIterator[ProgressEvent]:
+        return self._iter_events()
+
+    async def _iter_events(self) -> AsyncIterator[ProgressEvent]:
+        while (event := await self._events.get()) is not None:
+            yield event
+        await self._task  # surface a failure or cancellation to the consumer
+
+    def _emit(self, event: ProgressEvent) -> None:
+        # called from the worker thread
+        self._loop.call_soon_threadsafe(self._events.put_nowait, event)
+
+    async def _main(
+        self, wav_path: Path, executor: ThreadPoolExecutor | None, kwargs: dict[str, Any]
+    ) -> PipelineArtifacts:
+        export_pdf = bool(kwargs.pop("export_pdf", True))
+        skip = set(kwargs.get("skip_stages", ()))
+        own_executor = executor is None
+        pool = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="wav-to-freq")
+        try:
+            fut = pool.submit(
+                run_full_report,
+                wav_path,
+                export_pdf=False,
+                on_progress=self._emit,
+                cancel=self._cancel,
+                **kwargs,
+            )
+            try:
+                artifacts = await asyncio.wrap_future(fut)
+            except asyncio.CancelledError:
+                self._cancel.cancel()
+                # let the worker reach its next checkpoint before propagating
+                with contextlib.suppress(BaseException):
+                    await asyncio.wrap_future(fut)
+                raise
+
+            if not export_pdf:
+                return artifacts
+
+            timings = dict(artifacts.timings)
+            out_dir = artifacts.out_dir
+            jobs = (
+                ("preprocess_pdf", artifacts.preprocess, kwargs.get("title_preprocess")),
+                ("modal_pdf", artifacts.modal, kwargs.get("title_modal")),
+            )
+            pdfs: dict[str, Path] = {}
+            for stage, part, title in jobs:
+                pdfs[stage] = part.report_md.with_suffix(".pdf")
+                if stage in skip:
+                    continue
+                t0 = time.perf_counter()
+                pdfs[stage] = (
+                    await md_to_pdf_async(part.report_md, root_dir=out_dir, title=title)
+                ).pdf_path
+                timings[stage] = time.perf_counter() - t0
+                self._events.put_nowait(
+                    ProgressEvent(ProgressKind.STAGE_DONE, stage=stage, seconds=timings[stage])
+                )
+
+            return replace(
+                artifacts,
+                preprocess=replace(artifacts.preprocess, report_pdf=pdfs["preprocess_pdf"]),
+                modal=replace(artifacts.modal, report_pdf=pdfs["modal_pdf"]),
+                timings=timings,
+            )
+        finally:
+            self._events.put_nowait(None)
+            if own_executor:
+                pool.shutdown(wait=False)
+
+
+def start_full_report(
+    wav_path: str | Path,
+    *,
+    executor: ThreadPoolExecutor | None = None,
+    **kwargs: Any,
+) -> AsyncReportRun:
+    """
+    Start run_full_report(wav_path, **kwargs) without blocking the event loop.
+    Must be called from a running loop. Pass a shared ThreadPoolExecutor to
+    bound how many reports run at once (default: one thread per run).
+
+    Only mode="full": a quick look returns before its reports exist, and its
+    refinement already runs on its own thread (call run_full_report with
+    mode="quicklook" directly, and await asyncio.wrap_future(artifacts.refined)).
+    """
+    if kwargs.get("mode", "full") != "full":
+        raise ValueError(f"the asyncio API only runs mode='full', got {kwargs['mode']!r}")
+    return AsyncReportRun(wav_path, executor=executor, kwargs=kwargs)
+
+
+async def run_full_report_async(
+    wav_path: str | Path,
+    *,
+    executor: ThreadPoolExecutor | None = None,
+    on_progress: ProgressCallback | None = None,
+    **kwargs: Any,
+) -> PipelineArtifacts:
+    """Awaitable run_full_report; on_progress is called on the event loop."""
+    run = start_full_report(wav_path, executor=executor, **kwargs)
+    try:
+        async for event in run:
+            if on_progress is not None:
+                on_progress(event)
+        return await run.result()
+    except asyncio.CancelledError:
+        run.cancel()
+        with contextlib.suppress(BaseException):
+            await run.result()
+        raise
+
+
+@dataclass(frozen=True)
+class MultiChannelArtifacts:
+    out_dir: Path
+    report_csv: Path
+    hit_report: HitDetectionReport
+    hammer_index: int
+    results: dict[tuple[int, int], HitModalResult]
+
+
+def run_multichannel_report(
+    wav_path: str | Path,
+    *,
+    out_dir: str | Path,
+    hammer_index: int | None = None,
+    # hit detection / extraction
+    pre_s: float = 0.05,
+    post_s: float = 1.50,
+    min_separation_s: float = 0.30,
+    threshold_sigma: float = 8.0,
+    # modal analysis
+    fmin_hz: float = 1.0,
+    fmax_hz: float = 2000.0,
+    settle_s: float = 0.010,
+    ring_s: float = 1.0,
+    transient_s: float = 0.20,
+    established_min_s: float = 0.40,
+    established_r2_min: float = 0.95,
+    fit_max_s: float = 0.80,
+    noise_tail_s: float = 0.20,
+    noise_mult: float = 3.0,
+) -> MultiChannelArtifacts:
+    """
+    One-pass analysis of a 1 hammer + N responses WAV.
+
+    Pipeline:
+      prepare_multichannel_hits -> analyze_multichannel_hits -> write_multichannel_results_csv
+    """
+    wav_path = Path(wav_path)
+    out_dir = Path(out_dir)
+
+    multi, windows, rep = prepare_multichannel_hits(
+        wav_path,
+        hammer_index=hammer_index,
+        pre_s=pre_s,
+        post_s=post_s,
+        min_separation_s=min_separation_s,
+        threshold_sigma=threshold_sigma,
     )
 
-    results = analyze_all_hits(
-        windows=windows,
-        fs=stereo.fs,
+    results = analyze_multichannel_hits(
+        windows,
         settle_s=settle_s,
         ring_s=ring_s,
         fmin_hz=fmin_hz,
@@ -103,13 +730,247 @@ def run_full_report(
         noise_mult=noise_mult,
     )
 
-    modal = write_modal_report(
+    report_csv = write_multichannel_results_csv(results=results, out_dir=out_dir)
+
+    return MultiChannelArtifacts(
+        out_dir=out_dir,
+        report_csv=report_csv,
+        hit_report=rep,
+        hammer_index=multi.hammer_index,
         results=results,
+    )
+
+
+@dataclass(frozen=True)
+class MultiModeArtifacts:
+    out_dir: Path
+    report_csv: Path
+    hit_report: HitDetectionReport
+    results: dict[tuple[int, int], HitModalResult]
+
+
+def run_multimode_report(
+    wav_path: str | Path,
+    *,
+    out_dir: str | Path,
+    n_modes: int = 3,
+    hammer_channel: StereoChannel = StereoChannel.UNKNOWN,
+    # hit detection / extraction
+    pre_s: float = 0.05,
+    post_s: float = 1.50,
+    min_separation_s: float = 0.30,
+    threshold_sigma: float = 8.0,
+    # modal analysis
+    fmin_hz: float = 1.0,
+    fmax_hz: float = 2000.0,
+    settle_s: float = 0.010,
+    ring_s: float = 1.0,
+    transient_s: float = 0.20,
+    established_min_s: float = 0.40,
+    established_r2_min: float = 0.95,
+    fit_max_s: float = 0.80,
+    noise_tail_s: float = 0.20,
+    noise_mult: float = 3.0,
+) -> MultiModeArtifacts:
+    """
+    fn / zeta of the n_modes strongest modes of every hit, in one pass.
+
+    Pipeline:
+      prepare_hits -> analyze_multimode_hits -> write_multimode_results_csv
+    """
+    out_dir = Path(out_dir)
+
+    stereo, windows, rep = prepare_hits(
+        Path(wav_path),
+        hammer_channel=hammer_channel,
+        pre_s=pre_s,
+        post_s=post_s,
+        min_separation_s=min_separation_s,
+        threshold_sigma=threshold_sigma,
+    )
+
+    results = analyze_multimode_hits(
+        windows,
+        stereo.fs,
+        n_modes=n_modes,
+        settle_s=settle_s,
+        ring_s=ring_s,
+        fmin_hz=fmin_hz,
+        fmax_hz=fmax_hz,
+        transient_s=transient_s,
+        established_min_s=established_min_s,
+        established_r2_min=established_r2_min,
+        fit_max_s=fit_max_s,
+        noise_tail_s=noise_tail_s,
+        noise_mult=noise_mult,
+    )
+
+    report_csv = write_multimode_results_csv(results=results, out_dir=out_dir)
+
+    return MultiModeArtifacts(
         out_dir=out_dir,
-        windows=windows,
-        fs=stereo.fs,
-        title=title_modal,
+        report_csv=report_csv,
+        hit_report=rep,
+        results=results,
+    )
+
+
+def run_sweep_report(
+    wav_path: str | Path,
+    *,
+    out_dir: str | Path,
+    grid: SweepGrid | None = None,
+    hammer_channel: StereoChannel = StereoChannel.UNKNOWN,
+    # hit detection / extraction
+    pre_s: float = 0.05,
+    post_s: float = 1.50,
+    min_separation_s: float = 0.30,
+    threshold_sigma: float = 8.0,
+    # envelope (fixed over the sweep)
+    fmin_hz: float = 1.0,
+    fmax_hz: float = 2000.0,
+    settle_s: float = 0.010,
+    ring_s: float = 1.0,
+    title: str = "Parameter sweep",
+    export_pdf: bool = True,
+) -> SweepReportArtifacts:
+    """
+    Sensitivity of the damping fit to its window knobs.
+
+    Pipeline:
+      prepare_hits -> sweep_hits (envelopes once per hit) -> write_sweep_report
+    """
+    stereo, windows, _ = prepare_hits(
+        Path(wav_path),
+        hammer_channel=hammer_channel,
+        pre_s=pre_s,
+        post_s=post_s,
+        min_separation_s=min_separation_s,
+        threshold_sigma=threshold_sigma,
+    )
+    sweep = sweep_hits(
+        windows,
+        stereo.fs,
+        grid or SweepGrid(),
+        settle_s=settle_s,
+        ring_s=ring_s,
+        fmin_hz=fmin_hz,
+        fmax_hz=fmax_hz,
     )
+    return write_sweep_report(sweep=sweep, out_dir=out_dir, title=title, export_pdf=export_pdf)
 
-    return PipelineArtifacts(out_dir=out_dir, preprocess=preprocess, modal=modal)
 
+def run_frf_report(
+    wav_path: str | Path,
+    *,
+    out_dir: str | Path,
+    hammer_channel: StereoChannel = StereoChannel.UNKNOWN,
+    # hit detection / extraction
+    pre_s: float = 0.05,
+    post_s: float = 1.50,
+    min_separation_s: float = 0.30,
+    threshold_sigma: float = 8.0,
+    # FRF
+    fmin_hz: float = 1.0,
+    fmax_hz: float = 2000.0,
+    force_window_s: float = 0.010,
+    exp_end: float | None = 0.01,
+    title: str = "Ensemble FRF",
+    export_pdf: bool = True,
+) -> FrfReportArtifacts:
+    """
+    One H1 / coherence / fn / zeta estimate for the whole recording.
+
+    Pipeline:
+      prepare_hits -> estimate_frf (all hits, one batched FFT) -> write_frf_report
+    """
+    stereo, windows, _ = prepare_hits(
+        Path(wav_path),
+        hammer_channel=hammer_channel,
+        pre_s=pre_s,
+        post_s=post_s,
+        min_separation_s=min_separation_s,
+        threshold_sigma=threshold_sigma,
+    )
+    frf = estimate_frf(
+        windows,
+        stereo.fs,
+        fmin_hz=fmin_hz,
+        fmax_hz=fmax_hz,
+        force_window_s=force_window_s,
+        exp_end=exp_end,
+    )
+    return write_frf_report(
+        frf=frf, out_dir=out_dir, fmin_hz=fmin_hz, fmax_hz=fmax_hz, title=title, export_pdf=export_pdf
+    )
+
+
+def run_era_report(
+    wav_path: str | Path,
+    *,
+    out_dir: str | Path,
+    n_modes: int = 3,
+    max_order: int = 40,
+    hammer_channel: StereoChannel = StereoChannel.UNKNOWN,
+    # hit detection / extraction
+    pre_s: float = 0.05,
+    post_s: float = 1.50,
+    min_separation_s: float = 0.30,
+    threshold_sigma: float = 8.0,
+    # modal analysis
+    fmin_hz: float = 1.0,
+    fmax_hz: float = 2000.0,
+    settle_s: float = 0.010,
+    ring_s: float = 1.0,
+    transient_s: float = 0.20,
+    established_min_s: float = 0.40,
+    established_r2_min: float = 0.95,
+    fit_max_s: float = 0.80,
+    noise_tail_s: float = 0.20,
+    noise_mult: float = 3.0,
+    title: str = "ERA modal identification",
+    export_pdf: bool = True,
+) -> EraReportArtifacts:
+    """
+    ERA modes of all hits' ringdowns, reported next to the envelope method.
+
+    Pipeline:
+      prepare_hits -> analyze_all_hits (envelope, reference)
+                   -> identify_era_hits (same ringdown segments, all hits at once)
+                   -> write_era_report
+    """
+    stereo, windows, _ = prepare_hits(
+        Path(wav_path),
+        hammer_channel=hammer_channel,
+        pre_s=pre_s,
+        post_s=post_s,
+        min_separation_s=min_separation_s,
+        threshold_sigma=threshold_sigma,
+    )
+    table = analyze_all_hits(
+        windows,
+        stereo.fs,
+        settle_s=settle_s,
+        ring_s=ring_s,
+        fmin_hz=fmin_hz,
+        fmax_hz=fmax_hz,
+        transient_s=transient_s,
+        established_min_s=established_min_s,
+        established_r2_min=established_r2_min,
+        fit_max_s=fit_max_s,
+        noise_tail_s=noise_tail_s,
+        noise_mult=noise_mult,
+    )
+    era = identify_era_hits(
+        windows,
+        stereo.fs,
+        settle_s=settle_s,
+        ring_s=ring_s,
+        fmin_hz=fmin_hz,
+        fmax_hz=fmax_hz,
+        max_order=max_order,
+        n_modes=n_modes,
+    )
+    return write_era_report(
+        era=era, table=table, out_dir=out_dir, fmin_hz=fmin_hz, fmax_hz=fmax_hz, title=title, export_pdf=export_pdf
+    )
@@ -6,21 +6,16 @@ from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from scipy import signal
 
 from wav_to_freq.domain.types import HitModalResult, HitWindow, StereoWav
+from wav_to_freq.dsp.filters import bandpass, mode_band
+from wav_to_freq.dsp.spectral import hilbert_envelope, welch_psd
+from wav_to_freq.dsp.stats import as_work
 
 
 
-def _hilbert_envelope(x: np.ndarray) -> np.ndarray:
-    x = np.asarray(x, dtype=float)
-    if x.size == 0:
-        return x
-    analytic = signal.hilbert(x)
-    return np.abs(analytic)
-
-
 def _exp_fit_with_offset(t: np.ndarray, y: np.ndarray) -> tuple[float, float, float]:
     t = np.asarray(t, dtype=float)
     y = np.asarray(y, dtype=float)
@@ -168,7 +163,9 @@ def plot_overview_two_channels(
         hammer = stereo.hammer
         accel = stereo.accel
 
-    fig, (ax0, ax1) = plt.subplots(2, 1, figsize=(14, 6), sharex=True)
+    # Figure (not pyplot): no global state, so figures can be rendered from worker threads
+    fig = Figure(figsize=(14, 6))
+    ax0, ax1 = fig.subplots(2, 1, sharex=True)
 
     ax0.plot(t, hammer, linewidth=0.8)
     ax0.set_ylabel("Hammer (raw)")
@@ -191,7 +188,6 @@ def plot_overview_two_channels(
     out_png = Path(out_png)
     out_png.parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(out_png, dpi=160)
-    plt.close(fig)
     return out_png
 
 
@@ -223,23 +219,16 @@ def plot_hit_response_report(
     out_png = Path(out_png)
     out_png.parent.mkdir(parents=True, exist_ok=True)
 
-    x_raw = np.asarray(window.accel, dtype=float)
+    x_raw = as_work(window.accel)
     t = np.arange(x_raw.size, dtype=float) / fs
 
     # ---------- Filter around fn (time-domain row #2) ----------
     y = x_raw.copy()
     if np.isfinite(float(result.fn_hz)) and float(result.fn_hz) > 0:
-        fn = float(result.fn_hz)
-        lo = max(0.5, 0.6 * fn)
-        hi = min(0.49 * fs, 1.4 * fn)
-        if hi > lo:
-            b, a = signal.butter(
-                4, [lo / (0.5 * fs), hi / (0.5 * fs)], btype="bandpass"
-            )
-            y = signal.filtfilt(b, a, y)
+        y = bandpass(y, fs, mode_band(fs, float(result.fn_hz)))
 
     y = y - float(np.mean(y))
-    env = _hilbert_envelope(y)
+    env = hilbert_envelope(y)
 
     # ---------- Fit region shading ----------
     if result.fit_t0_s is not None and result.fit_t1_s is not None:
@@ -291,12 +280,11 @@ def plot_hit_response_report(
 
     # ---------- PSD (analysis-consistent segment) ----------
     i0_psd, i1_psd = _analysis_segment_in_window(window, result, fs)
-    seg = np.asarray(x_raw[i0_psd:i1_psd], dtype=float).copy()
+    seg = x_raw[i0_psd:i1_psd].copy()
     seg = seg - float(np.mean(seg))
 
     if seg.size >= 16:
-        nperseg = min(4096, max(256, seg.size // 2))
-        f, pxx = signal.welch(seg, fs=fs, nperseg=nperseg)
+        f, pxx = welch_psd(seg, fs)
         db = 10.0 * np.log10(pxx + np.finfo(float).eps)
         peak_idx = _pick_psd_peaks(
             f, db, n_modes=n_modes, fmin_hz=psd_lo, fmax_hz=psd_hi
@@ -307,7 +295,8 @@ def plot_hit_response_report(
         peak_idx = []
 
     # ---------- Plot (3 rows) ----------
-    fig, (ax0, ax1, ax2) = plt.subplots(3, 1, figsize=(14, 8.5), sharex=False)
+    fig = Figure(figsize=(14, 8.5))
+    ax0, ax1, ax2 = fig.subplots(3, 1, sharex=False)
 
     ax0.plot(t, x_raw, linewidth=0.8, label="raw")
     ax0.grid(True, alpha=0.2)
@@ -381,6 +370,161 @@ def plot_hit_response_report(
     fig.suptitle("  |  ".join(title_bits), y=0.995)
     fig.tight_layout(rect=(0, 0, 1, 0.97))
     fig.savefig(out_png, dpi=160)
-    plt.close(fig)
 
     return out_png
+
+
+# -------------------------
+# Parameter-sweep heatmaps
+# -------------------------
+
+
+def plot_sweep_heatmaps(
+    values: np.ndarray,
+    *,
+    x_values: tuple[float, ...],
+    y_values: tuple[float, ...],
+    row_values: tuple[float, ...],
+    col_values: tuple[float, ...],
+    x_label: str,
+    y_label: str,
+    row_label: str,
+    col_label: str,
+    title: str,
+    out_png: str | Path,
+    fmt: str = ".3g",
+) -> Path:
+    """
+    Grid of annotated heatmaps; values has shape
+    (len(row_values), len(col_values), len(y_values), len(x_values)).
+    One color scale is shared by all panels; NaN cells stay blank.
+    """
+    values = np.asarray(values, dtype=float)
+    out_png = Path(out_png)
+    out_png.parent.mkdir(parents=True, exist_ok=True)
+
+    n_rows, n_cols = len(row_values), len(col_values)
+    finite = values[np.isfinite(values)]
+    vmin = float(finite.min()) if finite.size else 0.0
+    vmax = float(finite.max()) if finite.size else 1.0
+
+    fig = Figure(figsize=(2.0 + 2.6 * n_cols, 1.0 + 2.2 * n_rows))
+    axes = np.atleast_2d(fig.subplots(n_rows, n_cols, squeeze=False))
+    im = None
+    for r, rv in enumerate(row_values):
+        for c, cv in enumerate(col_values):
+            ax = axes[r, c]
+            panel = values[r, c]
+            im = ax.imshow(panel, origin="lower", aspect="auto", vmin=vmin, vmax=vmax, cmap="viridis")
+            for (j, i), v in np.ndenumerate(panel):
+                if np.isfinite(v):
+                    dark = v < 0.5 * (vmin + vmax)  # viridis: dark at the low end
+                    ax.text(i, j, format(v, fmt), ha="center", va="center", fontsize=7, color="w" if dark else "k")
+            ax.set_xticks(range(len(x_values)), [f"{v:g}" for v in x_values])
+            ax.set_yticks(range(len(y_values)), [f"{v:g}" for v in y_values])
+            if r == 0:
+                ax.set_title(f"{col_label}={cv:g}", fontsize=9)
+            if r == n_rows - 1:
+                ax.set_xlabel(x_label)
+            if c == 0:
+                ax.set_ylabel(f"{row_label}={rv:g}\n{y_label}")
+
+    if im is not None:
+        fig.colorbar(im, ax=axes, shrink=0.8)
+    fig.suptitle(title)
+    fig.savefig(out_png, dpi=140, bbox_inches="tight")
+    return out_png
+
+
+# -------------------------
+# Ensemble FRF (H1, coherence)
+# -------------------------
+
+
+def plot_frf(
+    *,
+    f_hz: np.ndarray,
+    h1: np.ndarray,
+    coherence: np.ndarray,
+    fn_hz: float,
+    half_power_hz: tuple[float, float],
+    fmin_hz: float,
+    fmax_hz: float,
+    title: str,
+    out_png: str | Path,
+) -> Path:
+    """|H1| (dB) and coherence over [fmin_hz, fmax_hz], fn and the half-power band marked."""
+    out_png = Path(out_png)
+    out_png.parent.mkdir(parents=True, exist_ok=True)
+
+    m = (f_hz >= fmin_hz) & (f_hz <= fmax_hz)
+    f = f_hz[m]
+    mag_db = 20.0 * np.log10(np.abs(h1[m]) + np.finfo(float).eps)
+
+    fig = Figure(figsize=(14, 7))
+    ax0, ax1 = fig.subplots(2, 1, sharex=True)
+
+    ax0.plot(f, mag_db, linewidth=0.9)
+    ax0.set_ylabel("|H1| (dB)")
+    ax0.grid(True, alpha=0.2)
+    ax1.plot(f, coherence[m], linewidth=0.9, color="tab:green")
+    ax1.set_ylim(0.0, 1.05)
+    ax1.set_ylabel("coherence γ²")
+    ax1.set_xlabel("frequency (Hz)")
+    ax1.grid(True, alpha=0.2)
+
+    for ax in (ax0, ax1):
+        if np.isfinite(fn_hz):
+            ax.axvline(fn_hz, color="tab:red", linewidth=0.8, label=f"fn={fn_hz:.3f} Hz")
+        lo, hi = half_power_hz
+        if np.isfinite(lo) and np.isfinite(hi):
+            ax.axvspan(lo, hi, color="tab:red", alpha=0.12, label="half-power band")
+    ax0.legend(loc="upper right")
+
+    fig.suptitle(title)
+    fig.tight_layout()
+    fig.savefig(out_png, dpi=160)
+    return out_png
+
+
+# -------------------------
+# ERA stabilization diagram
+# -------------------------
+
+
+def plot_stabilization(
+    *,
+    order: np.ndarray,
+    fn_hz: np.ndarray,
+    stable: np.ndarray,
+    modes_fn_hz: np.ndarray,
+    reference_fn_hz: float | None,
+    fmin_hz: float,
+    fmax_hz: float,
+    title: str,
+    out_png: str | Path,
+) -> Path:
+    """Pole frequency vs model order (stable poles filled), identified modes and the envelope fn marked."""
+    out_png = Path(out_png)
+    out_png.parent.mkdir(parents=True, exist_ok=True)
+
+    fig = Figure(figsize=(14, 6))
+    ax = fig.subplots()
+
+    ax.scatter(fn_hz[~stable], order[~stable], s=10, facecolors="none", edgecolors="0.6", label="pole")
+    ax.scatter(fn_hz[stable], order[stable], s=12, color="tab:blue", label="stable pole")
+    for i, f in enumerate(modes_fn_hz):
+        ax.axvline(f, color="tab:blue", linewidth=0.8, alpha=0.6, label="ERA mode" if i == 0 else None)
+    if reference_fn_hz is not None and np.isfinite(reference_fn_hz):
+        ax.axvline(reference_fn_hz, color="tab:red", linestyle="--", linewidth=0.9, label="envelope fn (mean)")
+
+    ax.set_xlim(fmin_hz, fmax_hz)
+    ax.set_xlabel("frequency (Hz)")
+    ax.set_ylabel("model order")
+    ax.grid(True, alpha=0.2)
+    ax.legend(loc="upper right")
+
+    fig.suptitle(title)
+    fig.tight_layout()
+    fig.savefig(out_png, dpi=160)
+    return out_png
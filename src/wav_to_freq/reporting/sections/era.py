@@ -0,0 +1,79 @@
+from pathlib import Path
+
+from wav_to_freq.analysis.era import EraResult
+from wav_to_freq.domain.results import ResultTable
+from wav_to_freq.reporting.markdown import MarkdownDoc
+from wav_to_freq.reporting.plots import plot_stabilization
+from wav_to_freq.utils.formating import custom_format
+
+
+def render_era_figure(
+    era: EraResult, fig_dir: Path, *, reference_fn_hz: float | None, fmin_hz: float, fmax_hz: float
+) -> Path:
+    d = era.diagram
+    return plot_stabilization(
+        order=d.order,
+        fn_hz=d.fn_hz,
+        stable=d.stable,
+        modes_fn_hz=era.fn_hz,
+        reference_fn_hz=reference_fn_hz,
+        fmin_hz=fmin_hz,
+        fmax_hz=fmax_hz,
+        title=f"ERA stabilization ({era.n_segments} hits)",
+        out_png=fig_dir / "era_stabilization.png",
+    )
+
+
+def add_section_era(
+    mdd: MarkdownDoc,
+    *,
+    era: EraResult,
+    table: ResultTable,
+    title: str,
+    figure: Path | None,
+    out_dir: Path,
+) -> None:
+    accepted = table.accepted_mask
+    fn_env = table.summary("fn_hz", accepted)
+    zeta_env = table.summary("zeta", accepted)
+
+    mdd.h1(title)
+    mdd.p(
+        "Modes identified by ERA from the ringdown segments of all hits at once, "
+        "next to the envelope method (mean over its accepted hits). A mode counts "
+        "when its pole is stable across model orders."
+    )
+    mdd.bullet(
+        [
+            f"Hits: **{era.n_segments}** (envelope method: {fn_env.n} accepted)",
+            f"Identified at {custom_format(era.fs, '.1f')} Hz (decimation {era.decimate}), "
+            f"{era.n_rows} Hankel rows, orders 2–{int(era.diagram.order.max()) if era.diagram.order.size else 0}",
+        ]
+    )
+
+    rows = [
+        [
+            "envelope (mean)",
+            custom_format(fn_env.mean, ".3f"),
+            custom_format(zeta_env.mean, ".6f"),
+            "",
+            "",
+        ]
+    ]
+    ref_fn, ref_zeta = fn_env.mean, zeta_env.mean
+    for i, (f, z, k) in enumerate(zip(era.fn_hz, era.zeta, era.n_stable), start=1):
+        # ζ difference only for the ERA mode at the envelope's fn (within 5 %)
+        same_mode = ref_fn is not None and ref_zeta and abs(f - ref_fn) <= 0.05 * ref_fn
+        rows.append(
+            [
+                f"ERA mode {i}",
+                custom_format(float(f), ".3f"),
+                custom_format(float(z), ".6f"),
+                str(int(k)),
+                custom_format(100.0 * (z - ref_zeta) / ref_zeta, "+.1f") + " %" if same_mode else "",
+            ]
+        )
+    mdd.table(["Estimator", "fn (Hz)", "ζ", "stable orders", "ζ vs envelope"], rows)
+
+    if figure is not None:
+        mdd.image(figure.relative_to(out_dir).as_posix(), alt="ERA stabilization diagram")
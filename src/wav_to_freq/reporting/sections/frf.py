@@ -0,0 +1,45 @@
+from pathlib import Path
+
+from wav_to_freq.analysis.frf import FrfEstimate
+from wav_to_freq.reporting.markdown import MarkdownDoc
+from wav_to_freq.reporting.plots import plot_frf
+from wav_to_freq.utils.formating import custom_format
+
+
+def render_frf_figure(frf: FrfEstimate, fig_dir: Path, *, fmin_hz: float, fmax_hz: float) -> Path:
+    return plot_frf(
+        f_hz=frf.f_hz,
+        h1=frf.h1,
+        coherence=frf.coherence,
+        fn_hz=frf.fn_hz,
+        half_power_hz=frf.half_power_hz,
+        fmin_hz=fmin_hz,
+        fmax_hz=fmax_hz,
+        title=f"H1 over {frf.n_hits} hits",
+        out_png=fig_dir / "frf_h1.png",
+    )
+
+
+def add_section_frf(mdd: MarkdownDoc, *, frf: FrfEstimate, title: str, figure: Path | None, out_dir: Path) -> None:
+    lo, hi = frf.half_power_hz
+
+    mdd.h1(title)
+    mdd.p(
+        "H1 = Gfa / Gff averaged over all hits (hammer as force, response as "
+        "acceleration). fn and ζ come from an RFP fit of H1 around its largest "
+        "response peak, with the exponential window's damping removed."
+    )
+    mdd.bullet(
+        [
+            f"Hits averaged: **{frf.n_hits}**",
+            f"fn (Hz): **{custom_format(frf.fn_hz, '.3f')}**",
+            f"zeta: **{custom_format(frf.zeta, '.6f')}**",
+            f"Half-power band (Hz): {custom_format(lo, '.3f')} – {custom_format(hi, '.3f')}",
+            f"Fit R²: {custom_format(frf.fit_r2, '.3f')}",
+            f"Coherence at fn: {custom_format(frf.coherence_fn, '.3f')}",
+            "Response window: "
+            + (f"exponential, tau={custom_format(frf.exp_tau_s, '.3f')} s" if frf.exp_tau_s is not None else "rectangular"),
+        ]
+    )
+    if figure is not None:
+        mdd.image(figure.relative_to(out_dir).as_posix(), alt="H1 and coherence")
@@ -1,76 +1,105 @@
 from pathlib import Path
-from typing import Sequence
+from typing import Callable, Iterable, Sequence
+from wav_to_freq.analysis.bootstrap import Interval, ModalConfidence
+from wav_to_freq.analysis.gate import GateStats
+from wav_to_freq.domain.results import ResultTable
 from wav_to_freq.domain.types import HitModalResult, HitWindow
 from wav_to_freq.reporting.markdown import MarkdownDoc
 from wav_to_freq.reporting.plots import plot_hit_response_report
-from wav_to_freq.utils.formating import custom_format, custom_max, custom_mean, custom_min, is_finite
+from wav_to_freq.utils.formating import custom_format
 
-def add_section_modal_summary(mdd: MarkdownDoc, *, results: Sequence[HitModalResult], title: str):
+def _summary_item(table: ResultTable, label: str, name: str, fmt: str) -> str | None:
+    s = table.summary(name, table.accepted_mask)
+    if s.n == 0:
+        return None
+    return f"{label}: mean={custom_format(s.mean, fmt)}, min={custom_format(s.min, fmt)}, max={custom_format(s.max, fmt)}"
 
-    accepted = [r for r in results if not r.reject_reason]
-    rejected = [r for r in results if r.reject_reason]
+def _ci_item(label: str, ci: Interval, fmt: str, level: float) -> str:
+    return f"{label}: mean={custom_format(ci.estimate, fmt)}, {level:.0%} CI [{custom_format(ci.lo, fmt)}, {custom_format(ci.hi, fmt)}]"
 
-    fn_vals = [float(r.fn_hz) for r in accepted if is_finite(r.fn_hz)]
-    zeta_vals = [float(r.zeta) for r in accepted if is_finite(r.zeta)]
-    snr_vals = [float(r.snr_db) for r in accepted if is_finite(r.snr_db)]
-    r2_vals = [float(r.env_fit_r2) for r in accepted if is_finite(r.env_fit_r2)]
+def add_section_modal_summary(mdd: MarkdownDoc, *, results: ResultTable | Iterable[HitModalResult], title: str, confidence: ModalConfidence | None = None, gate_stats: GateStats | None = None):
+
+    table = ResultTable.from_results(results)
+    n_accepted = int(table.accepted_mask.sum())
+    n_rejected = len(table) - n_accepted
 
     mdd.h1(title)
 
     mdd.bullet(
         [
-            f"Total hits: **{len(results)}**",
-            f"Accepted: **{len(accepted)}**",
-            f"Rejected: **{len(rejected)}**",
+            f"Total hits: **{len(table)}**",
+            f"Accepted: **{n_accepted}**",
+            f"Rejected: **{n_rejected}**",
         ]
     )
 
-    if accepted:
+    if n_accepted:
         mdd.h2("Accepted summary")
-        items: list[str] = []
-        if fn_vals:
-            items.append(
-                f"fn (Hz): mean={custom_format(custom_mean(fn_vals), '.3f')}, min={custom_format(custom_min(fn_vals), '.3f')}, max={custom_format(custom_max(fn_vals), '.3f')}"
-            )
-        if zeta_vals:
-            items.append(
-                f"zeta: mean={custom_format(custom_mean(zeta_vals), '.6f')}, min={custom_format(custom_min(zeta_vals), '.6f')}, max={custom_format(custom_max(zeta_vals), '.6f')}"
+        items = [
+            _summary_item(table, "fn (Hz)", "fn_hz", ".3f"),
+            _summary_item(table, "zeta", "zeta", ".6f"),
+            _summary_item(table, "SNR (dB)", "snr_db", ".2f"),
+            _summary_item(table, "Envelope fit R²", "env_fit_r2", ".3f"),
+        ]
+        mdd.bullet([it for it in items if it is not None])
+
+    if confidence is not None and (confidence.session is not None or confidence.hits or confidence.n_other_tier):
+        mdd.h2("Confidence intervals (bootstrap)")
+        if confidence.session is not None:
+            mdd.p(f"Session: accepted hits resampled {confidence.n_boot} times.")
+            mdd.bullet(
+                [
+                    _ci_item("fn (Hz)", confidence.session.fn_hz, ".3f", confidence.level),
+                    _ci_item("zeta", confidence.session.zeta, ".6f", confidence.level),
+                ]
             )
-        if snr_vals:
-            items.append(
-                f"SNR (dB): mean={custom_format(custom_mean(snr_vals), '.2f')}, min={custom_format(custom_min(snr_vals), '.2f')}, max={custom_format(custom_max(snr_vals), '.2f')}"
+        if confidence.hits:
+            mdd.p(f"Per hit: residual bootstrap of the log-envelope fit ({confidence.n_boot} replicates).")
+            mdd.table(
+                ["Hit", "zeta", f"{confidence.level:.0%} CI low", f"{confidence.level:.0%} CI high"],
+                [
+                    [
+                        f"H{hit_id:03d}",
+                        custom_format(ci.zeta.estimate, ".6f"),
+                        custom_format(ci.zeta.lo, ".6f"),
+                        custom_format(ci.zeta.hi, ".6f"),
+                    ]
+                    for hit_id, ci in sorted(confidence.hits.items())
+                ],
             )
-        if r2_vals:
-            items.append(
-                f"Envelope fit R²: mean={custom_format(custom_mean(r2_vals), '.3f')}, min={custom_format(custom_min(r2_vals), '.3f')}, max={custom_format(custom_max(r2_vals), '.3f')}"
+        if confidence.n_other_tier:
+            mdd.p(
+                f"No per-hit interval for {confidence.n_other_tier} accepted hits whose ζ is not a "
+                "log-envelope fit (fast-tier log decrement, or read back from the results stream)."
             )
-        mdd.bullet(items)
 
-    if rejected:
+    if n_rejected:
         mdd.h2("Rejections (by reason)")
-        counts: dict[str, int] = {}
-        for r in rejected:
-            key = r.reject_reason or "unknown"
-            counts[key] = counts.get(key, 0) + 1
-        mdd.bullet(
-            [
-                f"{k}: {v}"
-                for k, v in sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
-            ]
-        )
-
-def add_section_per_hit_results(mdd: MarkdownDoc, windows: Sequence[HitWindow], results: Sequence[HitModalResult], transient_s: float, fs: float, hits_dir:Path, out_dir:Path):
+        mdd.bullet([f"{k}: {v}" for k, v in table.reject_counts().items()])
 
-    mdd.h2("Hit-by-hit")
+    if gate_stats is not None and gate_stats.n_checked:
+        mdd.h2("Early rejects (pre-checks)")
+        mdd.p(
+            f"{gate_stats.n_rejected} of {gate_stats.n_checked} analyzed hits were rejected before the envelope fit."
+        )
+        if gate_stats.rejected:
+            mdd.bullet([f"{k}: {v}" for k, v in sorted(gate_stats.rejected.items())])
+        if gate_stats.n_fitted:
+            mdd.bullet(
+                [
+                    f"Mean time per fitted hit: {custom_format(1e3 * gate_stats.fitted_s / gate_stats.n_fitted, '.2f')} ms",
+                    f"Estimated time saved: {custom_format(gate_stats.saved_s, '.3f')} s",
+                ]
+            )
 
-    n = min(len(windows), len(results))
-    for i in range(n):
-        w = windows[i]
-        r = results[i]
+def hit_figure_path(hits_dir: Path, hit_id: int) -> Path:
+    return hits_dir / f"H{int(hit_id):03d}_response.png"
 
-        label = f"H{int(r.hit_id):03d}"
-        out_png = hits_dir / f"{label}_response.png"
+def render_hit_figures(windows: Sequence[HitWindow], results: Sequence[HitModalResult], transient_s: float, fs: float, hits_dir: Path, on_figure: Callable[[Path], None] | None = None) -> list[Path]:
 
+    paths: list[Path] = []
+    for w, r in zip(windows, results):
+        out_png = hit_figure_path(hits_dir, r.hit_id)
         plot_hit_response_report(
             fs=fs,
             window=w,
@@ -78,6 +107,24 @@ def add_section_per_hit_results(mdd: MarkdownDoc, windows: Sequence[HitWindow],
             out_png=out_png,
             transient_s=transient_s,
         )
+        paths.append(out_png)
+        if on_figure is not None:
+            on_figure(out_png)
+    return paths
+
+def add_section_per_hit_results(mdd: MarkdownDoc, windows: Sequence[HitWindow], results: Sequence[HitModalResult], transient_s: float, fs: float, hits_dir:Path, out_dir:Path, render: bool = True, on_figure: Callable[[Path], None] | None = None):
+
+    mdd.h2("Hit-by-hit")
+
+    if render:
+        render_hit_figures(windows, results, transient_s, fs, hits_dir, on_figure)
+
+    n = min(len(windows), len(results))
+    for i in range(n):
+        r = results[i]
+
+        label = f"H{int(r.hit_id):03d}"
+        out_png = hit_figure_path(hits_dir, r.hit_id)
 
         mdd.h3(label)
         mdd.bullet(
@@ -0,0 +1,21 @@
+from wav_to_freq.analysis.quicklook import Quicklook
+from wav_to_freq.reporting.markdown import MarkdownDoc
+from wav_to_freq.reporting.sections.modal import add_section_modal_summary
+from wav_to_freq.utils.formating import custom_format
+
+
+def add_section_quicklook(mdd: MarkdownDoc, *, ql: Quicklook, title: str):
+    add_section_modal_summary(mdd, results=ql.table, title=title)
+
+    mdd.h2("Quick look")
+    mdd.p(
+        "Provisional: fast-tier estimates (log decrement / half-power bandwidth) of a subset of the hits, "
+        "spread over the recording. The full report replaces them once it completes."
+    )
+    mdd.bullet(
+        [
+            f"Hits analyzed: **{len(ql.table)}** of {ql.n_hits}" + ("" if ql.complete else " (time budget reached)"),
+            f"Decimation: {ql.decimate}x",
+            f"Analysis time: {custom_format(ql.elapsed_s, '.3f')} s",
+        ]
+    )
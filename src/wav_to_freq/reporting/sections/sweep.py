@@ -0,0 +1,91 @@
+from pathlib import Path
+
+import numpy as np
+
+from wav_to_freq.analysis.sweep import SweepResult
+from wav_to_freq.reporting.markdown import MarkdownDoc
+from wav_to_freq.reporting.plots import plot_sweep_heatmaps
+from wav_to_freq.utils.formating import custom_format
+
+
+def _facets(values: np.ndarray) -> np.ndarray:
+    # (transient, established_min, r2_min, noise_mult) -> (noise_mult, r2_min, established_min, transient)
+    return np.transpose(values, (3, 2, 1, 0))
+
+
+def render_sweep_figures(sweep: SweepResult, fig_dir: Path) -> dict[str, Path]:
+    grid = sweep.grid
+    axes = dict(
+        x_values=grid.transient_s,
+        y_values=grid.established_min_s,
+        row_values=grid.noise_mult,
+        col_values=grid.established_r2_min,
+        x_label="transient_s",
+        y_label="established_min_s",
+        row_label="noise_mult",
+        col_label="established_r2_min",
+    )
+    median = sweep.zeta_quantiles((0.5,))[0]
+    accepted = sweep.accepted.mean(axis=0) if sweep.n_hits else np.full(grid.shape, np.nan)
+    return {
+        "zeta_median": plot_sweep_heatmaps(
+            _facets(median),
+            title="Median ζ of accepted hits",
+            out_png=fig_dir / "sweep_zeta_median.png",
+            fmt=".4f",
+            **axes,
+        ),
+        "accepted_fraction": plot_sweep_heatmaps(
+            _facets(accepted),
+            title="Fraction of hits accepted",
+            out_png=fig_dir / "sweep_accepted_fraction.png",
+            fmt=".2f",
+            **axes,
+        ),
+    }
+
+
+def add_section_sweep(mdd: MarkdownDoc, *, sweep: SweepResult, title: str, figures: dict[str, Path], out_dir: Path) -> None:
+    grid = sweep.grid
+    n_points = int(np.prod(grid.shape))
+
+    mdd.h1(title)
+    mdd.bullet(
+        [f"{axis}: {', '.join(f'{v:g}' for v in getattr(grid, axis))}" for axis in grid.AXES]
+        + [
+            f"fit_max_s: {grid.fit_max_s:g}, noise_tail_s: {grid.noise_tail_s:g} (fixed)",
+            f"Hits: **{sweep.n_hits}**, grid points: **{n_points}**",
+        ]
+    )
+
+    mdd.h2("Sensitivity per hit")
+    mdd.p(
+        "ζ over the grid points where the hit is accepted; spread = (max - min) / median. "
+        "A small spread means ζ does not depend on the window knobs."
+    )
+    rows = []
+    for i in range(sweep.n_hits):
+        acc = sweep.accepted[i]
+        z = sweep.zeta[i][acc]
+        if z.size:
+            lo, med, hi = (float(v) for v in np.quantile(z, (0.0, 0.5, 1.0)))
+            spread = (hi - lo) / med if med > 0 else float("nan")
+        else:
+            lo = med = hi = spread = float("nan")
+        rows.append(
+            [
+                f"H{int(sweep.hit_id[i]):03d}",
+                custom_format(float(sweep.fn_hz[i]), ".3f"),
+                f"{int(acc.sum())}/{n_points}",
+                custom_format(lo, ".6f"),
+                custom_format(med, ".6f"),
+                custom_format(hi, ".6f"),
+                custom_format(spread, ".2f"),
+            ]
+        )
+    mdd.table(["Hit", "fn (Hz)", "accepted", "ζ min", "ζ median", "ζ max", "spread"], rows)
+
+    mdd.h2("Heatmaps")
+    for name, alt in (("zeta_median", "median zeta"), ("accepted_fraction", "accepted fraction")):
+        if name in figures:
+            mdd.image(figures[name].relative_to(out_dir).as_posix(), alt=alt)
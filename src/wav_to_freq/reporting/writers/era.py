@@ -0,0 +1,70 @@
+# src/wav_to_freq/reporting/writers/era.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from wav_to_freq.analysis.era import EraResult
+from wav_to_freq.domain.results import ResultTable
+from wav_to_freq.reporting.markdown import MarkdownDoc
+from wav_to_freq.reporting.sections.era import add_section_era, render_era_figure
+from wav_to_freq.reporting.writers.pdf import md_to_pdf
+from wav_to_freq.utils.paths import ensure_dir
+
+
+@dataclass(frozen=True)
+class EraReportArtifacts:
+    modes_csv: Path
+    stabilization_csv: Path
+    report_md: Path
+    figure: Path | None
+    report_pdf: Path | None = None
+
+
+def write_era_report(
+    *,
+    era: EraResult,
+    table: ResultTable,
+    out_dir: str | Path,
+    fmin_hz: float,
+    fmax_hz: float,
+    title: str = "ERA modal identification",
+    export_pdf: bool = True,
+) -> EraReportArtifacts:
+    """
+    Create ERA artifacts (table: the envelope-method results to compare with):
+      out_dir/
+        era_modes.csv          (fn, zeta, stable orders per identified mode)
+        era_stabilization.csv  (one row per pole per model order)
+        era_report.md
+        era_report.pdf (optional; requires pandoc by default)
+        figures/
+          era_stabilization.png
+    """
+    out_dir = ensure_dir(Path(out_dir))
+    fig_dir = ensure_dir(out_dir / "figures")
+
+    modes_csv = era.write_modes_csv(out_dir / "era_modes.csv")
+    stabilization_csv = era.diagram.write_csv(out_dir / "era_stabilization.csv")
+
+    figure: Path | None = None
+    if era.diagram.order.size:
+        reference = table.summary("fn_hz", table.accepted_mask).mean
+        figure = render_era_figure(era, fig_dir, reference_fn_hz=reference, fmin_hz=fmin_hz, fmax_hz=fmax_hz)
+
+    mdd = MarkdownDoc()
+    add_section_era(mdd, era=era, table=table, title=title, figure=figure, out_dir=out_dir)
+    md_path = out_dir / "era_report.md"
+    md_path.write_text(mdd.to_markdown(), encoding="utf-8")
+
+    pdf_path: Path | None = None
+    if export_pdf:
+        pdf_path = md_to_pdf(md_path, root_dir=out_dir, title=title).pdf_path
+
+    return EraReportArtifacts(
+        modes_csv=modes_csv,
+        stabilization_csv=stabilization_csv,
+        report_md=md_path,
+        figure=figure,
+        report_pdf=pdf_path,
+    )
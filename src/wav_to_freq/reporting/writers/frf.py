@@ -0,0 +1,60 @@
+# src/wav_to_freq/reporting/writers/frf.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from wav_to_freq.analysis.frf import FrfEstimate
+from wav_to_freq.reporting.markdown import MarkdownDoc
+from wav_to_freq.reporting.sections.frf import add_section_frf, render_frf_figure
+from wav_to_freq.reporting.writers.pdf import md_to_pdf
+from wav_to_freq.utils.paths import ensure_dir
+
+
+@dataclass(frozen=True)
+class FrfReportArtifacts:
+    frf_csv: Path
+    report_md: Path
+    figure: Path | None
+    report_pdf: Path | None = None
+
+
+def write_frf_report(
+    *,
+    frf: FrfEstimate,
+    out_dir: str | Path,
+    fmin_hz: float,
+    fmax_hz: float,
+    title: str = "Ensemble FRF",
+    export_pdf: bool = True,
+) -> FrfReportArtifacts:
+    """
+    Create FRF artifacts:
+      out_dir/
+        frf_h1.csv   (one row per frequency bin: |H1|, phase, coherence)
+        frf_report.md
+        frf_report.pdf (optional; requires pandoc by default)
+        figures/
+          frf_h1.png
+    """
+    out_dir = ensure_dir(Path(out_dir))
+    fig_dir = ensure_dir(out_dir / "figures")
+
+    frf_csv = frf.write_csv(out_dir / "frf_h1.csv")
+    figure = render_frf_figure(frf, fig_dir, fmin_hz=fmin_hz, fmax_hz=fmax_hz) if frf.n_hits else None
+
+    mdd = MarkdownDoc()
+    add_section_frf(mdd, frf=frf, title=title, figure=figure, out_dir=out_dir)
+    md_path = out_dir / "frf_report.md"
+    md_path.write_text(mdd.to_markdown(), encoding="utf-8")
+
+    pdf_path: Path | None = None
+    if export_pdf:
+        pdf_path = md_to_pdf(md_path, root_dir=out_dir, title=title).pdf_path
+
+    return FrfReportArtifacts(
+        frf_csv=frf_csv,
+        report_md=md_path,
+        figure=figure,
+        report_pdf=pdf_path,
+    )
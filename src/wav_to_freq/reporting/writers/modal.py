@@ -4,8 +4,11 @@ from __future__ import annotations
 import csv
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Sequence
+from typing import Callable, Iterable, Mapping, Sequence
 
+from wav_to_freq.analysis.bootstrap import ModalConfidence
+from wav_to_freq.analysis.gate import GateStats
+from wav_to_freq.domain.results import ResultTable
 from wav_to_freq.domain.types import HitModalResult, HitWindow
 from wav_to_freq.reporting.markdown import MarkdownDoc
 from wav_to_freq.reporting.sections.modal import add_section_modal_summary, add_section_per_hit_results
@@ -18,22 +21,31 @@ class ModalReportArtifacts:
     report_csv: Path
     report_md: Path
     report_pdf: Path | None = None
+    report_npz: Path | None = None
+    confidence_csv: Path | None = None
 
 
 def write_modal_report(
     *,
-    results: Sequence[HitModalResult],
+    results: ResultTable | Iterable[HitModalResult],
     out_dir: str | Path,
     fs: float,
     windows: Sequence[HitWindow],
     title: str = "Modal report",
     transient_s: float = 0.20,
     export_pdf: bool = True,
+    export_npz: bool = False,
+    render_figures: bool = True,
+    on_figure: Callable[[Path], None] | None = None,
+    confidence: ModalConfidence | None = None,
+    gate_stats: GateStats | None = None,
 ) -> ModalReportArtifacts:
     """
     Create modal artifacts:
       out_dir/
         modal_results.csv
+        modal_results.npz (optional; columnar, reload with ResultTable.read_npz)
+        modal_confidence.csv (when confidence is given; per-hit zeta intervals)
         modal_report.md
         modal_report.pdf (optional; requires pandoc by default)
         figures/
@@ -41,27 +53,29 @@ def write_modal_report(
             ...
 
     If export_pdf=True and pandoc isn't installed, raises RuntimeError.
+    With render_figures=False the per-hit figures are expected to exist already
+    (see sections.modal.render_hit_figures). gate_stats adds an early-reject
+    section (counts by check, time saved).
     """
     out_dir = ensure_dir(Path(out_dir))
     fig_dir = ensure_dir(out_dir / "figures")
     hits_dir = ensure_dir(fig_dir / "hits")
+    results = ResultTable.from_results(results)
 
     # -----------------------
-    # CSV
+    # CSV / NPZ
     # -----------------------
-    csv_path = out_dir / "modal_results.csv"
-    with csv_path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=list(asdict(results[0]).keys()) if results else [])
-        if results:
-            w.writeheader()
-            for r in results:
-                w.writerow(asdict(r))
+    csv_path = results.write_csv(out_dir / "modal_results.csv")
+    npz_path = results.write_npz(out_dir / "modal_results.npz") if export_npz else None
+    ci_path = (
+        write_confidence_csv(confidence=confidence, out_dir=out_dir) if confidence is not None else None
+    )
 
     # -----------------------
     # Markdown
     # -----------------------
     mdd = MarkdownDoc()
-    add_section_modal_summary(mdd=mdd, results=results, title=title)
+    add_section_modal_summary(mdd=mdd, results=results, title=title, confidence=confidence, gate_stats=gate_stats)
     add_section_per_hit_results(
         mdd=mdd,
         windows=windows,
@@ -70,6 +84,8 @@ def write_modal_report(
         fs=fs,
         hits_dir=hits_dir,
         out_dir=out_dir,
+        render=render_figures,
+        on_figure=on_figure,
     )
 
     md_path = out_dir / "modal_report.md"
@@ -83,5 +99,72 @@ def write_modal_report(
             title=title,
         ).pdf_path
 
-    return ModalReportArtifacts(report_csv=csv_path, report_md=md_path, report_pdf=pdf_path)
+    return ModalReportArtifacts(
+        report_csv=csv_path,
+        report_md=md_path,
+        report_pdf=pdf_path,
+        report_npz=npz_path,
+        confidence_csv=ci_path,
+    )
+
+
+def write_confidence_csv(*, confidence: ModalConfidence, out_dir: str | Path) -> Path:
+    """
+    Write out_dir/modal_confidence.csv: one row per accepted hit with its zeta
+    interval, plus a final hit_id="session" row for the mean over hits.
+    """
+    csv_path = Path(out_dir) / "modal_confidence.csv"
+    with csv_path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["hit_id", "zeta", "zeta_lo", "zeta_hi", "fn_hz", "fn_hz_lo", "fn_hz_hi", "level", "n_boot"])
+        for hit_id, ci in sorted(confidence.hits.items()):
+            w.writerow([hit_id, ci.zeta.estimate, ci.zeta.lo, ci.zeta.hi, "", "", "", confidence.level, confidence.n_boot])
+        s = confidence.session
+        if s is not None:
+            w.writerow(
+                ["session", s.zeta.estimate, s.zeta.lo, s.zeta.hi, s.fn_hz.estimate, s.fn_hz.lo, s.fn_hz.hi, confidence.level, confidence.n_boot]
+            )
+    return csv_path
+
+
+
+def write_multichannel_results_csv(
+    *,
+    results: Mapping[tuple[int, int], HitModalResult],
+    out_dir: str | Path,
+) -> Path:
+    """
+    Write out_dir/modal_results_multichannel.csv: one row per (hit, channel),
+    where channel is the 0-based column of the response in the WAV.
+    """
+    out_dir = ensure_dir(Path(out_dir))
+    return _write_keyed_results_csv(results, out_dir / "modal_results_multichannel.csv", key="channel")
+
+
+def write_multimode_results_csv(
+    *,
+    results: Mapping[tuple[int, int], HitModalResult],
+    out_dir: str | Path,
+) -> Path:
+    """
+    Write out_dir/modal_results_modes.csv: one row per (hit, mode), mode
+    1-based by decreasing PSD peak height.
+    """
+    out_dir = ensure_dir(Path(out_dir))
+    return _write_keyed_results_csv(results, out_dir / "modal_results_modes.csv", key="mode")
+
+
+def _write_keyed_results_csv(
+    results: Mapping[tuple[int, int], HitModalResult], csv_path: Path, *, key: str
+) -> Path:
+    keys = sorted(results)
+    with csv_path.open("w", newline="", encoding="utf-8") as f:
+        if keys:
+            first = asdict(results[keys[0]])
+            fieldnames = ["hit_id", key] + [k for k in first if k != "hit_id"]
+            w = csv.DictWriter(f, fieldnames=fieldnames)
+            w.writeheader()
+            for hit_id, sub in keys:
+                w.writerow({**asdict(results[(hit_id, sub)]), key: sub})
 
+    return csv_path
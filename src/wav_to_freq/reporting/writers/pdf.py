@@ -15,12 +15,15 @@ Notes:
 
 from __future__ import annotations
 
+import asyncio
 import shutil
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Sequence, Union
 
+from wav_to_freq.domain.progress import CancelToken
+
 
 @dataclass(frozen=True)
 class PdfExportResult:
@@ -35,6 +38,7 @@ def md_to_pdf(
     root_dir: Optional[Path] = None,
     title: Optional[str] = None,
     prefer_pandoc: bool = True,
+    cancel: Optional[CancelToken] = None,
 ) -> PdfExportResult:
     """
     Convert one or more Markdown files to a single PDF.
@@ -47,6 +51,7 @@ def md_to_pdf(
         title: Optional title injected at top (only for WeasyPrint fallback).
                Pandoc path: use YAML front-matter in your md if you want full control.
         prefer_pandoc: If True, try pandoc first when available.
+        cancel: Optional token; pandoc is killed (RunCancelled) once it is cancelled.
 
     Returns:
         PdfExportResult with output path and engine used.
@@ -56,28 +61,16 @@ def md_to_pdf(
         RuntimeError: if neither pandoc nor weasyprint pipeline can run.
         ValueError: if md_paths is empty.
     """
-    md_list = _normalize_md_paths(md_paths)
-    first_md = md_list[0]
-
-    out_pdf = Path(pdf_path) if pdf_path is not None else first_md.with_suffix(".pdf")
-    out_pdf.parent.mkdir(parents=True, exist_ok=True)
-
-    base_dir = Path(root_dir) if root_dir is not None else first_md.parent
+    md_list, out_pdf, base_dir = _resolve_paths(md_paths, pdf_path, root_dir)
 
     # 1) Try pandoc if requested and available.
     pandoc_ok = prefer_pandoc and _pandoc_available()
     if pandoc_ok:
-        #header_tex_path = (Path(__file__).resolve().parent / "../latex/header.tex").resolve()
-        # inside md_to_pdf(), right before _render_with_pandoc(...)
-        header_tex_path = out_pdf.parent / "_wav_to_freq_header.tex"
-        header_tex_path.write_text(
-            "\\usepackage{float}\n"
-            "\\floatplacement{figure}{H}\n"
-            "\\floatplacement{table}{H}\n",
-            encoding="utf-8",
-        )
+        header_tex_path = _write_pandoc_header(out_pdf)
         try:
-            _render_with_pandoc(md_list, out_pdf, root_dir=base_dir, header_tex_path=header_tex_path)
+            _render_with_pandoc(
+                md_list, out_pdf, root_dir=base_dir, header_tex_path=header_tex_path, cancel=cancel
+            )
             return PdfExportResult(pdf_path=out_pdf, engine="pandoc")
         except subprocess.CalledProcessError as e:
             print("Pandoc failed:\n", e.stderr)
@@ -87,6 +80,63 @@ def md_to_pdf(
     return PdfExportResult(pdf_path=out_pdf, engine="weasyprint")
 
 
+async def md_to_pdf_async(
+    md_paths: Union[Path, Sequence[Path]],
+    pdf_path: Optional[Path] = None,
+    *,
+    root_dir: Optional[Path] = None,
+    title: Optional[str] = None,
+    prefer_pandoc: bool = True,
+) -> PdfExportResult:
+    """
+    md_to_pdf for asyncio callers: pandoc runs as an asyncio subprocess (killed
+    if the awaiting task is cancelled) and the WeasyPrint fallback in a thread.
+    """
+    md_list, out_pdf, base_dir = _resolve_paths(md_paths, pdf_path, root_dir)
+
+    if prefer_pandoc and _pandoc_available():
+        header_tex_path = _write_pandoc_header(out_pdf)
+        proc = await asyncio.create_subprocess_exec(
+            *_pandoc_cmd(md_list, out_pdf, root_dir=base_dir, header_tex_path=header_tex_path),
+            cwd=str(base_dir),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await proc.communicate()
+        except asyncio.CancelledError:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            raise
+        if proc.returncode:
+            print("Pandoc failed:\n", stderr.decode(errors="replace"))
+            raise subprocess.CalledProcessError(
+                proc.returncode, "pandoc", output=stdout, stderr=stderr
+            )
+        return PdfExportResult(pdf_path=out_pdf, engine="pandoc")
+
+    await asyncio.to_thread(
+        _render_with_weasyprint, md_list, out_pdf, root_dir=base_dir, title=title
+    )
+    return PdfExportResult(pdf_path=out_pdf, engine="weasyprint")
+
+
+def _resolve_paths(
+    md_paths: Union[Path, Sequence[Path]],
+    pdf_path: Optional[Path],
+    root_dir: Optional[Path],
+) -> tuple[list[Path], Path, Path]:
+    md_list = _normalize_md_paths(md_paths)
+    first_md = md_list[0]
+
+    out_pdf = Path(pdf_path) if pdf_path is not None else first_md.with_suffix(".pdf")
+    out_pdf.parent.mkdir(parents=True, exist_ok=True)
+
+    base_dir = Path(root_dir) if root_dir is not None else first_md.parent
+    return md_list, out_pdf, base_dir
+
+
 # -------------------------
 # Pandoc renderer
 # -------------------------
@@ -95,14 +145,21 @@ def _pandoc_available() -> bool:
     return shutil.which("pandoc") is not None
 
 
-def _render_with_pandoc(md_list: Sequence[Path], pdf_path: Path, *, root_dir: Path,header_tex_path: Path) -> None:
-    """
-    Uses pandoc to render PDF.
-    This typically needs a PDF engine (LaTeX, etc.) installed on the system.
-    """
+def _write_pandoc_header(out_pdf: Path) -> Path:
+    header_tex_path = out_pdf.parent / "_wav_to_freq_header.tex"
+    header_tex_path.write_text(
+        "\\usepackage{float}\n"
+        "\\floatplacement{figure}{H}\n"
+        "\\floatplacement{table}{H}\n",
+        encoding="utf-8",
+    )
+    return header_tex_path
+
+
+def _pandoc_cmd(md_list: Sequence[Path], pdf_path: Path, *, root_dir: Path, header_tex_path: Path) -> list[str]:
     # pandoc resolves images relative to current working dir and/or resource path.
-    # We'll set cwd=root_dir and provide --resource-path.
-    cmd = [
+    # Callers set cwd=root_dir and we provide --resource-path.
+    return [
         "pandoc",
         "--from=gfm",
         *[str(p) for p in md_list],
@@ -114,14 +171,39 @@ def _render_with_pandoc(md_list: Sequence[Path], pdf_path: Path, *, root_dir: Pa
         str(header_tex_path),
     ]
 
-    subprocess.run(
-        cmd,
-        cwd=str(root_dir),
-        check=True,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-    )
+
+def _render_with_pandoc(md_list: Sequence[Path], pdf_path: Path, *, root_dir: Path,header_tex_path: Path, cancel: Optional[CancelToken] = None) -> None:
+    """
+    Uses pandoc to render PDF.
+    This typically needs a PDF engine (LaTeX, etc.) installed on the system.
+    """
+    cmd = _pandoc_cmd(md_list, pdf_path, root_dir=root_dir, header_tex_path=header_tex_path)
+    if cancel is None:
+        subprocess.run(
+            cmd,
+            cwd=str(root_dir),
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        return
+
+    # poll so a cancelled run does not wait for LaTeX to finish
+    with subprocess.Popen(
+        cmd, cwd=str(root_dir), stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    ) as proc:
+        while True:
+            try:
+                stdout, stderr = proc.communicate(timeout=0.1)
+                break
+            except subprocess.TimeoutExpired:
+                if cancel.cancelled:
+                    proc.kill()
+                    proc.communicate()
+                    cancel.raise_if_cancelled()
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, cmd, output=stdout, stderr=stderr)
 
 
 # -------------------------
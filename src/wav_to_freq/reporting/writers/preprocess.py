@@ -22,6 +22,23 @@ class PreprocessReportArtifacts:
     report_pdf: Path | None = None
 
 
+def render_preprocess_figures(
+    out_dir: str | Path,
+    *,
+    stereo: StereoWav,
+    windows: Sequence[HitWindow],
+    max_plot_seconds: float | None = None,
+) -> Path:
+    """Render out_dir/figures/overview_two_channels.png."""
+    fig_dir = ensure_dir(Path(out_dir) / "figures")
+    return plot_overview_two_channels(
+        stereo,
+        list(windows),
+        fig_dir / "overview_two_channels.png",
+        max_seconds=max_plot_seconds,
+    )
+
+
 def write_preprocess_report(
     out_dir: str | Path,
     *,
@@ -30,7 +47,8 @@ def write_preprocess_report(
     report: HitDetectionReport,
     title: str = "WAV preprocessing report",
     max_plot_seconds: float | None = None,
-    export_pdf: bool = True
+    export_pdf: bool = True,
+    render_figures: bool = True,
 ) -> PreprocessReportArtifacts:
     """
     Create a markdown report + figures for the preprocessing stage.
@@ -40,16 +58,19 @@ def write_preprocess_report(
         report_preprocess.md
         figures/
           overview_two_channels.png
+
+    With render_figures=False the overview is expected to exist already
+    (see render_preprocess_figures).
     """
     out_dir = ensure_dir(Path(out_dir))
     fig_dir = ensure_dir(out_dir / "figures")
 
-    fig_overview = plot_overview_two_channels(
-        stereo,
-        list(windows),
-        fig_dir / "overview_two_channels.png",
-        max_seconds=max_plot_seconds,
-    )
+    if render_figures:
+        fig_overview = render_preprocess_figures(
+            out_dir, stereo=stereo, windows=windows, max_plot_seconds=max_plot_seconds
+        )
+    else:
+        fig_overview = fig_dir / "overview_two_channels.png"
 
     mdd = MarkdownDoc()
     mdd.h1(title)
@@ -0,0 +1,40 @@
+# src/wav_to_freq/reporting/writers/quicklook.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from wav_to_freq.analysis.quicklook import Quicklook
+from wav_to_freq.reporting.markdown import MarkdownDoc
+from wav_to_freq.reporting.sections.quicklook import add_section_quicklook
+from wav_to_freq.utils.paths import ensure_dir
+
+
+@dataclass(frozen=True)
+class QuicklookReportArtifacts:
+    report_csv: Path
+    report_md: Path
+    result: Quicklook
+
+
+def write_quicklook_report(
+    *,
+    ql: Quicklook,
+    out_dir: str | Path,
+    title: str = "Quick look (provisional)",
+) -> QuicklookReportArtifacts:
+    """
+    Create quick-look artifacts (no figures, no PDF):
+      out_dir/
+        quicklook_results.csv  (same columns as modal_results.csv, analyzed hits only)
+        quicklook.md
+    """
+    out_dir = ensure_dir(Path(out_dir))
+    csv_path = ql.table.write_csv(out_dir / "quicklook_results.csv")
+
+    mdd = MarkdownDoc()
+    add_section_quicklook(mdd, ql=ql, title=title)
+    md_path = out_dir / "quicklook.md"
+    md_path.write_text(mdd.to_markdown(), encoding="utf-8")
+
+    return QuicklookReportArtifacts(report_csv=csv_path, report_md=md_path, result=ql)
@@ -0,0 +1,63 @@
+# src/wav_to_freq/reporting/writers/sweep.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from wav_to_freq.analysis.sweep import SweepResult
+from wav_to_freq.reporting.markdown import MarkdownDoc
+from wav_to_freq.reporting.sections.sweep import add_section_sweep, render_sweep_figures
+from wav_to_freq.reporting.writers.pdf import md_to_pdf
+from wav_to_freq.utils.paths import ensure_dir
+
+
+@dataclass(frozen=True)
+class SweepReportArtifacts:
+    results_csv: Path
+    summary_csv: Path
+    report_md: Path
+    figures: dict[str, Path]
+    report_pdf: Path | None = None
+
+
+def write_sweep_report(
+    *,
+    sweep: SweepResult,
+    out_dir: str | Path,
+    title: str = "Parameter sweep",
+    export_pdf: bool = True,
+) -> SweepReportArtifacts:
+    """
+    Create sweep artifacts:
+      out_dir/
+        sweep_results.csv   (tidy: one row per hit and grid point)
+        sweep_summary.csv   (one row per grid point)
+        sweep_report.md
+        sweep_report.pdf (optional; requires pandoc by default)
+        figures/
+          sweep_zeta_median.png
+          sweep_accepted_fraction.png
+    """
+    out_dir = ensure_dir(Path(out_dir))
+    fig_dir = ensure_dir(out_dir / "figures")
+
+    results_csv = sweep.write_csv(out_dir / "sweep_results.csv")
+    summary_csv = sweep.write_summary_csv(out_dir / "sweep_summary.csv")
+    figures = render_sweep_figures(sweep, fig_dir)
+
+    mdd = MarkdownDoc()
+    add_section_sweep(mdd, sweep=sweep, title=title, figures=figures, out_dir=out_dir)
+    md_path = out_dir / "sweep_report.md"
+    md_path.write_text(mdd.to_markdown(), encoding="utf-8")
+
+    pdf_path: Path | None = None
+    if export_pdf:
+        pdf_path = md_to_pdf(md_path, root_dir=out_dir, title=title).pdf_path
+
+    return SweepReportArtifacts(
+        results_csv=results_csv,
+        summary_csv=summary_csv,
+        report_md=md_path,
+        figures=figures,
+        report_pdf=pdf_path,
+    )
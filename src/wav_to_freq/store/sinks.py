@@ -0,0 +1,205 @@
+# src/wav_to_freq/store/sinks.py
+"""
+Streaming per-hit result sinks.
+
+A sink appends each HitModalResult as soon as it is computed (flush + fsync
+per line), so a crash at hit 180 of 200 keeps the first 179 rows and other
+tools can tail the file while the run progresses.
+
+Resume: reopening an existing sink file reads back the rows already written
+(`sink.resumed`, keyed by hit_id), drops a torn last line left by a crash and
+continues appending. A sidecar `<file>.meta.json` stores a fingerprint of the
+analysis parameters; if it differs, the old rows are discarded instead of
+being mixed with results computed under other settings.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import math
+import os
+from abc import ABC, abstractmethod
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Mapping
+
+from wav_to_freq.domain.results import FIELDS
+from wav_to_freq.domain.types import HitModalResult
+
+_INT_FIELDS = ("hit_id", "hit_index")
+_OPTIONAL_FIELDS = ("reject_reason", "fit_t0_s", "fit_t1_s")
+
+
+class ResultSink(ABC):
+    """Line-oriented append-only sink. Subclasses define the line format."""
+
+    suffix = ""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        params: Mapping[str, Any] | None = None,
+        resume: bool = True,
+        fsync: bool = True,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fsync = fsync
+        # rows read back from the file on open (not the ones written since)
+        self.resumed: dict[int, HitModalResult] = {}
+
+        meta_path = self.path.with_name(self.path.name + ".meta.json")
+        meta = {"format": self.suffix, "params": dict(params or {})}
+        meta_text = json.dumps(meta, sort_keys=True, default=str)
+        same_params = meta_path.exists() and meta_path.read_text(encoding="utf-8") == meta_text
+
+        if resume and same_params and self.path.exists():
+            self.resumed = self._recover()
+        else:
+            self.path.write_text("", encoding="utf-8")
+            _write_atomic(meta_path, meta_text)
+
+        self._f = self.path.open("a", encoding="utf-8", newline="")
+        if self._f.tell() == 0:
+            header = self._header()
+            if header is not None:
+                self._append(header)
+
+    # -----------------------
+    # Format hooks
+    # -----------------------
+
+    def _header(self) -> str | None:
+        return None
+
+    @abstractmethod
+    def _encode(self, result: HitModalResult) -> str: ...
+
+    @abstractmethod
+    def _decode(self, line: str) -> HitModalResult: ...
+
+    # -----------------------
+    # Public API
+    # -----------------------
+
+    def write(self, result: HitModalResult) -> None:
+        self._append(self._encode(result))
+
+    def close(self) -> None:
+        if not self._f.closed:
+            self._f.close()
+
+    def __enter__(self) -> ResultSink:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # -----------------------
+    # Internals
+    # -----------------------
+
+    def _append(self, line: str) -> None:
+        self._f.write(line + "\n")
+        self._f.flush()
+        if self._fsync:
+            os.fsync(self._f.fileno())
+
+    def _recover(self) -> dict[int, HitModalResult]:
+        """Read complete rows back and cut a torn trailing line, if any."""
+        raw = self.path.read_bytes()
+        end = raw.rfind(b"\n") + 1
+        if end < len(raw):
+            with self.path.open("r+b") as f:
+                f.truncate(end)
+
+        lines = raw[:end].decode("utf-8").splitlines()
+        if self._header() is not None:
+            if not lines or lines[0] != self._header():
+                self.path.write_text("", encoding="utf-8")
+                return {}
+            lines = lines[1:]
+
+        done: dict[int, HitModalResult] = {}
+        for line in lines:
+            if line.strip():
+                r = self._decode(line)
+                done[int(r.hit_id)] = r
+        return done
+
+
+class CsvResultSink(ResultSink):
+    """Same columns and cell format as modal_results.csv."""
+
+    suffix = ".csv"
+
+    def _header(self) -> str | None:
+        return ",".join(FIELDS)
+
+    def _encode(self, result: HitModalResult) -> str:
+        buf = io.StringIO()
+        csv.writer(buf, lineterminator="").writerow(
+            ["" if v is None else v for v in asdict(result).values()]
+        )
+        return buf.getvalue()
+
+    def _decode(self, line: str) -> HitModalResult:
+        cells = next(csv.reader([line]))
+        values: dict[str, Any] = {}
+        for k, cell in zip(FIELDS, cells):
+            if k in _INT_FIELDS:
+                values[k] = int(cell)
+            elif k == "reject_reason":
+                values[k] = cell or None
+            elif cell == "" and k in _OPTIONAL_FIELDS:
+                values[k] = None
+            else:
+                values[k] = float(cell)
+        return HitModalResult(**values)
+
+
+class JsonlResultSink(ResultSink):
+    """One JSON object per hit; NaN is written as null (strict JSON)."""
+
+    suffix = ".jsonl"
+
+    def _encode(self, result: HitModalResult) -> str:
+        row = {
+            k: (None if isinstance(v, float) and math.isnan(v) else v)
+            for k, v in asdict(result).items()
+        }
+        return json.dumps(row, allow_nan=False)
+
+    def _decode(self, line: str) -> HitModalResult:
+        row = json.loads(line)
+        values: dict[str, Any] = {}
+        for k in FIELDS:
+            v = row.get(k)
+            if v is None and k not in _OPTIONAL_FIELDS:
+                v = float("nan")
+            values[k] = v
+        return HitModalResult(**values)
+
+
+def open_result_sink(
+    path: str | Path,
+    *,
+    params: Mapping[str, Any] | None = None,
+    resume: bool = True,
+    fsync: bool = True,
+) -> ResultSink:
+    """Pick the sink from the file suffix (.csv or .jsonl)."""
+    suffix = Path(path).suffix.lower()
+    for cls in (CsvResultSink, JsonlResultSink):
+        if suffix == cls.suffix:
+            return cls(path, params=params, resume=resume, fsync=fsync)
+    raise ValueError(f"Unsupported result sink suffix {suffix!r} (use .csv or .jsonl)")
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
@@ -0,0 +1,346 @@
+# src/wav_to_freq/store/sqlite.py
+"""
+Survey-scale results store (SQLite, stdlib only).
+
+Every analyzed recording becomes one row in `runs` (WAV hash, parameters,
+preset, hammer channel, autodetect scores) plus one row per hit in `hits`
+and one row per pipeline stage in `stage_timings`. The database runs in WAL
+mode so a reader (notebook, dashboard) can query while a run is inserted.
+
+Indexes cover the usual survey questions:
+  - runs by structure and recording date,
+  - hits by run and by fn.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Mapping
+
+import numpy as np
+
+from wav_to_freq.domain.results import FIELDS, ResultTable
+from wav_to_freq.domain.types import AutoDetectInfo
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    structure       TEXT,
+    recorded_at     TEXT NOT NULL,
+    processed_at    TEXT NOT NULL,
+    wav_path        TEXT NOT NULL,
+    wav_sha256      TEXT NOT NULL,
+    fs              REAL NOT NULL,
+    hammer_channel  TEXT,
+    preset          TEXT,
+    params_json     TEXT NOT NULL,
+    autodetect_json TEXT,
+    n_hits          INTEGER NOT NULL,
+    n_accepted      INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_structure_date ON runs(structure, recorded_at);
+CREATE INDEX IF NOT EXISTS idx_runs_date ON runs(recorded_at);
+CREATE INDEX IF NOT EXISTS idx_runs_sha ON runs(wav_sha256);
+
+CREATE TABLE IF NOT EXISTS hits (
+    run_id        INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    hit_id        INTEGER NOT NULL,
+    hit_index     INTEGER NOT NULL,
+    t0_s          REAL,
+    t1_s          REAL,
+    fn_hz         REAL,
+    zeta          REAL,
+    snr_db        REAL,
+    env_fit_r2    REAL,
+    env_log_c     REAL,
+    env_log_m     REAL,
+    reject_reason TEXT,
+    fit_t0_s      REAL,
+    fit_t1_s      REAL,
+    PRIMARY KEY (run_id, hit_id)
+);
+CREATE INDEX IF NOT EXISTS idx_hits_fn ON hits(fn_hz);
+
+CREATE TABLE IF NOT EXISTS stage_timings (
+    run_id  INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    stage   TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    PRIMARY KEY (run_id, stage)
+);
+"""
+
+
+@dataclass(frozen=True)
+class RunRecord:
+    run_id: int
+    structure: str | None
+    recorded_at: str
+    processed_at: str
+    wav_path: str
+    wav_sha256: str
+    fs: float
+    hammer_channel: str | None
+    preset: str | None
+    params: dict[str, Any]
+    autodetect: dict[str, Any] | None
+    n_hits: int
+    n_accepted: int
+
+
+@dataclass(frozen=True)
+class DriftPoint:
+    run_id: int
+    recorded_at: str
+    n_accepted: int
+    fn_mean_hz: float | None
+    zeta_mean: float | None
+
+
+def file_sha256(path: str | Path, *, chunk_bytes: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        while chunk := f.read(chunk_bytes):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _iso(dt: datetime) -> str:
+    if dt.tzinfo is None:
+        dt = dt.astimezone()
+    return dt.astimezone(timezone.utc).isoformat(timespec="seconds")
+
+
+class ResultsDb:
+    """
+    Thin wrapper over one SQLite file.
+
+    Usage:
+        with ResultsDb("survey.sqlite") as db:
+            run_id = db.record_run(results=table, wav_path=wav, fs=fs, params={...})
+            drift = db.fn_drift("tracker-12", since=datetime(2026, 1, 1))
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._con = sqlite3.connect(str(self.path), timeout=30.0)
+        self._con.execute("PRAGMA journal_mode=WAL")
+        self._con.execute("PRAGMA synchronous=NORMAL")
+        self._con.execute("PRAGMA foreign_keys=ON")
+        with self._con:
+            self._con.executescript(_SCHEMA)
+            self._con.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        self._con.close()
+
+    def __enter__(self) -> ResultsDb:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # -----------------------
+    # Insert
+    # -----------------------
+
+    def record_run(
+        self,
+        *,
+        results: ResultTable,
+        wav_path: str | Path,
+        fs: float,
+        params: Mapping[str, Any],
+        structure: str | None = None,
+        preset: str | None = None,
+        hammer_channel: str | None = None,
+        autodetect: AutoDetectInfo | None = None,
+        timings: Mapping[str, float] | None = None,
+        recorded_at: datetime | None = None,
+        wav_sha256: str | None = None,
+    ) -> int:
+        """
+        Insert one run, its hits and stage timings in a single transaction.
+        recorded_at defaults to the WAV modification time.
+        """
+        wav_path = Path(wav_path)
+        if recorded_at is None:
+            recorded_at = datetime.fromtimestamp(wav_path.stat().st_mtime)
+        if wav_sha256 is None:
+            wav_sha256 = file_sha256(wav_path)
+
+        autodetect_json = None
+        if autodetect is not None:
+            autodetect_json = json.dumps(
+                {
+                    "method": autodetect.method,
+                    "score_left": autodetect.score_left,
+                    "score_right": autodetect.score_right,
+                    "picked": autodetect.picked.value,
+                }
+            )
+
+        with self._con:
+            cur = self._con.execute(
+                "INSERT INTO runs (structure, recorded_at, processed_at, wav_path, wav_sha256,"
+                " fs, hammer_channel, preset, params_json, autodetect_json, n_hits, n_accepted)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    structure,
+                    _iso(recorded_at),
+                    _iso(datetime.now(timezone.utc)),
+                    str(wav_path),
+                    wav_sha256,
+                    float(fs),
+                    hammer_channel,
+                    preset,
+                    json.dumps(dict(params), sort_keys=True, default=str),
+                    autodetect_json,
+                    len(results),
+                    int(np.sum(results.accepted_mask)),
+                ),
+            )
+            run_id = int(cur.lastrowid or 0)
+
+            cols = [_sql_values(results, k) for k in FIELDS]
+            self._con.executemany(
+                f"INSERT INTO hits (run_id, {', '.join(FIELDS)})"
+                f" VALUES (?, {', '.join('?' * len(FIELDS))})",
+                ((run_id, *row) for row in zip(*cols)),
+            )
+            if timings:
+                self._con.executemany(
+                    "INSERT INTO stage_timings (run_id, stage, seconds) VALUES (?, ?, ?)",
+                    ((run_id, k, float(v)) for k, v in timings.items()),
+                )
+        return run_id
+
+    # -----------------------
+    # Query
+    # -----------------------
+
+    def runs(
+        self,
+        *,
+        structure: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[RunRecord]:
+        where, args = _run_filters(structure, since, until)
+        rows = self._con.execute(
+            "SELECT run_id, structure, recorded_at, processed_at, wav_path, wav_sha256, fs,"
+            " hammer_channel, preset, params_json, autodetect_json, n_hits, n_accepted"
+            f" FROM runs {where} ORDER BY recorded_at",
+            args,
+        ).fetchall()
+        return [
+            RunRecord(
+                run_id=r[0],
+                structure=r[1],
+                recorded_at=r[2],
+                processed_at=r[3],
+                wav_path=r[4],
+                wav_sha256=r[5],
+                fs=r[6],
+                hammer_channel=r[7],
+                preset=r[8],
+                params=json.loads(r[9]),
+                autodetect=json.loads(r[10]) if r[10] else None,
+                n_hits=r[11],
+                n_accepted=r[12],
+            )
+            for r in rows
+        ]
+
+    def hits(
+        self,
+        *,
+        structure: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        fn_min_hz: float | None = None,
+        fn_max_hz: float | None = None,
+        accepted_only: bool = True,
+    ) -> ResultTable:
+        """Hits matching the filters, as a ResultTable (hit_id is per run)."""
+        where, args = _run_filters(structure, since, until, prefix="r.")
+        clauses = [where[len("WHERE ") :]] if where else []
+        if fn_min_hz is not None:
+            clauses.append("h.fn_hz >= ?")
+            args.append(float(fn_min_hz))
+        if fn_max_hz is not None:
+            clauses.append("h.fn_hz <= ?")
+            args.append(float(fn_max_hz))
+        if accepted_only:
+            clauses.append("h.reject_reason IS NULL")
+        sql_where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        rows = self._con.execute(
+            f"SELECT {', '.join('h.' + k for k in FIELDS)} FROM hits h"
+            f" JOIN runs r ON r.run_id = h.run_id {sql_where}"
+            " ORDER BY r.recorded_at, h.hit_id",
+            args,
+        ).fetchall()
+        return ResultTable.from_values({k: [r[j] for r in rows] for j, k in enumerate(FIELDS)})
+
+    def stage_timings(self, run_id: int) -> dict[str, float]:
+        rows = self._con.execute(
+            "SELECT stage, seconds FROM stage_timings WHERE run_id = ?", (int(run_id),)
+        ).fetchall()
+        return {str(k): float(v) for k, v in rows}
+
+    def fn_drift(
+        self,
+        structure: str,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[DriftPoint]:
+        """Per-run mean fn / zeta of accepted hits for one structure, oldest first."""
+        where, args = _run_filters(structure, since, until, prefix="r.")
+        rows = self._con.execute(
+            "SELECT r.run_id, r.recorded_at, COUNT(h.hit_id), AVG(h.fn_hz), AVG(h.zeta)"
+            " FROM runs r LEFT JOIN hits h"
+            " ON h.run_id = r.run_id AND h.reject_reason IS NULL"
+            f" {where} GROUP BY r.run_id ORDER BY r.recorded_at",
+            args,
+        ).fetchall()
+        return [
+            DriftPoint(
+                run_id=r[0], recorded_at=r[1], n_accepted=r[2], fn_mean_hz=r[3], zeta_mean=r[4]
+            )
+            for r in rows
+        ]
+
+
+def _sql_values(results: ResultTable, name: str) -> list[Any]:
+    """Column values with SQL NULL for every missing value (NaN included)."""
+    return [None if isinstance(v, float) and v != v else v for v in results.values(name)]
+
+
+def _run_filters(
+    structure: str | None,
+    since: datetime | None,
+    until: datetime | None,
+    *,
+    prefix: str = "",
+) -> tuple[str, list[Any]]:
+    clauses: list[str] = []
+    args: list[Any] = []
+    if structure is not None:
+        clauses.append(f"{prefix}structure = ?")
+        args.append(structure)
+    if since is not None:
+        clauses.append(f"{prefix}recorded_at >= ?")
+        args.append(_iso(since))
+    if until is not None:
+        clauses.append(f"{prefix}recorded_at < ?")
+        args.append(_iso(until))
+    return (f"WHERE {' AND '.join(clauses)}" if clauses else ""), args
@@ -5,19 +5,24 @@ import os
 os.environ["MPLBACKEND"] = "Agg"
 
 import json
-import re
 import shutil
 from dataclasses import dataclass, asdict
 from pathlib import Path
+from time import perf_counter
 from typing import cast
 
 from textual.app import App, ComposeResult
 from textual.containers import VerticalScroll
-from textual.widgets import Button, Footer, Header, Input, Select, Static
+from textual.widgets import Button, Footer, Header, Input, ProgressBar, Select, Static
 
-from wav_to_freq.domain.enums import StereoChannel
+from wav_to_freq.analysis.preview import HitPreview
+from wav_to_freq.domain.enums import ProgressKind, StereoChannel
+from wav_to_freq.domain.progress import CancelToken, ProgressEvent, RunCancelled
+from wav_to_freq.io.hit_detection import DetectionEnvelope, compute_detection_envelope
+from wav_to_freq.io.wav_reader import find_latest_audio, load_stereo_wav
 from wav_to_freq.pipeline import run_full_report
 from wav_to_freq.tui_help import HelpScreen
+from wav_to_freq.utils.paths import make_unique_dir, move_into_run_dir, sanitize_dirname
 
 
 # ----------------------------
@@ -35,6 +40,10 @@ class UiConfig:
     hammer_channel: str = "auto"  # auto|left|right
     preset: str = "structures"
 
+    # optional survey database (SQLite); empty = disabled
+    results_db: str = ""
+    structure: str = ""
+
     # basic
     fmin_hz: float = 0.5
     fmax_hz: float = 50.0
@@ -108,36 +117,20 @@ PRESETS: dict[str, dict[str, float]] = {
     ),
 }
 
-
-# ----------------------------
-# WAV selection + folder naming
-# ----------------------------
-
-def find_latest_wav(input_dir: Path) -> Path | None:
-    if not input_dir.exists() or not input_dir.is_dir():
-        return None
-    wavs = list(input_dir.glob("*.wav")) + list(input_dir.glob("*.WAV"))
-    if not wavs:
-        return None
-    return max(wavs, key=lambda p: p.stat().st_mtime)
-
-
-def _sanitize_dirname(name: str) -> str:
-    name = name.strip()
-    name = re.sub(r"[^\w\-\. ]+", "_", name)
-    name = re.sub(r"\s+", " ", name)
-    return name.replace(" ", "_") or "untitled"
-
-
-def _make_unique_dir(base: Path) -> Path:
-    if not base.exists():
-        return base
-    i = 2
-    while True:
-        candidate = base.parent / f"{base.name}_{i}"
-        if not candidate.exists():
-            return candidate
-        i += 1
+# fields that only change the fit of already extracted hits (detection fields need a reload)
+_FIT_PREVIEW_INPUTS = frozenset({
+    "fmin_hz",
+    "fmax_hz",
+    "settle_s",
+    "ring_s_adv",
+    "transient_s",
+    "established_min_s",
+    "established_r2_min",
+    "fit_max_s",
+    "noise_tail_s",
+    "noise_mult",
+    "preview_hit",
+})
 
 
 # ----------------------------
@@ -162,16 +155,34 @@ class WavToFreqApp(App):
         self._cfg_path = _default_config_path()
         self._cfg = UiConfig.load(self._cfg_path)
 
+        # cached hammer detection envelope for the live hit-count preview
+        self._det_env: DetectionEnvelope | None = None
+        self._det_env_key: tuple[str, float, str] | None = None
+
+        # resident hit windows for the single-hit fit preview
+        self._fit_preview: HitPreview | None = None
+        self._fit_preview_name = ""
+
+        # current run (None when idle) and its streamed progress lines
+        self._run_cancel: CancelToken | None = None
+        self._stage_lines: list[str] = []
+        self._hit_lines: list[str] = []
+
     def compose(self) -> ComposeResult:
         yield Header()
 
         with VerticalScroll(id="main"):
-            yield Static("Input directory (newest .wav is selected):", classes="label")
+            yield Static("Input directory (newest .wav/.flac/.ogg is selected):", classes="label")
             yield Input(value=self._cfg.input_dir, placeholder="~/path/to/input_dir", id="input_dir")
 
             yield Static("Output directory (each run makes a subfolder):", classes="label")
             yield Input(value=self._cfg.output_dir, placeholder="~/path/to/output_dir", id="output_dir")
 
+            yield Static("Results database (optional, SQLite file shared across runs):", classes="label")
+            yield Input(value=self._cfg.results_db, placeholder="~/surveys/results.sqlite", id="results_db")
+            yield Static("Structure id (stored with the run in the database):")
+            yield Input(value=self._cfg.structure, placeholder="e.g. tracker-12", id="structure")
+
             yield Static("Hammer channel:", classes="label")
             yield Select(
                 options=[("Auto-detect", "auto"), ("Left", "left"), ("Right", "right")],
@@ -207,6 +218,7 @@ class WavToFreqApp(App):
             yield Input(value=str(self._cfg.min_separation_s), id="min_separation_s")
             yield Static("threshold_sigma")
             yield Input(value=str(self._cfg.threshold_sigma), id="threshold_sigma")
+            yield Static("", id="hit_preview", markup=False)
 
             yield Static("Advanced — modal time window:", classes="label")
             yield Static("settle_s")
@@ -228,9 +240,18 @@ class WavToFreqApp(App):
             yield Static("noise_mult")
             yield Input(value=str(self._cfg.noise_mult), id="noise_mult")
 
+            yield Static("Single-hit fit preview (refits as the fields above change):", classes="label")
+            yield Button("Load hits for preview", id="preview_load")
+            yield Static("hit number")
+            yield Input(value="1", id="preview_hit")
+            yield Static("", id="fit_preview", markup=False)
+
             yield Static("", classes="label")
-            yield Button("Run (latest WAV)", id="run", variant="primary")
+            yield Button("Run (latest recording)", id="run", variant="primary")
+            yield Button("Cancel run", id="cancel", variant="error", disabled=True)
             yield Button("Help (h)", id="help_btn")
+            yield ProgressBar(id="run_progress", show_eta=False)
+            yield Static("", id="progress", markup=False)
             yield Static("", id="status", markup=False)
 
         yield Footer()
@@ -281,6 +302,8 @@ class WavToFreqApp(App):
 
         self._cfg.input_dir = input_dir_raw
         self._cfg.output_dir = output_dir_raw
+        self._cfg.results_db = self.query_one("#results_db", Input).value.strip()
+        self._cfg.structure = self.query_one("#structure", Input).value.strip()
         self._cfg.hammer_channel = cast(str, self.query_one("#hammer_channel", Select).value or "auto")
         self._cfg.preset = cast(str, self.query_one("#preset", Select).value or self._cfg.preset)
 
@@ -308,7 +331,167 @@ class WavToFreqApp(App):
         self._cfg.save(self._cfg_path)
         return input_dir, output_dir
 
+    # ---- live hit-count preview (cached detection envelope)
+    def on_mount(self) -> None:
+        self._refresh_detection_envelope()
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input.id in ("threshold_sigma", "min_separation_s"):
+            self._update_hit_preview()
+        elif event.input.id == "input_dir":
+            self._refresh_detection_envelope()
+        if event.input.id in _FIT_PREVIEW_INPUTS:
+            self._update_fit_preview()
+
+    def _envelope_key(self) -> tuple[str, float, str] | None:
+        input_dir = Path(self.query_one("#input_dir", Input).value.strip()).expanduser()
+        wav_path = find_latest_audio(input_dir)
+        if wav_path is None:
+            return None
+        channel = cast(str, self.query_one("#hammer_channel", Select).value or "auto")
+        return (str(wav_path), wav_path.stat().st_mtime, channel)
+
+    def _refresh_detection_envelope(self) -> None:
+        try:
+            key = self._envelope_key()
+        except OSError:
+            key = None
+
+        if key is None:
+            self._det_env = None
+            self._det_env_key = None
+            self._set_hit_preview("")
+            return
+        if key == self._det_env_key:
+            return
+
+        self._det_env_key = key
+        self._det_env = None
+        self._set_hit_preview("Hit preview: loading…")
+        hammer_channel = self._parse_hammer_channel()
+        self.run_worker(
+            lambda: self._envelope_worker(key, hammer_channel),
+            thread=True,
+            group="envelope",
+            exclusive=True,
+        )
+
+    def _envelope_worker(self, key: tuple[str, float, str], hammer_channel: StereoChannel) -> None:
+        try:
+            stereo = load_stereo_wav(key[0], hammer_channel=hammer_channel)
+            env = compute_detection_envelope(stereo.hammer, stereo.fs)
+        except Exception as exc:
+            self.call_from_thread(self._set_hit_preview, f"Hit preview unavailable: {exc!r}")
+            return
+        self.call_from_thread(self._set_detection_envelope, key, env)
+
+    def _set_detection_envelope(self, key: tuple[str, float, str], env: DetectionEnvelope) -> None:
+        if key != self._det_env_key:
+            return  # a newer file/channel was selected meanwhile
+        self._det_env = env
+        self._update_hit_preview()
+
+    def _update_hit_preview(self) -> None:
+        if self._det_env is None:
+            return
+        threshold_sigma = self._parse_float("threshold_sigma", default=self._cfg.threshold_sigma)
+        min_separation_s = self._parse_float("min_separation_s", default=self._cfg.min_separation_s)
+        hits, thr = self._det_env.detect(
+            threshold_sigma=threshold_sigma,
+            min_separation_s=min_separation_s,
+        )
+        name = Path(self._det_env_key[0]).name if self._det_env_key else ""
+        self._set_hit_preview(f"Hit preview: {len(hits)} hits in {name} (threshold={thr:.4g})")
+
+    def _set_hit_preview(self, msg: str) -> None:
+        self.query_one("#hit_preview", Static).update(msg)
+
+    # ---- single-hit fit preview (hit windows kept in memory, fit rerun per edit)
+    def _load_fit_preview(self) -> None:
+        input_dir = Path(self.query_one("#input_dir", Input).value.strip()).expanduser()
+        wav_path = find_latest_audio(input_dir) if input_dir.is_dir() else None
+        if wav_path is None:
+            self._set_fit_preview("Fit preview: no recording found in the input directory.")
+            return
+        self._set_fit_preview(f"Fit preview: loading hits of {wav_path.name}…")
+        kwargs = dict(
+            hammer_channel=self._parse_hammer_channel(),
+            pre_s=self._parse_float("pre_s", default=self._cfg.pre_s),
+            post_s=self._parse_float("post_s_adv", default=self._cfg.post_s),
+            min_separation_s=self._parse_float("min_separation_s", default=self._cfg.min_separation_s),
+            threshold_sigma=self._parse_float("threshold_sigma", default=self._cfg.threshold_sigma),
+        )
+        self.run_worker(
+            lambda: self._fit_preview_worker(wav_path, kwargs),
+            thread=True,
+            group="fit_preview",
+            exclusive=True,
+        )
+
+    def _fit_preview_worker(self, wav_path: Path, kwargs: dict) -> None:
+        try:
+            preview = HitPreview.load(wav_path, **kwargs)
+        except Exception as exc:
+            self.call_from_thread(self._set_fit_preview, f"Fit preview unavailable: {exc!r}")
+            return
+        self.call_from_thread(self._set_fit_preview_data, preview, wav_path.name)
+
+    def _set_fit_preview_data(self, preview: HitPreview, name: str) -> None:
+        self._fit_preview = preview
+        self._fit_preview_name = name
+        self._update_fit_preview()
+
+    def _update_fit_preview(self) -> None:
+        preview = self._fit_preview
+        if preview is None:
+            return
+        if len(preview) == 0:
+            self._set_fit_preview(f"Fit preview: no hits detected in {self._fit_preview_name}.")
+            return
+        raw = self.query_one("#preview_hit", Input).value.strip()
+        try:
+            i = min(max(int(raw), 1), len(preview)) - 1
+        except ValueError:
+            i = 0
+
+        t0 = perf_counter()
+        try:
+            r = preview.evaluate(
+                i,
+                settle_s=self._parse_float("settle_s", default=self._cfg.settle_s),
+                ring_s=self._parse_float("ring_s_adv", default=self._cfg.ring_s),
+                fmin_hz=self._parse_float("fmin_hz", default=self._cfg.fmin_hz),
+                fmax_hz=self._parse_float("fmax_hz", default=self._cfg.fmax_hz),
+                transient_s=self._parse_float("transient_s", default=self._cfg.transient_s),
+                established_min_s=self._parse_float("established_min_s", default=self._cfg.established_min_s),
+                established_r2_min=self._parse_float("established_r2_min", default=self._cfg.established_r2_min),
+                fit_max_s=self._parse_float("fit_max_s", default=self._cfg.fit_max_s),
+                noise_tail_s=self._parse_float("noise_tail_s", default=self._cfg.noise_tail_s),
+                noise_mult=self._parse_float("noise_mult", default=self._cfg.noise_mult),
+            )
+        except Exception as exc:
+            self._set_fit_preview(f"Fit preview: {exc!r}")
+            return
+        ms = (perf_counter() - t0) * 1000.0
+
+        lines = [
+            f"H{r.hit_id:03d} of {len(preview)} in {self._fit_preview_name}  ({ms:.0f} ms)",
+            f"fn={r.fn_hz:.2f} Hz  zeta={r.zeta:.5f}  R²={r.env_fit_r2:.3f}  SNR={r.snr_db:.1f} dB",
+        ]
+        if r.fit_t0_s is not None and r.fit_t1_s is not None:
+            lines.append(f"fit window {r.fit_t0_s:.3f}–{r.fit_t1_s:.3f} s")
+        if r.reject_reason:
+            lines.append(f"rejected: {r.reject_reason}")
+        self._set_fit_preview("\n".join(lines))
+
+    def _set_fit_preview(self, msg: str) -> None:
+        self.query_one("#fit_preview", Static).update(msg)
+
     def on_select_changed(self, event: Select.Changed) -> None:
+        if event.select.id == "hammer_channel":
+            self._refresh_detection_envelope()
+            return
+
         if event.select.id != "preset":
             return
 
@@ -352,7 +535,17 @@ class WavToFreqApp(App):
             self.action_help()
             return
 
-        if event.button.id != "run":
+        if event.button.id == "preview_load":
+            self._load_fit_preview()
+            return
+
+        if event.button.id == "cancel":
+            if self._run_cancel is not None:
+                self._run_cancel.cancel()
+                self._set_status("Cancelling… (stops at the next hit or stage)")
+            return
+
+        if event.button.id != "run" or self._run_cancel is not None:
             return
 
         input_dir, output_dir = self._read_and_persist()
@@ -363,18 +556,62 @@ class WavToFreqApp(App):
 
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        wav_path = find_latest_wav(input_dir)
+        wav_path = find_latest_audio(input_dir)
         if wav_path is None:
-            self._set_status("❌ No .wav files found in input directory.")
+            self._set_status("❌ No .wav/.flac/.ogg files found in input directory.")
             return
 
-        run_dir = _make_unique_dir(output_dir / _sanitize_dirname(wav_path.stem))
+        run_dir = make_unique_dir(output_dir / sanitize_dirname(wav_path.stem))
         run_dir.mkdir(parents=True, exist_ok=True)
 
+        cancel = CancelToken()
+        self._start_progress(cancel)
         self._set_status(f"Running…\nSelected: {wav_path}\nRun folder: {run_dir}\n")
-        self.run_worker(lambda: self._pipeline_worker(wav_path, run_dir), thread=True)
+        self.run_worker(lambda: self._pipeline_worker(wav_path, run_dir, cancel), thread=True)
+
+    # ---- run progress / cancel
+    def _start_progress(self, cancel: CancelToken) -> None:
+        self._run_cancel = cancel
+        self._stage_lines = []
+        self._hit_lines = []
+        self.query_one("#run", Button).disabled = True
+        self.query_one("#cancel", Button).disabled = False
+        self.query_one("#run_progress", ProgressBar).update(total=None, progress=0)
+        self.query_one("#progress", Static).update("")
+
+    def _finish_progress(self) -> None:
+        self._run_cancel = None
+        self.query_one("#run", Button).disabled = False
+        self.query_one("#cancel", Button).disabled = True
+
+    def _on_progress(self, event: ProgressEvent) -> None:
+        bar = self.query_one("#run_progress", ProgressBar)
+        if event.kind is ProgressKind.HITS_DETECTED:
+            # one step per analyzed hit and one per hit figure
+            bar.update(total=max(1, 2 * event.total), progress=0)
+        elif event.kind is ProgressKind.HIT_ANALYZED and event.result is not None:
+            r = event.result
+            line = f"H{r.hit_id:03d}  fn={r.fn_hz:9.3f} Hz  ζ={r.zeta:.5f}"
+            if r.reject_reason:
+                line += f"  (rejected: {r.reject_reason})"
+            self._hit_lines = (self._hit_lines + [line])[-12:]
+            bar.advance(1)
+        elif event.kind is ProgressKind.FIGURE_WRITTEN and event.index:
+            bar.advance(1)
+        elif event.kind is ProgressKind.STAGE_DONE:
+            self._stage_lines.append(f"✓ {event.stage} ({event.seconds or 0.0:.1f} s)")
+
+        self.query_one("#progress", Static).update(
+            "  ".join(self._stage_lines) + ("\n" if self._hit_lines else "") + "\n".join(self._hit_lines)
+        )
 
-    def _pipeline_worker(self, wav_path: Path, run_dir: Path) -> None:
+    def _pipeline_worker(self, wav_path: Path, run_dir: Path, cancel: CancelToken) -> None:
+        try:
+            self._run_pipeline(wav_path, run_dir, cancel)
+        finally:
+            self.call_from_thread(self._finish_progress)
+
+    def _run_pipeline(self, wav_path: Path, run_dir: Path, cancel: CancelToken) -> None:
         try:
             artifacts = run_full_report(
                 wav_path,
@@ -401,17 +638,28 @@ class WavToFreqApp(App):
 
                 title_preprocess="WAV preprocessing report",
                 title_modal="Modal report",
+
+                results_db=Path(self._cfg.results_db).expanduser() if self._cfg.results_db else None,
+                structure=self._cfg.structure or None,
+                preset=self._cfg.preset,
+
+                on_progress=lambda event: self.call_from_thread(self._on_progress, event),
+                cancel=cancel,
+            )
+        except RunCancelled:
+            # the run folder was created for this run only: drop the partial outputs
+            shutil.rmtree(run_dir, ignore_errors=True)
+            self.call_from_thread(
+                self._set_status,
+                f"⏹ Cancelled. Partial outputs removed; {wav_path.name} left in place.",
             )
+            return
         except Exception as exc:
             self.call_from_thread(self._set_status, f"❌ Failed: {exc!r}")
             return
 
-        dest_wav = run_dir / wav_path.name
-        if dest_wav.exists():
-            dest_wav = run_dir / f"{wav_path.stem}__treated{wav_path.suffix}"
-
         try:
-            shutil.move(str(wav_path), str(dest_wav))
+            dest_wav = move_into_run_dir(wav_path, run_dir)
         except Exception as exc:
             self.call_from_thread(
                 self._set_status,
@@ -431,6 +679,8 @@ class WavToFreqApp(App):
             f"Modal MD:      {artifacts.modal.report_md}\n"
             f"Modal CSV:     {artifacts.modal.report_csv}\n"
         )
+        if artifacts.run_id is not None:
+            msg += f"Database run:  #{artifacts.run_id} in {self._cfg.results_db}\n"
         self.call_from_thread(self._set_status, msg)
 
 
@@ -24,12 +24,15 @@ The app:
 
 ## Quick workflow
 
-1. Set **Input directory** (app picks newest `.wav` inside)
+1. Set **Input directory** (app picks newest `.wav`, `.flac` or `.ogg` inside)
 2. Set **Output directory**
 3. Choose a **Preset**
    - **Structures**: low frequency band, longer windows
    - **Xylophone**: higher band, longer ringing, more sensitive window tuning
 4. Press **Run**
+   - progress shows each finished stage and fn / ζ of every hit as it is analyzed
+   - **Cancel run** stops at the next hit or stage, deletes the run folder and
+     leaves the recording in the input directory
 
 Open the generated PDF reports to judge quality.
 
@@ -65,6 +68,8 @@ Minimum spacing between hits to avoid double-detection.
 
 ### threshold_sigma
 Hit detection sensitivity. Lower = more hits detected (and more false hits).
+The hit count for the newest WAV updates live under this field while you edit
+threshold_sigma or min_separation_s (the detection envelope is computed once).
 
 ### settle_s (s)
 Skips the first part of the response after impact (hammer contact/shock).
@@ -82,6 +87,13 @@ Maximum fit length after the chosen start.
 ### noise_tail_s / noise_mult
 Used to estimate noise floor from the tail and stop the fit before noise dominates.
 If you stop too early, reduce noise_mult or increase ring_s/post_s.
+
+### Single-hit fit preview
+Press **Load hits for preview** to detect and extract the hits of the newest
+recording once (using the current detection fields), then pick a **hit number**.
+Every edit of the band, settle_s, ring_s or damping-fit fields refits that hit
+immediately and shows fn, ζ, R², the fit window and the reject reason.
+Changing pre_s / post_s / detection fields needs another **Load**.
 """
 
 
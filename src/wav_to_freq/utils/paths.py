@@ -1,5 +1,37 @@
+import re
+import shutil
 from pathlib import Path
 
 def ensure_dir(path: Path) -> Path:
     path.mkdir(parents=True, exist_ok=True)
     return path
+
+
+def sanitize_dirname(name: str) -> str:
+    name = name.strip()
+    name = re.sub(r"[^\w\-\. ]+", "_", name)
+    name = re.sub(r"\s+", " ", name)
+    return name.replace(" ", "_") or "untitled"
+
+
+def make_unique_dir(base: Path) -> Path:
+    if not base.exists():
+        return base
+    i = 2
+    while True:
+        candidate = base.parent / f"{base.name}_{i}"
+        if not candidate.exists():
+            return candidate
+        i += 1
+
+
+def move_into_run_dir(path: Path, run_dir: Path) -> Path:
+    """
+    Move a processed recording into its run folder and return the new path.
+    If a file of that name is already there, the moved one gets a __treated suffix.
+    """
+    dest = run_dir / path.name
+    if dest.exists():
+        dest = run_dir / f"{path.stem}__treated{path.suffix}"
+    shutil.move(str(path), str(dest))
+    return dest